@@ -0,0 +1,273 @@
+"""
+Almacén persistente de mundos y temporadas en SQLite (módulo sqlite3 estándar).
+
+Guarda ligas, equipos y jugadores (identificados por código de equipo y por
+la clave legible de BaseDatos.jugadores, así que varias corridas sobre el
+mismo mundo comparten filas), y por cada temporada sus partidos de liga con
+resultado, las tablas finales, los campeones y las estadísticas de cada
+jugador. Una temporada se escribe con executemany dentro de una sola
+transacción. Índices: partidos por (temporada, liga), estadísticas por
+(jugador, temporada) y posiciones por (equipo, temporada).
+
+Simular temporadas de liga, guardarlas y consultar los goleadores históricos:
+    python almacen_sqlite.py --temporadas 200 --db historico.db
+    python simuladorcompleto.py --seed 42 --db historico.db
+"""
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+from base_datos import BaseDatos
+from estadisticas import COLUMNAS
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS ligas (
+    id INTEGER PRIMARY KEY,
+    nombre TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS equipos (
+    id INTEGER PRIMARY KEY,
+    codigo TEXT NOT NULL UNIQUE,
+    nombre TEXT NOT NULL,
+    liga_id INTEGER NOT NULL REFERENCES ligas(id)
+);
+CREATE TABLE IF NOT EXISTS jugadores (
+    id INTEGER PRIMARY KEY,
+    clave TEXT NOT NULL UNIQUE,
+    nombre TEXT NOT NULL,
+    posicion TEXT NOT NULL,
+    equipo_id INTEGER NOT NULL REFERENCES equipos(id)
+);
+CREATE TABLE IF NOT EXISTS temporadas (
+    id INTEGER PRIMARY KEY,
+    fecha TEXT NOT NULL DEFAULT (datetime('now')),
+    semilla INTEGER,
+    motor TEXT NOT NULL DEFAULT '',
+    descripcion TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS partidos (
+    id INTEGER PRIMARY KEY,
+    temporada_id INTEGER NOT NULL REFERENCES temporadas(id),
+    liga_id INTEGER NOT NULL REFERENCES ligas(id),
+    local_id INTEGER NOT NULL REFERENCES equipos(id),
+    visitante_id INTEGER NOT NULL REFERENCES equipos(id),
+    goles_local INTEGER,          -- NULL: fixture sin jugar
+    goles_visitante INTEGER
+);
+CREATE INDEX IF NOT EXISTS partidos_temporada_liga ON partidos (temporada_id, liga_id);
+CREATE TABLE IF NOT EXISTS posiciones (
+    temporada_id INTEGER NOT NULL REFERENCES temporadas(id),
+    liga_id INTEGER NOT NULL REFERENCES ligas(id),
+    equipo_id INTEGER NOT NULL REFERENCES equipos(id),
+    posicion INTEGER NOT NULL,
+    puntos INTEGER NOT NULL,
+    partidos INTEGER NOT NULL,
+    gf INTEGER NOT NULL,
+    gc INTEGER NOT NULL,
+    PRIMARY KEY (temporada_id, liga_id, posicion)
+);
+CREATE INDEX IF NOT EXISTS posiciones_equipo_temporada ON posiciones (equipo_id, temporada_id);
+CREATE TABLE IF NOT EXISTS campeones (
+    temporada_id INTEGER NOT NULL REFERENCES temporadas(id),
+    competicion TEXT NOT NULL,
+    equipo_id INTEGER NOT NULL REFERENCES equipos(id),
+    PRIMARY KEY (temporada_id, competicion)
+);
+CREATE TABLE IF NOT EXISTS estadisticas_jugador (
+    jugador_id INTEGER NOT NULL REFERENCES jugadores(id),
+    temporada_id INTEGER NOT NULL REFERENCES temporadas(id),
+    equipo_id INTEGER NOT NULL REFERENCES equipos(id),
+    goles INTEGER NOT NULL,
+    asistencias INTEGER NOT NULL,
+    partidos_jugados INTEGER NOT NULL,
+    minutos_jugados INTEGER NOT NULL,
+    tarjetas_amarillas INTEGER NOT NULL,
+    tarjetas_rojas INTEGER NOT NULL,
+    titulos_colectivos INTEGER NOT NULL,
+    PRIMARY KEY (jugador_id, temporada_id)
+) WITHOUT ROWID;
+"""
+
+# Partido de liga: (local, visitante, goles local, goles visitante); goles None si no se jugó
+PartidoLiga = Tuple[str, str, Optional[int], Optional[int]]
+
+class AlmacenSQLite:
+    """Mundo y temporadas simuladas en una base SQLite"""
+
+    def __init__(self, ruta: str = ":memory:"):
+        self.ruta = ruta
+        self.conexion = sqlite3.connect(ruta)
+        self.conexion.execute("PRAGMA foreign_keys = ON")
+        self.conexion.executescript(ESQUEMA)
+
+    def cerrar(self):
+        self.conexion.close()
+
+    def __enter__(self) -> "AlmacenSQLite":
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    def _guardar_mundo(self, base: BaseDatos) -> Tuple[Dict[str, int], Dict[str, int], List[int]]:
+        """
+        Inserta lo que falte del mundo y actualiza lo que cambió (equipos que
+        cambiaron de liga, jugadores transferidos); devuelve ids de ligas y
+        equipos por nombre/código e ids de jugadores por id
+        """
+        cursor = self.conexion.cursor()
+        cursor.executemany("INSERT OR IGNORE INTO ligas (nombre) VALUES (?)",
+                           ((liga,) for liga in base.obtener_ligas()))
+        ligas = dict(cursor.execute("SELECT nombre, id FROM ligas"))
+        cursor.executemany("INSERT INTO equipos (codigo, nombre, liga_id) VALUES (?, ?, ?) "
+                           "ON CONFLICT(codigo) DO UPDATE SET nombre = excluded.nombre, liga_id = excluded.liga_id",
+                           ((e.codigo, e.nombre, ligas[e.liga]) for e in base.equipos_por_id))
+        equipos = dict(cursor.execute("SELECT codigo, id FROM equipos"))
+
+        # base.jugadores se llena en orden de id: su clave k-ésima es la del jugador k
+        claves = list(base.jugadores)
+        cursor.executemany("INSERT INTO jugadores (clave, nombre, posicion, equipo_id) VALUES (?, ?, ?, ?) "
+                           "ON CONFLICT(clave) DO UPDATE SET nombre = excluded.nombre, posicion = excluded.posicion, "
+                           "equipo_id = excluded.equipo_id",
+                           ((clave, j.nombre, j.posicion, equipos[j.equipo])
+                            for clave, j in zip(claves, base.jugadores_por_id)))
+        ids_por_clave = dict(cursor.execute("SELECT clave, id FROM jugadores"))
+        return ligas, equipos, [ids_por_clave[clave] for clave in claves]
+
+    def guardar_temporada(self, base: BaseDatos, partidos_por_liga: Dict[str, List[PartidoLiga]],
+                          tablas: Dict[str, List[Tuple[str, Dict]]] = None, semilla: int = None,
+                          motor: str = "", descripcion: str = "") -> int:
+        """
+        Guarda una temporada en una sola transacción: partidos de liga, tablas
+        finales (formato de simular_liga_con_jugadores), campeones de base.campeones
+        y las estadísticas actuales de todos los jugadores. Devuelve el id de la temporada.
+        """
+        with self.conexion:
+            ligas, equipos, ids_jugadores = self._guardar_mundo(base)
+            cursor = self.conexion.cursor()
+            cursor.execute("INSERT INTO temporadas (semilla, motor, descripcion) VALUES (?, ?, ?)",
+                           (semilla, motor, descripcion))
+            temporada = cursor.lastrowid
+
+            cursor.executemany(
+                "INSERT INTO partidos (temporada_id, liga_id, local_id, visitante_id, goles_local, goles_visitante) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                ((temporada, ligas[liga], equipos[local], equipos[visitante], gol1, gol2)
+                 for liga, partidos in partidos_por_liga.items()
+                 for local, visitante, gol1, gol2 in partidos))
+
+            cursor.executemany(
+                "INSERT INTO posiciones (temporada_id, liga_id, equipo_id, posicion, puntos, partidos, gf, gc) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((temporada, ligas[liga], equipos[codigo], posicion, fila['puntos'], fila['partidos'],
+                  fila['gf'], fila['gc'])
+                 for liga, tabla in (tablas or {}).items()
+                 for posicion, (codigo, fila) in enumerate(tabla, 1)))
+
+            campeones = [(competicion, codigo) for competicion, codigo in base.campeones.items()
+                         if competicion != 'ligas' and codigo]
+            campeones += list(base.campeones['ligas'].items())
+            cursor.executemany(
+                "INSERT INTO campeones (temporada_id, competicion, equipo_id) VALUES (?, ?, ?)",
+                ((temporada, competicion, equipos[codigo]) for competicion, codigo in campeones))
+
+            # Directo de las columnas de la tabla de estadísticas, una fila por jugador
+            columnas = [base.estadisticas.columna(nombre) for nombre in COLUMNAS]
+            equipo_por_jugador = [equipos[j.equipo] for j in base.jugadores_por_id]
+            cursor.executemany(
+                f"INSERT INTO estadisticas_jugador (jugador_id, temporada_id, equipo_id, {', '.join(COLUMNAS)}) "
+                f"VALUES (?, ?, ?{', ?' * len(COLUMNAS)})",
+                ((jugador, temporada, equipo, *valores)
+                 for jugador, equipo, *valores in zip(ids_jugadores, equipo_por_jugador, *columnas)))
+        return temporada
+
+    def cantidad_temporadas(self) -> int:
+        return self.conexion.execute("SELECT COUNT(*) FROM temporadas").fetchone()[0]
+
+    def top_goleadores_historicos(self, limite: int = 10) -> List[Tuple[str, str, int, int]]:
+        """(jugador, código de equipo, goles, temporadas) sumando todas las temporadas guardadas"""
+        return self.conexion.execute("""
+            SELECT j.nombre, e.codigo, SUM(s.goles) AS goles, COUNT(*) AS temporadas
+            FROM estadisticas_jugador s
+            JOIN jugadores j ON j.id = s.jugador_id
+            JOIN equipos e ON e.id = j.equipo_id
+            GROUP BY s.jugador_id
+            ORDER BY goles DESC, s.jugador_id
+            LIMIT ?""", (limite,)).fetchall()
+
+    def tabla_temporada(self, temporada: int, liga: str) -> List[Tuple[int, str, int, int, int, int]]:
+        """(posición, código, puntos, partidos, gf, gc) de una liga en una temporada"""
+        return self.conexion.execute("""
+            SELECT p.posicion, e.codigo, p.puntos, p.partidos, p.gf, p.gc
+            FROM posiciones p
+            JOIN ligas l ON l.id = p.liga_id
+            JOIN equipos e ON e.id = p.equipo_id
+            WHERE p.temporada_id = ? AND l.nombre = ?
+            ORDER BY p.posicion""", (temporada, liga)).fetchall()
+
+    def historial_equipo(self, codigo: str) -> List[Tuple[int, int, int]]:
+        """(temporada, posición, puntos) de un equipo en cada temporada guardada"""
+        return self.conexion.execute("""
+            SELECT p.temporada_id, p.posicion, p.puntos
+            FROM posiciones p
+            JOIN equipos e ON e.id = p.equipo_id
+            WHERE e.codigo = ?
+            ORDER BY p.temporada_id""", (codigo,)).fetchall()
+
+    def titulos_por_equipo(self, competicion: str) -> List[Tuple[str, int]]:
+        """(código, títulos) de una competición ('champions', o el nombre de una liga)"""
+        return self.conexion.execute("""
+            SELECT e.codigo, COUNT(*) AS titulos
+            FROM campeones c
+            JOIN equipos e ON e.id = c.equipo_id
+            WHERE c.competicion = ?
+            GROUP BY c.equipo_id
+            ORDER BY titulos DESC, e.codigo""", (competicion,)).fetchall()
+
+if __name__ == "__main__":
+    import argparse
+    import contextlib
+    import io
+    import time
+
+    from base_datos import base_datos
+    from motores import motores_disponibles
+    from semillas import configurar_semilla
+    from simuladorcompleto import simular_liga_con_jugadores
+
+    parser = argparse.ArgumentParser(description="Simula temporadas de liga y las guarda en SQLite")
+    parser.add_argument("--temporadas", type=int, default=20, help="Cantidad de temporadas (default: 20)")
+    parser.add_argument("--db", default="historico.db", help="Archivo SQLite (default: historico.db)")
+    parser.add_argument("--motor", choices=motores_disponibles(), default="saltos",
+                        help="Motor de las ligas (default: saltos)")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de la primera temporada (default: 0)")
+    args = parser.parse_args()
+
+    inicial = base_datos.instantanea()
+    simular, guardar = 0.0, 0.0
+    with AlmacenSQLite(args.db) as almacen:
+        for numero in range(args.temporadas):
+            base_datos.restaurar(inicial)
+            configurar_semilla(args.seed + numero)
+            inicio = time.perf_counter()
+            partidos_por_liga, tablas = {}, {}
+            with contextlib.redirect_stdout(io.StringIO()):
+                for liga, equipos in base_datos.obtener_ligas().items():
+                    partidos_por_liga[liga] = []
+                    tablas[liga] = simular_liga_con_jugadores(liga, equipos, args.motor, partidos_por_liga[liga])
+            simular += time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            almacen.guardar_temporada(base_datos, partidos_por_liga, tablas, args.seed + numero, args.motor,
+                                      "solo ligas")
+            guardar += time.perf_counter() - inicio
+        base_datos.restaurar(inicial)
+
+        print(f"{args.temporadas} temporadas: simular {simular:.1f} s, guardar {guardar:.2f} s "
+              f"({guardar / args.temporadas * 1000:.0f} ms por temporada)")
+        inicio = time.perf_counter()
+        goleadores = almacen.top_goleadores_historicos(10)
+        consulta = time.perf_counter() - inicio
+        print(f"\nGoleadores históricos ({almacen.cantidad_temporadas()} temporadas en {args.db}, "
+              f"consulta {consulta * 1000:.1f} ms):")
+        for puesto, (nombre, equipo, goles, temporadas) in enumerate(goleadores, 1):
+            print(f"{puesto:>3}. {nombre:<25} {equipo.upper():<15} {goles:>5} goles en {temporadas} temporadas")
@@ -0,0 +1,120 @@
+"""
+Generador con bloques de bytes aleatorios precargados.
+
+random.randint y random.choice cuestan varios cientos de ns por llamada
+(pasan por randrange y _randbelow en Python), y el motor de referencia tira
+un dado de 200 caras por minuto. BufferAleatorio pide al generador de origen
+un bloque grande de bytes de una sola vez con getrandbits y entrega los dados
+de un partido entero con una comprensión sobre el bloque (muestreo por
+rechazo: exacto, sin sesgo). random() es directamente el del origen, que ya
+es una sola llamada en C; randint() y choice() se calculan a partir de él sin
+pasar por randrange. Expone la misma interfaz que random.Random, así que los
+motores lo reciben en el mismo parámetro rng.
+
+Sobre el generador global del módulo random el buffer dura un partido: los
+bytes que sobran se tiran, así que un random.seed() entre partidos (o un
+fork) se respeta igual que sin buffer.
+
+Medir el costo por llamada y por partido del motor de referencia, con los
+sorteos de antes (una llamada a random por minuto) y con el buffer:
+    python buffer_aleatorio.py
+"""
+import random as rm
+from typing import List, Sequence
+
+BLOQUE_POR_DEFECTO = 65536  # bytes, generador propio usado para muchos sorteos
+BLOQUE_PARTIDO = 256        # bytes, buffer de un partido: 90 dados caben
+
+class BufferAleatorio:
+    """Dados en bloque y sorteos sin randrange sobre un generador de origen"""
+    __slots__ = ("_origen", "_tamano", "_bytes", "_cursor", "random")
+
+    def __init__(self, origen: rm.Random = None, tamano_bloque: int = BLOQUE_POR_DEFECTO):
+        self._origen = origen or rm
+        self._tamano = tamano_bloque
+        self._bytes = b""
+        self._cursor = 0
+        self.random = self._origen.random
+
+    def _rellenar(self):
+        """Carga un bloque nuevo de bytes con una sola llamada a getrandbits"""
+        self._bytes = self._origen.getrandbits(8 * self._tamano).to_bytes(self._tamano, "little")
+        self._cursor = 0
+
+    def dados(self, cantidad: int, caras: int) -> List[int]:
+        """cantidad tiradas de un dado de caras (hasta 256), como randint(1, caras) repetido"""
+        limite = 256 - 256 % caras  # bytes aceptados: el resto rompería la uniformidad
+        resultado = []
+        while len(resultado) < cantidad:
+            falta = cantidad - len(resultado)
+            pedido = min(self._tamano, falta + falta // 2 + 8)
+            if self._cursor + pedido > len(self._bytes):
+                self._rellenar()
+            inicio = self._cursor
+            self._cursor += pedido
+            resultado += [b % caras + 1 for b in self._bytes[inicio:inicio + pedido] if b < limite]
+        del resultado[cantidad:]
+        return resultado
+
+    def randint(self, a: int, b: int) -> int:
+        """Entero en [a, b], como random.randint (sesgo menor que (b - a + 1) / 2**53)"""
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, secuencia: Sequence):
+        """Elemento al azar de una secuencia no vacía, como random.choice"""
+        return secuencia[int(self.random() * len(secuencia))]
+
+def buffer_para(rng: rm.Random = None) -> BufferAleatorio:
+    """
+    Buffer chico para un partido sobre su generador (el global del módulo
+    random si no se pasa ninguno); no guarda bytes entre partidos.
+    """
+    if isinstance(rng, BufferAleatorio):
+        return rng
+    return BufferAleatorio(rng or rm, BLOQUE_PARTIDO)
+
+if __name__ == "__main__":
+    import timeit
+
+    import buffer_aleatorio  # el módulo importado, cuya clase es la que reconoce buffer_para en los motores
+    from base_datos import base_datos
+    from motor_referencia import simular_partido_con_jugadores
+
+    buffer = BufferAleatorio(rm.Random(1))
+    lista = list(range(11))
+    numero = 200000
+    print(f"{'Llamada':<22} {'random':>10} {'buffer':>10}")
+    for nombre, repeticiones, directo, con_buffer in (
+            ("randint(1, 200) x 90", numero // 90, lambda: [rm.randint(1, 200) for _ in range(90)],
+             lambda: buffer.dados(90, 200)),
+            ("randint(0, 180)", numero, lambda: rm.randint(0, 180), lambda: buffer.randint(0, 180)),
+            ("choice(lista)", numero, lambda: rm.choice(lista), lambda: buffer.choice(lista))):
+        t1 = timeit.timeit(directo, number=repeticiones) / repeticiones * 1e9
+        t2 = timeit.timeit(con_buffer, number=repeticiones) / repeticiones * 1e9
+        print(f"{nombre:<22} {t1:>8.0f}ns {t2:>8.0f}ns")
+
+    class SinBuffer(buffer_aleatorio.BufferAleatorio):
+        """Los sorteos de antes del buffer: un random.randint por minuto, randint y choice del módulo"""
+        __slots__ = ()
+
+        def dados(self, cantidad: int, caras: int) -> List[int]:
+            randint = self._origen.randint
+            return [randint(1, caras) for _ in range(cantidad)]
+
+        def randint(self, a: int, b: int) -> int:
+            return self._origen.randint(a, b)
+
+        def choice(self, secuencia: Sequence):
+            return self._origen.choice(secuencia)
+
+    # Mismo partido y mismo generador global; solo cambia de dónde salen los sorteos
+    equipos = list(base_datos.obtener_ligas()["Premier League"])
+    partidos = 20000
+    tiempos = {}
+    for nombre, crear_rng in (("antes (random)", lambda: SinBuffer(rm)), ("con buffer", lambda: None)):
+        t = timeit.timeit(lambda: simular_partido_con_jugadores(equipos[0], equipos[1], eventos=False,
+                                                                rng=crear_rng()), number=partidos)
+        tiempos[nombre] = t / partidos * 1e6
+        print(f"Motor de referencia, {nombre:<15} {tiempos[nombre]:6.1f} µs por partido")
+    print(f"Ahorro por partido: {1 - tiempos['con buffer'] / tiempos['antes (random)']:.0%}")
+    base_datos.reset_estadisticas_temporada()
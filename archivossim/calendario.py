@@ -0,0 +1,123 @@
+"""
+Calendario de liga por jornadas y simulación jornada a jornada.
+
+generar_calendario arma un todos contra todos con el método del círculo: un
+equipo queda fijo y los demás rotan una posición por jornada. Con cantidad
+impar de equipos el lugar fijo es un descanso, así que en cada jornada
+descansa un equipo distinto y todos juegan la mitad de local en cada vuelta.
+Con cantidad par el fijo alterna local y visitante por jornada y el resto se
+reparte por posición, de modo que nadie tiene más de un partido de diferencia
+entre local y visitante. La segunda vuelta repite la primera invirtiendo
+las localías.
+
+simular_jornadas es un generador: simula una jornada (en un solo lote del
+motor), actualiza la tabla y entrega un ResultadoJornada con los partidos,
+los equipos que descansaron, la tabla hasta esa fecha y los cambios en las
+estadísticas de los jugadores de la liga. Quien lo consume puede mostrar la
+tabla en vivo, guardar un punto de control o cortar antes del final.
+
+Ver el calendario y la tabla fecha a fecha:
+    python calendario.py "Liga Uruguaya"
+"""
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from base_datos import base_datos
+from estadisticas import DeltaEstadisticas
+from tabla_posiciones import TablaPosiciones
+from motores import MOTOR_POR_DEFECTO, obtener_motor
+from semillas import generador
+
+# Una jornada: (local, visitante) por partido
+Jornada = List[Tuple[str, str]]
+
+def generar_calendario(equipos: Sequence[str], ida_y_vuelta: bool = True) -> List[Jornada]:
+    """Jornadas de un todos contra todos (método del círculo) entre los equipos dados"""
+    if len(equipos) < 2:
+        return []
+    # Con cantidad impar, el lugar fijo es el descanso
+    lugares: List[Optional[str]] = ([None] if len(equipos) % 2 else []) + list(equipos)
+    fijo, rotan = lugares[0], lugares[1:]
+    cantidad = len(lugares)
+
+    ida = []
+    for ronda in range(cantidad - 1):
+        orden = [fijo] + rotan
+        jornada = []
+        for k in range(cantidad // 2):
+            local, visitante = orden[k], orden[cantidad - 1 - k]
+            # El fijo alterna por ronda; el resto se invierte en las posiciones impares
+            if (ronda % 2 == 1) if k == 0 else (k % 2 == 1):
+                local, visitante = visitante, local
+            if local is not None and visitante is not None:
+                jornada.append((local, visitante))
+        ida.append(jornada)
+        rotan = rotan[-1:] + rotan[:-1]
+
+    if not ida_y_vuelta:
+        return ida
+    return ida + [[(visitante, local) for local, visitante in jornada] for jornada in ida]
+
+@dataclass
+class ResultadoJornada:
+    """Lo que entrega simular_jornadas después de cada jornada"""
+    numero: int                                   # desde 1
+    partidos: List[Tuple[str, str, int, int]]     # (local, visitante, goles local, goles visitante)
+    descansa: List[str]
+    tabla: List[Tuple[str, Dict]]                 # ordenada, como simular_liga_con_jugadores
+    estadisticas: Optional[DeltaEstadisticas]     # filas = ids de jugador con cambios (None sin deltas)
+
+def simular_jornadas(nombre_liga: str, equipos: Sequence[str], motor: str = MOTOR_POR_DEFECTO,
+                     calendario: List[Jornada] = None, tabla: TablaPosiciones = None,
+                     deltas: bool = True) -> Iterator[ResultadoJornada]:
+    """
+    Simula la liga jornada a jornada y entrega un ResultadoJornada por jornada.
+    Cada partido usa su generador de semillas.generador(liga, "liga", local,
+    visitante), así que con --seed el resultado no depende del calendario.
+    Con tabla (que se actualiza en el lugar) se continúa desde ella; sin deltas no se calculan los cambios
+    de estadísticas (se ahorra leer las filas de la liga dos veces por jornada).
+    """
+    equipos = list(equipos)
+    calendario = calendario if calendario is not None else generar_calendario(equipos)
+    tabla = tabla if tabla is not None else TablaPosiciones(equipos)
+    simular_fixtures = obtener_motor(motor).simular_fixtures
+    posicion = {codigo: i for i, codigo in enumerate(equipos)}
+    if tabla.equipos != equipos:
+        raise ValueError("La tabla tiene que ser de los mismos equipos, en el mismo orden")
+    filas = array('l', [jugador.id for codigo in equipos for jugador in base_datos.equipos[codigo].jugadores])
+    estadisticas = base_datos.estadisticas
+
+    for numero, jornada in enumerate(calendario, 1):
+        antes = estadisticas.valores_filas(filas) if deltas else None
+        fixtures = [(posicion[local], posicion[visitante]) for local, visitante in jornada]
+        generadores = [generador(nombre_liga, "liga", local, visitante) for local, visitante in jornada]
+        resultados = simular_fixtures(equipos, fixtures, eventos=False, generadores=generadores)
+
+        goles_locales = [resultado[0] for resultado in resultados]
+        goles_visitantes = [resultado[1] for resultado in resultados]
+        tabla.sumar_partidos([i for i, _ in fixtures], [j for _, j in fixtures], goles_locales, goles_visitantes)
+        partidos = [(local, visitante, goles_local, goles_visitante)
+                    for (local, visitante), goles_local, goles_visitante in zip(jornada, goles_locales, goles_visitantes)]
+
+        jugaron = {codigo for partido in jornada for codigo in partido}
+        yield ResultadoJornada(numero, partidos, [codigo for codigo in equipos if codigo not in jugaron],
+                               tabla.ordenada(), estadisticas.delta_desde(filas, antes) if deltas else None)
+
+if __name__ == "__main__":
+    import sys
+
+    from semillas import configurar_semilla
+
+    liga = sys.argv[1] if len(sys.argv) > 1 else "Liga Uruguaya"
+    equipos = base_datos.obtener_equipos_liga(liga)
+    if not equipos:
+        sys.exit(f"Liga desconocida: {liga} (disponibles: {', '.join(base_datos.obtener_ligas())})")
+    configurar_semilla(0)
+    for resultado in simular_jornadas(liga, equipos):
+        print(f"\nJornada {resultado.numero}" + (f" (descansa {', '.join(resultado.descansa)})"
+                                                 if resultado.descansa else ""))
+        print("  " + "  ".join(f"{l.upper()} {gl}-{gv} {v.upper()}" for l, v, gl, gv in resultado.partidos))
+        goles = sum(resultado.estadisticas.valores['goles'])
+        punteros = ", ".join(f"{c.upper()} {f['puntos']}" for c, f in resultado.tabla[:3])
+        print(f"  Goles: {goles}  Jugadores con cambios: {len(resultado.estadisticas)}  Arriba: {punteros}")
@@ -0,0 +1,229 @@
+"""
+Columnas de estadísticas en archivos binarios mapeados en memoria (mmap).
+
+Cada columna es un archivo con una cabecera de 32 bytes (mágico, código de
+tipo del módulo array, cantidad de filas, ancho de fila) seguida de los
+valores de ancho fijo. ColumnaMapeada la abre con mmap y expone los valores
+como un memoryview tipado: se indexa y se asigna igual que un array('q'),
+pero lo que no se toca no se lee del disco.
+
+Dos usos, para columnas de jugadores (TablaEstadisticas) y de equipos
+(TablaPosiciones: puntos, partidos y goles):
+  - tabla.mapear(directorio) pasa las columnas vivas a archivos; los
+    motores y sumar_partidos escriben en ellas sin cambios.
+  - HistorialEstadisticas guarda una fila por temporada (ancho = jugadores
+    o equipos) agregando al final del archivo, y los análisis leen una
+    temporada (fila) o la serie de un jugador o equipo (columna con paso)
+    sin cargar el resto. Con NumPy, numpy.frombuffer(columna.valores) da
+    una vista sin copia.
+
+Simular temporadas con las estadísticas mapeadas y consultar el historial:
+    python columnas_mmap.py --temporadas 50 --directorio historial
+"""
+import mmap
+import os
+import struct
+from array import array
+from typing import Dict, Sequence, Tuple
+
+from estadisticas import COLUMNAS, TIPO_COLUMNA
+
+MAGICO = b"COLMMAP1"
+_CABECERA = struct.Struct("<8s8sQQ")  # mágico, tipo, filas, ancho
+TAMANO_CABECERA = _CABECERA.size
+EXTENSION = ".col"
+
+def leer_cabecera(ruta: str) -> Tuple[str, int, int]:
+    """(tipo, filas, ancho) de un archivo de columna"""
+    with open(ruta, "rb") as f:
+        magico, tipo, filas, ancho = _CABECERA.unpack(f.read(TAMANO_CABECERA))
+    if magico != MAGICO:
+        raise ValueError(f"{ruta} no es un archivo de columna")
+    return tipo.rstrip(b"\0").decode("ascii"), filas, ancho
+
+def crear_columna(ruta: str, tipo: str = TIPO_COLUMNA, filas: int = 0, ancho: int = 1, datos=None):
+    """Crea (o reemplaza) el archivo; datos es cualquier buffer de filas * ancho valores del tipo"""
+    tamano_valor = array(tipo).itemsize
+    with open(ruta, "wb") as f:
+        f.write(_CABECERA.pack(MAGICO, tipo.encode("ascii"), filas, ancho))
+        if datos is not None:
+            if len(memoryview(datos).cast("B")) != filas * ancho * tamano_valor:
+                raise ValueError(f"Se esperaban {filas * ancho} valores de tipo {tipo}")
+            f.write(datos)
+        else:
+            f.truncate(TAMANO_CABECERA + filas * ancho * tamano_valor)
+
+def anexar_filas(ruta: str, datos, filas: int = 1):
+    """Agrega filas al final del archivo y actualiza la cabecera (los mapeos abiertos no las ven)"""
+    tipo, filas_actuales, ancho = leer_cabecera(ruta)
+    if len(memoryview(datos).cast("B")) != filas * ancho * array(tipo).itemsize:
+        raise ValueError(f"Se esperaban {filas * ancho} valores de tipo {tipo}")
+    with open(ruta, "r+b") as f:
+        f.seek(0, os.SEEK_END)
+        f.write(datos)
+        f.seek(0)
+        f.write(_CABECERA.pack(MAGICO, tipo.encode("ascii"), filas_actuales + filas, ancho))
+
+class ColumnaMapeada:
+    """Archivo de columna abierto con mmap; valores es un memoryview tipado de filas * ancho elementos"""
+
+    def __init__(self, ruta: str, escritura: bool = False):
+        self.ruta = ruta
+        self.tipo, self.filas, self.ancho = leer_cabecera(ruta)
+        tamano = self.filas * self.ancho * array(self.tipo).itemsize
+        self._archivo = open(ruta, "r+b" if escritura else "rb")
+        self._mapa = mmap.mmap(self._archivo.fileno(), TAMANO_CABECERA + tamano,
+                               access=mmap.ACCESS_WRITE if escritura else mmap.ACCESS_READ)
+        self.valores = memoryview(self._mapa)[TAMANO_CABECERA:].cast(self.tipo)
+
+    def fila(self, indice: int) -> memoryview:
+        """Los ancho valores de la fila (en el historial: una temporada)"""
+        return self.valores[indice * self.ancho:(indice + 1) * self.ancho]
+
+    def columna(self, indice: int) -> memoryview:
+        """El valor indice de cada fila (en el historial: un jugador en todas las temporadas)"""
+        return self.valores[indice::self.ancho]
+
+    def sincronizar(self):
+        """Baja a disco lo escrito (el sistema lo hace igual al cerrar)"""
+        self._mapa.flush()
+
+    def cerrar(self):
+        """Cierra el mapeo; las vistas obtenidas con fila() o columna() deben liberarse antes"""
+        self.valores.release()
+        self._mapa.close()
+        self._archivo.close()
+
+    def __enter__(self) -> "ColumnaMapeada":
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+class HistorialEstadisticas:
+    """
+    Estadísticas de cada temporada guardadas como filas de un archivo por
+    columna. Por defecto las de jugadores (TablaEstadisticas); con
+    columnas=COLUMNAS_TABLA y otro prefijo, las de equipos (una
+    TablaPosiciones de todos los equipos del mundo, fila = id de equipo).
+    """
+
+    def __init__(self, directorio: str, columnas: Sequence[str] = COLUMNAS, prefijo: str = "historial"):
+        self.directorio = directorio
+        self.columnas = tuple(columnas)
+        self.prefijo = prefijo
+        os.makedirs(directorio, exist_ok=True)
+
+    def ruta(self, columna: str) -> str:
+        return os.path.join(self.directorio, f"{self.prefijo}_{columna}{EXTENSION}")
+
+    def temporadas(self) -> int:
+        ruta = self.ruta(self.columnas[0])
+        return leer_cabecera(ruta)[1] if os.path.exists(ruta) else 0
+
+    def agregar_temporada(self, tabla) -> int:
+        """Agrega las columnas de la tabla como una fila nueva; devuelve su índice"""
+        for nombre in self.columnas:
+            valores = getattr(tabla, nombre)
+            ruta = self.ruta(nombre)
+            if not os.path.exists(ruta):
+                crear_columna(ruta, TIPO_COLUMNA, 0, len(valores))
+            elif leer_cabecera(ruta)[2] != len(valores):
+                raise ValueError(f"El historial tiene otro ancho que la tabla ({len(valores)} valores)")
+            anexar_filas(ruta, valores)
+        return self.temporadas() - 1
+
+    def abrir(self, columna: str) -> ColumnaMapeada:
+        """Columna del historial para lectura (fila(t) = temporada t, columna(id) = jugador o equipo id)"""
+        return ColumnaMapeada(self.ruta(columna))
+
+    def totales(self, columna: str) -> array:
+        """Suma de todas las temporadas por jugador (o equipo), recorriendo una temporada a la vez"""
+        with self.abrir(columna) as historial:
+            totales = array(TIPO_COLUMNA, bytes(8 * historial.ancho))
+            for temporada in range(historial.filas):
+                fila = historial.fila(temporada)
+                totales = array(TIPO_COLUMNA, map(int.__add__, totales, fila))
+                fila.release()
+        return totales
+
+def mapear_tabla(tabla, directorio: str, columnas: Sequence[str] = COLUMNAS) -> Dict[str, ColumnaMapeada]:
+    """
+    Escribe cada columna de la tabla (atributos array('q') del mismo largo) en
+    directorio/<columna>.col y la abre para escritura
+    """
+    os.makedirs(directorio, exist_ok=True)
+    mapeadas = {}
+    for nombre in columnas:
+        ruta = os.path.join(directorio, nombre + EXTENSION)
+        valores = getattr(tabla, nombre)
+        crear_columna(ruta, TIPO_COLUMNA, len(valores), 1, valores)
+        mapeadas[nombre] = ColumnaMapeada(ruta, escritura=True)
+    return mapeadas
+
+def abrir_columnas(directorio: str, escritura: bool = False,
+                   columnas: Sequence[str] = COLUMNAS) -> Dict[str, ColumnaMapeada]:
+    """Columnas ya escritas por mapear_tabla (por ejemplo desde una herramienta de análisis)"""
+    return {nombre: ColumnaMapeada(os.path.join(directorio, nombre + EXTENSION), escritura)
+            for nombre in columnas}
+
+if __name__ == "__main__":
+    import argparse
+    import contextlib
+    import io
+    import resource
+    import time
+
+    from base_datos import base_datos
+    from semillas import configurar_semilla
+    from simuladorcompleto import simular_liga_con_jugadores
+    from tabla_posiciones import COLUMNAS_TABLA, TablaPosiciones
+
+    parser = argparse.ArgumentParser(description="Temporadas de liga con estadísticas mapeadas en disco")
+    parser.add_argument("--temporadas", type=int, default=20, help="Cantidad de temporadas (default: 20)")
+    parser.add_argument("--directorio", default="historial", help="Directorio de columnas (default: historial)")
+    parser.add_argument("--motor", default="saltos", help="Motor de las ligas (default: saltos)")
+    args = parser.parse_args()
+
+    base_datos.mapear_estadisticas(os.path.join(args.directorio, "vivas"))
+    historial = HistorialEstadisticas(args.directorio)
+    # Puntos, partidos y goles de liga de todos los equipos (fila = id de equipo), también mapeados
+    equipos_mundo = TablaPosiciones([equipo.codigo for equipo in base_datos.equipos_por_id])
+    equipos_mundo.mapear(os.path.join(args.directorio, "vivas", "equipos"))
+    historial_equipos = HistorialEstadisticas(args.directorio, COLUMNAS_TABLA, "equipos")
+    inicial = base_datos.instantanea()
+    inicio = time.perf_counter()
+    for numero in range(args.temporadas):
+        base_datos.restaurar(inicial)
+        equipos_mundo.reiniciar()
+        configurar_semilla(numero)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for liga, equipos in base_datos.obtener_ligas().items():
+                partidos = []
+                simular_liga_con_jugadores(liga, equipos, args.motor, partidos)
+                equipos_mundo.sumar_resultados(partidos)
+        historial.agregar_temporada(base_datos.estadisticas)
+        historial_equipos.agregar_temporada(equipos_mundo)
+    print(f"{args.temporadas} temporadas en {time.perf_counter() - inicio:.1f} s; "
+          f"historial con {historial.temporadas()} temporadas en {args.directorio}/")
+
+    inicio = time.perf_counter()
+    goles = historial.totales("goles")
+    mejores = sorted(range(len(goles)), key=goles.__getitem__, reverse=True)[:5]
+    print(f"Goles históricos ({(time.perf_counter() - inicio) * 1000:.1f} ms):")
+    with historial.abrir("goles") as columna:
+        for id_jugador in mejores:
+            jugador = base_datos.obtener_jugador(id_jugador)
+            serie = columna.columna(id_jugador)
+            print(f"  {jugador.nombre:<20} {jugador.equipo.upper():<10} {goles[id_jugador]:>5}  "
+                  f"(últimas: {list(serie[-5:])})")
+            serie.release()
+    puntos = historial_equipos.totales("puntos")
+    print("Puntos de liga históricos:")
+    with historial_equipos.abrir("puntos") as columna:
+        for id_equipo in sorted(range(len(puntos)), key=puntos.__getitem__, reverse=True)[:5]:
+            serie = columna.columna(id_equipo)
+            print(f"  {base_datos.equipos_por_id[id_equipo].nombre:<30} {puntos[id_equipo]:>5}  "
+                  f"(últimas: {list(serie[-5:])})")
+            serie.release()
+    print(f"Memoria máxima: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
@@ -0,0 +1,271 @@
+"""
+Definiciones matemáticas de una liga jornada a jornada.
+
+Una zona es "terminar entre los k primeros" (título: k = 1, copas europeas:
+k = plazas, permanencia: k = equipos - descensos). Después de cada jornada
+SeguimientoDefiniciones dice qué equipos ya la aseguraron (terminan entre
+los k primeros pase lo que pase, aun perdiendo todos los desempates) y
+cuáles ya no pueden alcanzarla (aun ganando todos los desempates).
+
+Primero van las cotas: puntos actuales contra máximos posibles. Si no
+alcanzan, se refina con flujo máximo sobre los partidos pendientes entre los
+equipos que importan: los puntos de cada cruce tienen que ir a uno de sus dos
+equipos y cada equipo tiene un tope (o una necesidad) de puntos. Con 3
+puntos por victoria y 1 por empate decidir esto exactamente es NP-completo,
+así que el flujo es una relajación: para descartar a un equipo cada partido
+reparte como mínimo 2 puntos y para darle la zona a uno como máximo 3. Así
+nunca se anuncia nada falso; lo que no se puede probar (o necesitaría probar
+más de LIMITE_COMBINACIONES conjuntos de rivales) queda abierto hasta una
+jornada posterior.
+
+Es incremental: los partidos pendientes y los máximos se descuentan con los
+resultados de cada jornada, y lo ya definido no se vuelve a mirar (una zona
+asegurada o perdida no cambia con más resultados).
+
+Ver las fechas de definición de una liga simulada jornada a jornada:
+    python definiciones_matematicas.py "Premier League"
+"""
+from collections import Counter, deque
+from dataclasses import dataclass
+from itertools import combinations
+from math import comb
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from calendario import generar_calendario
+from tabla_posiciones import PUNTOS_EMPATE, PUNTOS_VICTORIA, TablaPosiciones
+
+ASEGURADA = "asegurada"
+PERDIDA = "perdida"
+# Conjuntos de rivales que se prueban con flujo por equipo y zona; más que eso queda para otra jornada
+LIMITE_COMBINACIONES = 64
+# Puntos que reparte un partido como mínimo (empate) y como máximo (victoria)
+_REPARTO_MINIMO = min(2 * PUNTOS_EMPATE, PUNTOS_VICTORIA)
+_REPARTO_MAXIMO = max(2 * PUNTOS_EMPATE, PUNTOS_VICTORIA)
+
+@dataclass(frozen=True)
+class Definicion:
+    """Un equipo que aseguró o perdió una zona"""
+    equipo: str
+    zona: str
+    estado: str     # ASEGURADA o PERDIDA
+    jornada: int    # la primera en que se pudo probar
+
+def _camino_aumento(origenes: Sequence[int], dado: List[List[int]], holgura: List[int]) -> Optional[List[int]]:
+    """Camino de equipos desde un origen hasta uno con holgura, pasando puntos de y a x si dado[y][x] > 0"""
+    previo = {origen: None for origen in origenes}
+    cola = deque(origenes)
+    while cola:
+        y = cola.popleft()
+        if holgura[y] > 0:
+            camino = [y]
+            while previo[camino[-1]] is not None:
+                camino.append(previo[camino[-1]])
+            return camino[::-1]
+        for x, puntos in enumerate(dado[y]):
+            if puntos > 0 and x not in previo:
+                previo[x] = y
+                cola.append(x)
+    return None
+
+def flujo_maximo(pares: Dict[Tuple[int, int], int], capacidad: Sequence[int]) -> int:
+    """
+    Máximo de puntos repartibles si el par (j, l) tiene pares[(j, l)] puntos
+    que van a j o a l y el equipo k recibe a lo sumo capacidad[k]. Es el flujo
+    máximo partidos -> equipos, resuelto sobre el grafo de equipos: reparto
+    voraz y después caminos de aumento que corren puntos de un equipo lleno a
+    su rival en ese par hasta llegar a uno con lugar.
+    """
+    n = len(capacidad)
+    holgura = list(capacidad)
+    dado = [[0] * n for _ in range(n)]  # dado[j][l]: puntos del par {j, l} acreditados a j
+    total = 0
+    for (j, l), puntos in pares.items():
+        for equipo, rival in ((j, l), (l, j)):
+            parte = min(puntos, holgura[equipo])
+            holgura[equipo] -= parte
+            dado[equipo][rival] += parte
+            puntos -= parte
+            total += parte
+        # Lo que no entró: correr puntos ya repartidos (si de un origen no hay camino, no lo habrá después)
+        while puntos > 0:
+            camino = _camino_aumento((j, l), dado, holgura)
+            if camino is None:
+                break
+            paso = min([puntos, holgura[camino[-1]]] + [dado[y][x] for y, x in zip(camino, camino[1:])])
+            inicio = camino[0]
+            dado[inicio][l if inicio == j else j] += paso
+            for y, x in zip(camino, camino[1:]):
+                dado[y][x] -= paso
+                dado[x][y] += paso
+            holgura[camino[-1]] -= paso
+            puntos -= paso
+            total += paso
+    return total
+
+class SeguimientoDefiniciones:
+    """Zonas aseguradas y perdidas de una liga, actualizadas jornada a jornada"""
+
+    def __init__(self, equipos: Sequence[str], zonas: Dict[str, int],
+                 pendientes: Sequence[Tuple[str, str]] = None, tabla: TablaPosiciones = None):
+        """
+        zonas: {nombre: k} (entre los k primeros). pendientes son los partidos
+        que faltan (por defecto el calendario entero de ida y vuelta) y tabla
+        los puntos de partida (se copia), por ejemplo los de TemporadaParcial.
+        """
+        self.equipos = list(equipos)
+        self.zonas = dict(zonas)
+        self.tabla = tabla.copiar() if tabla is not None else TablaPosiciones(self.equipos)
+        if self.tabla.equipos != self.equipos:
+            raise ValueError("La tabla tiene que ser de los mismos equipos, en el mismo orden")
+        indice = self.tabla.indice
+        n = len(self.equipos)
+        if pendientes is None:
+            pendientes = [cruce for jornada in generar_calendario(self.equipos) for cruce in jornada]
+        self.restantes = [0] * n
+        self.cruces = [[0] * n for _ in range(n)]  # partidos pendientes entre j y l (simétrica)
+        self._pendientes = Counter((indice[local], indice[visitante]) for local, visitante in pendientes)
+        for local, visitante in pendientes:
+            i, j = indice[local], indice[visitante]
+            self.restantes[i] += 1
+            self.restantes[j] += 1
+            self.cruces[i][j] += 1
+            self.cruces[j][i] += 1
+        self.jornada = 0
+        self.definiciones: Dict[Tuple[str, str], Definicion] = {}
+        self._abiertos = {zona: set(range(n)) for zona in self.zonas}
+        self.actualizar(0, [])
+
+    def actualizar(self, jornada: int, partidos: Sequence[Tuple[str, str, int, int]]) -> List[Definicion]:
+        """
+        Suma los resultados (local, visitante, goles, goles) y devuelve lo que
+        se definió con ellos. Si alguno no estaba pendiente (o viene dos veces)
+        lanza ValueError sin tocar nada.
+        """
+        indice = self.tabla.indice
+        jugados = Counter((indice[local], indice[visitante]) for local, visitante, _, _ in partidos)
+        for (i, j), veces in jugados.items():
+            if veces > self._pendientes[i, j]:
+                raise ValueError(f"{self.equipos[i]}-{self.equipos[j]} no estaba pendiente")
+        for (i, j), veces in jugados.items():
+            self._pendientes[i, j] -= veces
+            self.restantes[i] -= veces
+            self.restantes[j] -= veces
+            self.cruces[i][j] -= veces
+            self.cruces[j][i] -= veces
+        self.tabla.sumar_resultados(partidos)
+        self.jornada = jornada
+
+        puntos = self.tabla.puntos.tolist()
+        maximos = [p + PUNTOS_VICTORIA * r for p, r in zip(puntos, self.restantes)]
+        nuevas = []
+        for zona, k in self.zonas.items():
+            abiertos = self._abiertos[zona]
+            for i in sorted(abiertos):
+                if self._asegurada(i, k, puntos, maximos):
+                    estado = ASEGURADA
+                elif self._perdida(i, k, puntos, maximos):
+                    estado = PERDIDA
+                else:
+                    continue
+                abiertos.discard(i)
+                definicion = Definicion(self.equipos[i], zona, estado, jornada)
+                self.definiciones[(zona, self.equipos[i])] = definicion
+                nuevas.append(definicion)
+        return nuevas
+
+    def _perdida(self, i: int, k: int, puntos: List[int], maximos: List[int]) -> bool:
+        """Aun ganando todo, al menos k equipos terminan con más puntos que i"""
+        # Si i gana lo que le queda, sus rivales no suman contra él
+        techo = maximos[i]
+        arriba = [j for j in range(len(puntos)) if j != i and puntos[j] > techo]
+        if len(arriba) >= k:
+            return True
+        # Los que pueden pasarlo sin sumar contra i; los demás no lo pasan sumen lo que sumen
+        inciertos = [j for j in range(len(puntos)) if j != i and
+                     puntos[j] <= techo < maximos[j] - PUNTOS_VICTORIA * self.cruces[i][j]]
+        libres = k - 1 - len(arriba)
+        if len(inciertos) <= libres or comb(len(inciertos), libres) > LIMITE_COMBINACIONES:
+            return False
+        # Perdida si para toda elección de libres equipos que lo pasen, el resto no entra debajo del techo
+        for pasan in combinations(inciertos, libres):
+            debajo = [j for j in inciertos if j not in pasan]
+            pares = {(j, l): _REPARTO_MINIMO * self.cruces[j][l]
+                     for a, j in enumerate(debajo) for l in debajo[a + 1:] if self.cruces[j][l]}
+            capacidad = [0] * len(puntos)
+            for j in debajo:
+                capacidad[j] = techo - puntos[j]
+            if flujo_maximo(pares, capacidad) == sum(pares.values()):
+                return False
+        return True
+
+    def _asegurada(self, i: int, k: int, puntos: List[int], maximos: List[int]) -> bool:
+        """Aun perdiendo todo, menos de k equipos llegan a sus puntos"""
+        piso = puntos[i]
+        candidatos = [j for j in range(len(puntos)) if j != i and maximos[j] >= piso]
+        if len(candidatos) < k:
+            return True
+        ya = [j for j in candidatos if puntos[j] >= piso]
+        faltan = k - len(ya)
+        if faltan <= 0:
+            return False
+        resto = [j for j in candidatos if puntos[j] < piso]
+        if comb(len(resto), faltan) > LIMITE_COMBINACIONES:
+            return False
+        # Asegurada si ningún grupo de k candidatos puede llegar entero a sus puntos
+        for elegidos in combinations(resto, faltan):
+            capacidad = [0] * len(puntos)
+            for j in elegidos:
+                # Fuera de los elegidos nadie necesita puntos (i pierde todo, los que ya llegaron no
+                # precisan más): esos partidos puede ganarlos todos; la capacidad es lo que le falta
+                afuera = self.restantes[j] - sum(self.cruces[j][l] for l in elegidos)
+                capacidad[j] = max(0, piso - puntos[j] - PUNTOS_VICTORIA * afuera)
+            pares = {(j, l): _REPARTO_MAXIMO * self.cruces[j][l]
+                     for a, j in enumerate(elegidos) for l in elegidos[a + 1:] if self.cruces[j][l]}
+            if flujo_maximo(pares, capacidad) == sum(capacidad):
+                return False
+        return True
+
+    def estado(self, equipo: str, zona: str) -> Optional[str]:
+        """ASEGURADA, PERDIDA o None si sigue abierta"""
+        definicion = self.definiciones.get((zona, equipo))
+        return definicion.estado if definicion else None
+
+    def zona_definida(self, zona: str) -> bool:
+        """Ya se sabe exactamente quiénes terminan en la zona"""
+        k = self.zonas[zona]
+        estados = [d.estado for (z, _), d in self.definiciones.items() if z == zona]
+        return estados.count(ASEGURADA) == k or estados.count(PERDIDA) == len(self.equipos) - k
+
+    def todo_definido(self) -> bool:
+        """Ninguna zona depende ya de los partidos que faltan (un Monte Carlo puede cortar acá)"""
+        return all(self.zona_definida(zona) for zona in self.zonas)
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from base_datos import base_datos
+    from calendario import simular_jornadas
+    from semillas import configurar_semilla
+
+    liga = sys.argv[1] if len(sys.argv) > 1 else "Premier League"
+    equipos = base_datos.obtener_equipos_liga(liga)
+    if not equipos:
+        sys.exit(f"Liga desconocida: {liga}")
+    n = len(equipos)
+    zonas = {"título": 1, "Champions": min(4, n - 1), "permanencia": n - 3}
+    configurar_semilla(int(sys.argv[2]) if len(sys.argv) > 2 else 7)
+
+    seguimiento = SeguimientoDefiniciones(equipos, zonas)
+    chequeo = 0.0
+    for resultado in simular_jornadas(liga, equipos, deltas=False):
+        inicio = time.perf_counter()
+        nuevas = seguimiento.actualizar(resultado.numero, resultado.partidos)
+        chequeo += time.perf_counter() - inicio
+        for definicion in nuevas:
+            verbo = "asegura" if definicion.estado == ASEGURADA else "pierde"
+            print(f"Jornada {definicion.jornada:>2}: {definicion.equipo.upper():<12} {verbo} {definicion.zona}")
+        if seguimiento.todo_definido():
+            print(f"Todo definido en la jornada {resultado.numero}")
+            break
+    print(f"Chequeos: {chequeo * 1000:.1f} ms en total ({chequeo / max(seguimiento.jornada, 1) * 1000:.2f} ms por jornada)")
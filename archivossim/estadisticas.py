@@ -0,0 +1,144 @@
+"""
+Tabla de estadísticas de jugadores en columnas.
+
+Cada contador (goles, asistencias, partidos, minutos, tarjetas, títulos) es
+un array('q') contiguo indexado por la fila del jugador, que en BaseDatos es
+su id. Los objetos Jugador son vistas sobre su fila: leer o asignar
+jugador.goles lee o escribe la columna. Así un partido o un lote de partidos
+suma directamente en las columnas, y reiniciar una temporada es un llenado
+por columna en lugar de recorrer miles de objetos.
+
+Con mapear(directorio) las columnas pasan a archivos mapeados en memoria
+(ver columnas_mmap.py): siguen indexándose igual, pero la tabla queda de
+tamaño fijo.
+"""
+from array import array
+from typing import Dict, Iterable, Sequence
+
+COLUMNAS = ("goles", "asistencias", "partidos_jugados", "minutos_jugados",
+            "tarjetas_amarillas", "tarjetas_rojas", "titulos_colectivos")
+# Las que se ponen a cero al empezar una temporada (los títulos se acumulan)
+COLUMNAS_TEMPORADA = COLUMNAS[:-1]
+TIPO_COLUMNA = 'q'  # entero de 64 bits, compatible con numpy.int64
+
+class TablaEstadisticas:
+    """Contadores de jugadores en columnas tipadas, una fila por jugador"""
+    __slots__ = COLUMNAS + ("filas", "_mapeadas")
+
+    def __init__(self, filas: int = 0):
+        self.filas = filas
+        self._mapeadas = None
+        for nombre in COLUMNAS:
+            setattr(self, nombre, array(TIPO_COLUMNA, bytes(8 * filas)))
+
+    def agregar_fila(self, valores: Dict[str, int] = None) -> int:
+        """Agrega una fila (en cero o con los valores dados) y devuelve su índice"""
+        if self._mapeadas is not None:
+            raise ValueError("Una tabla mapeada en archivos tiene tamaño fijo")
+        valores = valores or {}
+        for nombre in COLUMNAS:
+            getattr(self, nombre).append(valores.get(nombre, 0))
+        self.filas += 1
+        return self.filas - 1
+
+    def mapear(self, directorio: str):
+        """Pasa las columnas a archivos mapeados en directorio; las escrituras van directo a ellos"""
+        from columnas_mmap import mapear_tabla
+        if self._mapeadas is not None:
+            self.desmapear()
+        self._mapeadas = mapear_tabla(self, directorio)
+        for nombre, columna in self._mapeadas.items():
+            setattr(self, nombre, columna.valores)
+
+    def desmapear(self):
+        """Vuelve a columnas en memoria (copiando los valores) y cierra los archivos"""
+        if self._mapeadas is None:
+            return
+        for nombre, columna in self._mapeadas.items():
+            setattr(self, nombre, array(TIPO_COLUMNA, columna.valores))
+            columna.cerrar()
+        self._mapeadas = None
+
+    def columna(self, nombre: str) -> array:
+        """Columna completa (se modifica en el lugar, no se reemplaza)"""
+        return getattr(self, nombre)
+
+    def fila(self, indice: int) -> Dict[str, int]:
+        """Valores de una fila como diccionario"""
+        return {nombre: getattr(self, nombre)[indice] for nombre in COLUMNAS}
+
+    def sumar(self, nombre: str, filas: Iterable[int], valores: Iterable[int]):
+        """Suma valores[k] a la fila filas[k] de la columna"""
+        columna = getattr(self, nombre)
+        for fila, valor in zip(filas, valores):
+            columna[fila] += valor
+
+    def sumar_partido(self, filas: Sequence[int], minutos: int = 90, partidos: int = 1):
+        """Suma partidos jugados y minutos a todas las filas (la plantilla de un equipo)"""
+        jugados = self.partidos_jugados
+        minutos_jugados = self.minutos_jugados
+        total_minutos = minutos * partidos
+        for fila in filas:
+            jugados[fila] += partidos
+            minutos_jugados[fila] += total_minutos
+
+    def copiar(self) -> "TablaEstadisticas":
+        """Tabla nueva con copias de todas las columnas"""
+        copia = TablaEstadisticas()
+        copia.filas = self.filas
+        for nombre in COLUMNAS:
+            setattr(copia, nombre, array(TIPO_COLUMNA, getattr(self, nombre)))
+        return copia
+
+    def cargar(self, otra: "TablaEstadisticas"):
+        """Copia en el lugar los valores de otra tabla del mismo tamaño"""
+        if otra.filas != self.filas:
+            raise ValueError(f"La tabla tiene {otra.filas} filas, se esperaban {self.filas}")
+        for nombre in COLUMNAS:
+            getattr(self, nombre)[:] = getattr(otra, nombre)
+
+    def valores_filas(self, filas: Sequence[int]) -> Dict[str, array]:
+        """Valores actuales de las filas dadas, por columna"""
+        return {nombre: array(TIPO_COLUMNA, map(getattr(self, nombre).__getitem__, filas)) for nombre in COLUMNAS}
+
+    def escribir_filas(self, filas: Sequence[int], valores: Dict[str, Sequence[int]]):
+        """Inverso de valores_filas: deja las filas dadas con esos valores"""
+        for nombre, valores_columna in valores.items():
+            columna = getattr(self, nombre)
+            for fila, valor in zip(filas, valores_columna):
+                columna[fila] = valor
+
+    def delta_desde(self, filas: Sequence[int], antes: Dict[str, array]) -> "DeltaEstadisticas":
+        """Cambios de las filas respecto de valores_filas(filas) tomado antes; solo filas con cambios"""
+        despues = self.valores_filas(filas)
+        diferencias = {nombre: [b - a for a, b in zip(antes[nombre], despues[nombre])] for nombre in COLUMNAS}
+        cambiadas = [k for k, fila in enumerate(zip(*diferencias.values())) if any(fila)]
+        return DeltaEstadisticas(array('l', [filas[k] for k in cambiadas]),
+                                 {nombre: array(TIPO_COLUMNA, [valores[k] for k in cambiadas])
+                                  for nombre, valores in diferencias.items()})
+
+    def reiniciar(self, columnas: Iterable[str] = COLUMNAS_TEMPORADA):
+        """Pone a cero las columnas indicadas con un llenado por columna"""
+        ceros = bytes(8 * self.filas)
+        for nombre in columnas:
+            getattr(self, nombre)[:] = array(TIPO_COLUMNA, ceros)
+
+class DeltaEstadisticas:
+    """Cambios en algunas filas: valores[columna][k] se suma a la fila filas[k]"""
+    __slots__ = ("filas", "valores")
+
+    def __init__(self, filas: array = None, valores: Dict[str, array] = None):
+        self.filas = filas if filas is not None else array('l')
+        self.valores = valores if valores is not None else {nombre: array(TIPO_COLUMNA) for nombre in COLUMNAS}
+
+    def __len__(self) -> int:
+        return len(self.filas)
+
+    def aplicar(self, tabla: TablaEstadisticas):
+        """Suma los cambios a la tabla"""
+        for nombre, valores in self.valores.items():
+            tabla.sumar(nombre, self.filas, valores)
+
+    def fila(self, k: int) -> Dict[str, int]:
+        """Cambios de la k-ésima fila del delta"""
+        return {nombre: valores[k] for nombre, valores in self.valores.items()}
@@ -0,0 +1,125 @@
+"""
+Ligas domésticas en paralelo con un ProcessPoolExecutor.
+
+Las ligas no comparten equipos ni jugadores hasta los clasificados europeos,
+así que cada una puede simularse en un proceso aparte. Los procesos se crean
+con fork y heredan el mundo tal como está (plantillas, niveles,
+estadísticas); cada liga devuelve su tabla, sus partidos, lo que imprimió y
+un DeltaEstadisticas con los cambios de sus jugadores (títulos del campeón
+incluidos). El proceso principal aplica los deltas y anota los campeones en
+el orden de las ligas, no en el que terminan, y como cada partido tiene su
+propio generador (semillas.generador) la temporada con --seed es idéntica a
+la serial. Sin semilla cada proceso vuelve a sembrar el generador global
+para no repetir la secuencia heredada.
+
+Donde no hay fork (Windows, macOS por defecto) las ligas se simulan en serie.
+
+Comparar la fase de ligas en serie y en paralelo (y verificar que coinciden):
+    python ligas_paralelas.py --procesos 8 --escala 10
+"""
+import contextlib
+import io
+import multiprocessing as mp
+import os
+import random as rm
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from base_datos import base_datos
+from estadisticas import COLUMNAS, DeltaEstadisticas
+from motores import MOTOR_POR_DEFECTO
+from semillas import semilla_activa
+from simuladorcompleto import simular_liga_con_jugadores
+
+@dataclass
+class ResultadoLiga:
+    """Lo que devuelve cada liga"""
+    tabla: List[Tuple[str, Dict]]                 # ordenada, como simular_liga_con_jugadores
+    partidos: List[Tuple[str, str, int, int]]     # (local, visitante, goles local, goles visitante)
+    estadisticas: DeltaEstadisticas               # cambios de los jugadores de la liga
+    salida: str                                   # lo que imprimió la simulación
+
+def puede_paralelizar() -> bool:
+    return "fork" in mp.get_all_start_methods()
+
+def _iniciar_proceso():
+    """Deja el mundo heredado listo para simular sin tocar el del proceso principal"""
+    # Con las columnas mapeadas las escrituras irían a los archivos del principal
+    base_datos.estadisticas.desmapear()
+    if semilla_activa() is None:
+        rm.seed()
+
+def _simular_liga(nombre_liga: str, equipos_dict: Dict[str, int], motor: str) -> ResultadoLiga:
+    estadisticas = base_datos.estadisticas
+    filas = array('l', [jugador.id for codigo in equipos_dict for jugador in base_datos.equipos[codigo].jugadores])
+    antes = estadisticas.valores_filas(filas)
+    partidos = []
+    salida = io.StringIO()
+    with contextlib.redirect_stdout(salida):
+        tabla = simular_liga_con_jugadores(nombre_liga, equipos_dict, motor, partidos)
+    return ResultadoLiga(tabla, partidos, estadisticas.delta_desde(filas, antes), salida.getvalue())
+
+def simular_ligas(ligas: Dict[str, Dict[str, int]], motor: str = MOTOR_POR_DEFECTO,
+                  procesos: int = None) -> Dict[str, ResultadoLiga]:
+    """
+    Simula las ligas ({liga: {código: nivel}}, como obtener_ligas) repartidas
+    entre procesos y deja base_datos como si se hubieran simulado en serie
+    (estadísticas y campeones de liga). Devuelve los resultados en el orden de
+    ligas. Con procesos=1, o sin fork, se simulan en este proceso.
+    """
+    procesos = min(procesos or os.cpu_count() or 1, len(ligas))
+    if procesos <= 1 or not puede_paralelizar():
+        return {liga: _simular_liga(liga, equipos, motor) for liga, equipos in ligas.items()}
+
+    # Las ligas más largas primero, para que ninguna quede sola al final
+    orden = sorted(ligas, key=lambda liga: len(ligas[liga]), reverse=True)
+    with ProcessPoolExecutor(procesos, mp_context=mp.get_context("fork"), initializer=_iniciar_proceso) as pool:
+        futuros = {liga: pool.submit(_simular_liga, liga, ligas[liga], motor) for liga in orden}
+        resultados = {liga: futuros[liga].result() for liga in ligas}
+
+    for liga, resultado in resultados.items():
+        resultado.estadisticas.aplicar(base_datos.estadisticas)
+        if resultado.tabla:
+            # Los títulos de los jugadores ya vienen en el delta: solo falta anotar el campeón
+            base_datos.campeones['ligas'][liga] = resultado.tabla[0][0]
+    return resultados
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from semillas import configurar_semilla
+
+    parser = argparse.ArgumentParser(description="Fase de ligas en serie y en paralelo")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos (default: todos los núcleos)")
+    parser.add_argument("--escala", type=float, default=None, help="Usar un mundo sintético de esta escala")
+    parser.add_argument("--motor", default="lotes", help="Motor de las ligas (default: lotes)")
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+
+    if args.escala:
+        from mundo_sintetico import crear_base_sintetica
+        crear_base_sintetica(args.escala, como_global=True)
+    configurar_semilla(args.semilla)
+    base_datos.reset_estadisticas_temporada()
+    inicial = base_datos.instantanea()
+    ligas = base_datos.obtener_ligas()
+    print(f"{len(ligas)} ligas, {len(base_datos.equipos)} equipos, {os.cpu_count()} núcleos; "
+          f"fork {'disponible' if puede_paralelizar() else 'no disponible'}")
+
+    finales = {}
+    for nombre, procesos in (("Serie", 1), ("Paralelo", args.procesos)):
+        base_datos.restaurar(inicial)
+        inicio = time.perf_counter()
+        resultados = simular_ligas(ligas, args.motor, procesos)
+        duracion = time.perf_counter() - inicio
+        finales[nombre] = ({liga: r.tabla for liga, r in resultados.items()}, base_datos.estadisticas.copiar(),
+                           dict(base_datos.campeones['ligas']))
+        print(f"{nombre:<9} {duracion:7.2f} s")
+
+    (tablas1, estadisticas1, campeones1), (tablas2, estadisticas2, campeones2) = finales.values()
+    iguales = (tablas1 == tablas2 and campeones1 == campeones2 and
+               all(estadisticas1.columna(c) == estadisticas2.columna(c) for c in COLUMNAS))
+    print("Resultados idénticos" if iguales else "¡Los resultados difieren!")
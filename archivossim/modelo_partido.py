@@ -0,0 +1,176 @@
+"""
+Modelo de partido compartido por todos los motores de simulación.
+
+Reúne las constantes del bucle minuto a minuto de simular_partido_con_jugadores
+y las probabilidades exactas que se derivan de él, para que los motores
+alternativos reproduzcan la misma distribución de goles, asistencias y tarjetas.
+"""
+from typing import List, Tuple
+
+MINUTOS_PARTIDO = 90
+VALORES_DADO = 200          # prob = rm.randint(1, 200)
+UMBRAL_OPORTUNIDAD = 195    # prob > 195 -> oportunidad de gol
+UMBRAL_AMARILLA = 8         # prob < 8 -> tarjeta amarilla
+PROB_SIN_ASISTENCIA = 0.3   # 30% de goles sin asistencia registrada
+
+# Probabilidad por minuto de cada tipo de evento
+P_OPORTUNIDAD = (VALORES_DADO - UMBRAL_OPORTUNIDAD) / VALORES_DADO
+P_AMARILLA = (UMBRAL_AMARILLA - 1) / VALORES_DADO
+
+# Probabilidades por posición
+PROB_GOL = {
+    "DEL": 0.7,  # Delanteros más probables
+    "MED": 0.25, # Mediocampistas
+    "DEF": 0.04, # Defensores
+    "POR": 0.01  # Porteros (muy raro)
+}
+
+PROB_ASIST = {
+    "MED": 0.6,  # Mediocampistas más asistentes
+    "DEL": 0.3,  # Delanteros
+    "DEF": 0.08, # Defensores
+    "POR": 0.02  # Porteros
+}
+
+POSICIONES_AMARILLA = ("DEF", "MED")
+
+def ajustar_niveles(nivel1: int, nivel2: int) -> Tuple[float, float]:
+    """Aplica el factor de ventaja por diferencia de nivel"""
+    diferencia_nivel = abs(nivel1 - nivel2)
+    factor_ventaja = 1 + (diferencia_nivel / 40)
+
+    if nivel1 > nivel2:
+        return nivel1 * factor_ventaja, nivel2 / factor_ventaja
+    return nivel1 / factor_ventaja, nivel2 * factor_ventaja
+
+def probabilidad_equipo1(nivel1_ajustado: float, sumalevel: float) -> float:
+    """Probabilidad exacta de que rm.randint(0, int(sumalevel)) <= nivel1_ajustado"""
+    casos = int(sumalevel) + 1
+    return min(casos, int(nivel1_ajustado) + 1) / casos
+
+def probabilidad_conversion(nivel: int) -> float:
+    """Efectividad del goleador: 25% base ajustada por nivel, entre 15% y 40%"""
+    efectividad_base = 0.25
+    bonus_nivel = (nivel - 80) / 100
+    return min(0.40, max(0.15, efectividad_base + bonus_nivel))
+
+def ordenar_por_nivel(jugadores: List) -> List:
+    """Orden que usa la cascada de selección (mejores jugadores primero)"""
+    return sorted(jugadores, key=lambda x: x.nivel, reverse=True)
+
+def distribucion_goleador(jugadores_ordenados: List) -> List[float]:
+    """
+    Probabilidad de que cada jugador (en orden de nivel) sea el goleador,
+    incluyendo el fallback al mejor jugador cuando nadie es elegido
+    """
+    probabilidades = []
+    sin_elegir = 1.0
+    for jugador in jugadores_ordenados:
+        prob_final = PROB_GOL.get(jugador.posicion, 0.1) * (jugador.nivel / 100.0) * 1.8
+        prob_final = min(1.0, prob_final)
+        probabilidades.append(sin_elegir * prob_final)
+        sin_elegir *= 1.0 - prob_final
+
+    if probabilidades:
+        probabilidades[0] += sin_elegir
+    return probabilidades
+
+def distribucion_asistente(jugadores_ordenados: List, indice_goleador: int) -> List[float]:
+    """
+    Probabilidad de que cada jugador dé la asistencia dado el goleador.
+    La última posición es la probabilidad de que no haya asistencia.
+    """
+    probabilidades = [0.0] * (len(jugadores_ordenados) + 1)
+    sin_elegir = 1.0
+    for i, jugador in enumerate(jugadores_ordenados):
+        if i == indice_goleador:
+            continue
+        prob_final = PROB_ASIST.get(jugador.posicion, 0.1) * (jugador.nivel / 100.0) * 1.5
+        prob_final = min(1.0, prob_final)
+        probabilidades[i] = sin_elegir * prob_final * (1 - PROB_SIN_ASISTENCIA)
+        sin_elegir *= 1.0 - prob_final
+
+    probabilidades[-1] = sin_elegir * (1 - PROB_SIN_ASISTENCIA) + PROB_SIN_ASISTENCIA
+    return probabilidades
+
+class TablaAlias:
+    """Muestreo O(1) de una distribución discreta (método alias de Walker)"""
+    __slots__ = ("prob", "alias", "n")
+
+    def __init__(self, pesos: List[float]):
+        n = len(pesos)
+        total = sum(pesos)
+        escalados = [p * n / total for p in pesos]
+        prob = [1.0] * n
+        alias = list(range(n))
+
+        # Algoritmo de Vose: emparejar cada casilla pequeña con una grande
+        pequenos = [i for i, p in enumerate(escalados) if p < 1.0]
+        grandes = [i for i, p in enumerate(escalados) if p >= 1.0]
+        while pequenos and grandes:
+            chico = pequenos.pop()
+            grande = grandes.pop()
+            prob[chico] = escalados[chico]
+            alias[chico] = grande
+            escalados[grande] = (escalados[grande] + escalados[chico]) - 1.0
+            if escalados[grande] < 1.0:
+                pequenos.append(grande)
+            else:
+                grandes.append(grande)
+
+        self.prob = prob
+        self.alias = alias
+        self.n = n
+
+    def sortear(self, u: float) -> int:
+        """Índice sorteado a partir de un único uniforme u en [0, 1)"""
+        x = u * self.n
+        i = int(x)
+        return i if x - i < self.prob[i] else self.alias[i]
+
+class TablasMuestreo:
+    """
+    Tablas de muestreo de un equipo: quién remata, quién asiste dado el
+    goleador y quién puede recibir una amarilla. Reproducen la cascada de
+    seleccionar_goleador_y_asistente (incluido el fallback al mejor jugador
+    y el 30% sin asistencia) con un solo uniforme por sorteo.
+    """
+
+    def __init__(self, jugadores: List, version: int = 0):
+        self.version = version
+        self.jugadores = ordenar_por_nivel(jugadores)
+        probabilidades_gol = distribucion_goleador(self.jugadores)
+        self.goleador = TablaAlias(probabilidades_gol) if self.jugadores else None
+        self.conversion = [probabilidad_conversion(j.nivel) for j in self.jugadores]
+        # Probabilidad de que una oportunidad del equipo termine en gol
+        self.conversion_media = sum(p * c for p, c in zip(probabilidades_gol, self.conversion))
+        # Goleador condicionado a que la oportunidad terminó en gol
+        pesos_gol = [p * c for p, c in zip(probabilidades_gol, self.conversion)]
+        self.goleador_gol = TablaAlias(pesos_gol) if self.jugadores else None
+        self.amonestables = [i for i, j in enumerate(self.jugadores)
+                             if j.posicion in POSICIONES_AMARILLA]
+        self._asistente = [None] * len(self.jugadores)
+
+    def tabla_asistente(self, indice_goleador: int) -> TablaAlias:
+        """
+        Tabla del asistente dado el goleador (se construye la primera vez que se
+        necesita). El índice len(jugadores) significa "sin asistencia".
+        """
+        tabla = self._asistente[indice_goleador]
+        if tabla is None:
+            tabla = TablaAlias(distribucion_asistente(self.jugadores, indice_goleador))
+            self._asistente[indice_goleador] = tabla
+        return tabla
+
+    def sortear_goleador(self, u: float) -> int:
+        """Índice (en self.jugadores) del goleador"""
+        return self.goleador.sortear(u)
+
+    def sortear_goleador_gol(self, u: float) -> int:
+        """Índice del goleador sabiendo que la oportunidad fue gol"""
+        return self.goleador_gol.sortear(u)
+
+    def sortear_asistente(self, indice_goleador: int, u: float) -> int:
+        """Índice del asistente, o -1 si el gol no tiene asistencia"""
+        indice = self.tabla_asistente(indice_goleador).sortear(u)
+        return indice if indice < len(self.jugadores) else -1
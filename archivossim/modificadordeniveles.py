@@ -105,15 +105,10 @@ def calcular_cambios_jugadores(datos):
     for jugador_key, stats in datos.get('jugadores', {}).items():
         if '_' in jugador_key:
             equipo, nombre = jugador_key.split('_', 1)
-            jugador_obj = None
             
-            # Buscar el jugador en la base de datos
-            equipo_obj = base_datos.obtener_equipo(equipo)
-            if equipo_obj:
-                for j in equipo_obj.jugadores:
-                    if j.nombre.lower() == nombre.lower():
-                        jugador_obj = j
-                        break
+            # Buscar el jugador en la base de datos (índice por nombre)
+            encontrados = base_datos.buscar_jugadores(nombre, equipo)
+            jugador_obj = encontrados[0] if encontrados else None
             
             if jugador_obj:
                 cambio = 0
@@ -0,0 +1,281 @@
+"""
+Motor de simulación por lotes.
+
+Simula una lista completa de partidos (una jornada o una liga entera) de una
+sola vez: los dados de los 90 minutos, los goleadores, los asistentes y las
+tarjetas se sortean con operaciones vectorizadas de NumPy, y las estadísticas
+de los jugadores se actualizan en bloque al final del lote. Si NumPy no está
+instalado se usa una versión basada en el módulo array con el mismo formato
+de salida que simular_partido_con_jugadores.
+"""
+import random as rm
+from array import array
+from typing import Dict, List, Tuple
+
+from base_datos import base_datos
+from modelo_partido import (MINUTOS_PARTIDO, VALORES_DADO, UMBRAL_OPORTUNIDAD,
+                            UMBRAL_AMARILLA, TablasMuestreo, ajustar_niveles,
+                            probabilidad_equipo1)
+from registro_eventos import RegistroEventos, TIPO_GOL, TIPO_AMARILLA
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_CARAS_DADO = range(1, VALORES_DADO + 1)
+
+def _sortear_array(tablas: List[TablasMuestreo], locales: array, visitantes: array,
+                   p_local: array, generadores: List[rm.Random] = None) -> Tuple[List[int], ...]:
+    """
+    Sorteo del lote en Python puro con bloques del módulo array. Con generadores
+    (uno por partido) cada partido consume solo de su propio generador.
+    """
+    if generadores is None:
+        dados = array('B', rm.choices(_CARAS_DADO, k=len(locales) * MINUTOS_PARTIDO))
+    else:
+        dados = array('B')
+        for generador in generadores:
+            dados.extend(generador.choices(_CARAS_DADO, k=MINUTOS_PARTIDO))
+    aleatorio = rm.random
+    partidos, minutos, tipos, lados, jugadores, asistentes = [], [], [], [], [], []
+
+    posiciones = [k for k, dado in enumerate(dados)
+                  if dado > UMBRAL_OPORTUNIDAD or dado < UMBRAL_AMARILLA]
+    for k in posiciones:
+        partido, minuto = divmod(k, MINUTOS_PARTIDO)
+        if generadores is not None:
+            aleatorio = generadores[partido].random
+        lado = 0 if aleatorio() < p_local[partido] else 1
+        tabla = tablas[visitantes[partido] if lado else locales[partido]]
+
+        if dados[k] > UMBRAL_OPORTUNIDAD:
+            goleador = tabla.sortear_goleador(aleatorio())
+            if aleatorio() >= tabla.conversion[goleador]:
+                continue
+            tipo = TIPO_GOL
+            jugador = goleador
+            asistente = tabla.sortear_asistente(goleador, aleatorio())
+        else:
+            if not tabla.amonestables:
+                continue
+            tipo = TIPO_AMARILLA
+            jugador = tabla.amonestables[int(aleatorio() * len(tabla.amonestables))]
+            asistente = -1
+
+        partidos.append(partido)
+        minutos.append(minuto + 1)
+        tipos.append(tipo)
+        lados.append(lado)
+        jugadores.append(jugador)
+        asistentes.append(asistente)
+
+    return partidos, minutos, tipos, lados, jugadores, asistentes
+
+def _sortear_alias_numpy(prob, alias, n, u):
+    """Sorteo vectorizado con tablas alias ya rellenadas (n = tamaño real de cada tabla)"""
+    x = u * n
+    i = x.astype(np.int64)
+    filas = np.arange(i.size)
+    return np.where(x - i < prob[filas, i], i, alias[filas, i])
+
+def _sortear_numpy(tablas: List[TablasMuestreo], locales: array, visitantes: array,
+                   p_local: array) -> Tuple[List[int], ...]:
+    """Sorteo vectorizado del lote completo con NumPy"""
+    rng = np.random.default_rng(rm.getrandbits(64))
+    ancho = max(len(t.jugadores) for t in tablas)
+
+    # Tablas alias de todos los equipos del lote rellenadas hasta el mismo ancho
+    prob_gol = np.ones((len(tablas), ancho))
+    alias_gol = np.zeros((len(tablas), ancho), dtype=np.int64)
+    conversion = np.zeros((len(tablas), ancho))
+    prob_asist = np.ones((len(tablas), ancho, ancho + 1))
+    alias_asist = np.zeros((len(tablas), ancho, ancho + 1), dtype=np.int64)
+    amonestables = np.zeros((len(tablas), ancho), dtype=np.int64)
+    num_jugadores = np.zeros(len(tablas), dtype=np.int64)
+    num_amonestables = np.zeros(len(tablas), dtype=np.int64)
+    for s, tabla in enumerate(tablas):
+        n = len(tabla.jugadores)
+        num_jugadores[s] = n
+        prob_gol[s, :n] = tabla.goleador.prob
+        alias_gol[s, :n] = tabla.goleador.alias
+        conversion[s, :n] = tabla.conversion
+        for g in range(n):
+            tabla_asistente = tabla.tabla_asistente(g)
+            prob_asist[s, g, :n + 1] = tabla_asistente.prob
+            alias_asist[s, g, :n + 1] = tabla_asistente.alias
+        num_amonestables[s] = len(tabla.amonestables)
+        amonestables[s, :len(tabla.amonestables)] = tabla.amonestables
+
+    locales = np.frombuffer(locales, dtype=np.int64)
+    visitantes = np.frombuffer(visitantes, dtype=np.int64)
+    p_local = np.frombuffer(p_local, dtype=np.float64)
+
+    dados = rng.integers(1, VALORES_DADO + 1, size=(len(locales), MINUTOS_PARTIDO), dtype=np.int16)
+    es_oportunidad = dados > UMBRAL_OPORTUNIDAD
+    partido, minuto = np.nonzero(es_oportunidad | (dados < UMBRAL_AMARILLA))
+    oportunidad = es_oportunidad[partido, minuto]
+    total = partido.size
+
+    lado = (rng.random(total) >= p_local[partido]).astype(np.int8)
+    equipo = np.where(lado == 1, visitantes[partido], locales[partido])
+
+    n = num_jugadores[equipo]
+    goleador = _sortear_alias_numpy(prob_gol[equipo], alias_gol[equipo], n, rng.random(total))
+    convierte = rng.random(total) < conversion[equipo, goleador]
+    asistente = _sortear_alias_numpy(prob_asist[equipo, goleador], alias_asist[equipo, goleador],
+                                     n + 1, rng.random(total))
+    asistente = np.where(asistente >= n, -1, asistente)
+
+    eleccion = (rng.random(total) * num_amonestables[equipo]).astype(np.int64)
+    amonestado = amonestables[equipo, eleccion]
+
+    valido = np.where(oportunidad, convierte, num_amonestables[equipo] > 0)
+    tipo = np.where(oportunidad, TIPO_GOL, TIPO_AMARILLA)
+    jugador = np.where(oportunidad, goleador, amonestado)
+    asistente = np.where(oportunidad, asistente, -1)
+
+    return (partido[valido].tolist(), (minuto[valido] + 1).tolist(), tipo[valido].tolist(),
+            lado[valido].tolist(), jugador[valido].tolist(), asistente[valido].tolist())
+
+def _volcar_en_registro(registro: RegistroEventos, num_fixtures: int, validos: List[int],
+                        codigos: List[str], tablas: List[TablasMuestreo], locales: array, visitantes: array,
+                        partidos, minutos, tipos, lados, jugadores, asistentes):
+    """Agrega las columnas sorteadas al registro internando equipos y jugadores una vez por slot"""
+    inicio = registro.reservar_partidos(num_fixtures)
+    ids_equipo = [registro.id_equipo(codigo) for codigo in codigos]
+    ids_jugador = [[registro.id_jugador(j) for j in tabla.jugadores] for tabla in tablas]
+    slots = [visitantes[p] if lado else locales[p] for p, lado in zip(partidos, lados)]
+
+    registro.extender(
+        [inicio + validos[p] for p in partidos],
+        minutos,
+        tipos,
+        [ids_equipo[s] for s in slots],
+        [ids_jugador[s][j] for s, j in zip(slots, jugadores)],
+        [ids_jugador[s][a] if a >= 0 else -1 for s, a in zip(slots, asistentes)]
+    )
+
+def simular_jornada(equipos: List[str], fixtures: List[Tuple[int, int]], eventos: bool = True,
+                    registro: RegistroEventos = None,
+                    generadores: List[rm.Random] = None) -> List[Tuple[int, int, List[Dict]]]:
+    """
+    Simula de una vez todos los partidos de fixtures (pares de índices de equipos)
+    y devuelve (goles_local, goles_visitante, eventos) por partido, en el mismo
+    orden y formato que simular_partido_con_jugadores. Con eventos=False las
+    listas de eventos quedan vacías y solo se actualizan marcadores y estadísticas.
+    Si se pasa un registro, los eventos se agregan en bloque al registro (el
+    fixture k recibe el id de partido registro.num_partidos + k) en lugar de
+    devolverse como diccionarios. Con generadores (uno por fixture, ver
+    semillas.generador) cada partido usa su propio generador y el resultado no
+    depende del resto del lote; en ese modo se usa siempre el sorteo con array.
+    Una lista de solo el módulo random (lo que da semillas.generador sin
+    semilla de temporada) cuenta como sin generadores.
+    """
+    resultados = [(0, 0, []) for _ in fixtures]
+    if not fixtures:
+        return resultados
+
+    # Un slot por equipo del lote; los fixtures con equipos desconocidos se omiten
+    slots: Dict[int, int] = {}
+    tablas: List[TablasMuestreo] = []
+    equipos_lote = []
+    codigos: List[str] = []
+    niveles: List[int] = []
+    validos = []
+    locales, visitantes, p_local = array('q'), array('q'), array('d')
+
+    for k, (i, j) in enumerate(fixtures):
+        for indice in (i, j):
+            if indice not in slots:
+                equipo = base_datos.obtener_equipo(equipos[indice])
+                if equipo and equipo.jugadores:
+                    slots[indice] = len(tablas)
+                    tablas.append(equipo.tablas_muestreo())
+                    equipos_lote.append(equipo)
+                    codigos.append(equipos[indice])
+                    niveles.append(equipo.calcular_nivel_equipo())
+                else:
+                    slots[indice] = -1
+        if slots[i] < 0 or slots[j] < 0:
+            continue
+
+        nivel1_ajustado, nivel2_ajustado = ajustar_niveles(niveles[slots[i]], niveles[slots[j]])
+        validos.append(k)
+        locales.append(slots[i])
+        visitantes.append(slots[j])
+        p_local.append(probabilidad_equipo1(nivel1_ajustado, nivel1_ajustado + nivel2_ajustado))
+
+    if not validos:
+        return resultados
+
+    if generadores is not None and all(rng is rm for rng in generadores):
+        generadores = None
+    if generadores is not None:
+        generadores_validos = [generadores[k] for k in validos]
+        columnas = _sortear_array(tablas, locales, visitantes, p_local, generadores_validos)
+    elif np is not None:
+        columnas = _sortear_numpy(tablas, locales, visitantes, p_local)
+    else:
+        columnas = _sortear_array(tablas, locales, visitantes, p_local)
+    partidos, minutos, tipos, lados, jugadores, asistentes = columnas
+
+    if registro is not None:
+        _volcar_en_registro(registro, len(fixtures), validos, codigos, tablas, locales, visitantes,
+                            partidos, minutos, tipos, lados, jugadores, asistentes)
+        eventos = False
+
+    # Contadores en bloque por (equipo, jugador) y por equipo
+    ancho = max(len(t.jugadores) for t in tablas)
+    goles = array('l', [0]) * (len(tablas) * ancho)
+    asistencias = array('l', [0]) * (len(tablas) * ancho)
+    amarillas = array('l', [0]) * (len(tablas) * ancho)
+    apariciones = array('l', [0]) * len(tablas)
+    for s in locales:
+        apariciones[s] += 1
+    for s in visitantes:
+        apariciones[s] += 1
+
+    marcador = [[0, 0] for _ in validos]
+    lista_eventos = [[] for _ in validos]
+
+    for partido, minuto, tipo, lado, jugador, asistente in zip(partidos, minutos, tipos, lados, jugadores, asistentes):
+        s = visitantes[partido] if lado else locales[partido]
+        plantilla = tablas[s].jugadores
+        if tipo == TIPO_GOL:
+            marcador[partido][lado] += 1
+            goles[s * ancho + jugador] += 1
+            if asistente >= 0:
+                asistencias[s * ancho + asistente] += 1
+            if eventos:
+                lista_eventos[partido].append({
+                    'minuto': minuto,
+                    'tipo': 'gol',
+                    'equipo': codigos[s],
+                    'goleador': plantilla[jugador].nombre,
+                    'asistente': plantilla[asistente].nombre if asistente >= 0 else None
+                })
+        else:
+            amarillas[s * ancho + jugador] += 1
+            if eventos:
+                lista_eventos[partido].append({
+                    'minuto': minuto,
+                    'tipo': 'tarjeta_amarilla',
+                    'equipo': codigos[s],
+                    'jugador': plantilla[jugador].nombre
+                })
+
+    # Volcar los contadores del lote en las columnas de la tabla de estadísticas
+    estadisticas = base_datos.estadisticas
+    for s, (tabla, equipo) in enumerate(zip(tablas, equipos_lote)):
+        equipo.registrar_partido(partidos=apariciones[s])
+        filas = [jugador.id for jugador in tabla.jugadores]
+        base = s * ancho
+        fin = base + len(filas)
+        estadisticas.sumar("goles", filas, goles[base:fin])
+        estadisticas.sumar("asistencias", filas, asistencias[base:fin])
+        estadisticas.sumar("tarjetas_amarillas", filas, amarillas[base:fin])
+
+    for partido, k in enumerate(validos):
+        resultados[k] = (marcador[partido][0], marcador[partido][1], lista_eventos[partido])
+    return resultados
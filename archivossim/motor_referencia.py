@@ -0,0 +1,135 @@
+"""
+Motor de referencia: el bucle minuto a minuto original del simulador.
+
+Es el modelo que definen las constantes de modelo_partido y contra el que se
+validan los motores rápidos (lotes, saltos y tabla).
+"""
+import random as rm
+from typing import Dict, List, Tuple
+
+from base_datos import base_datos, Jugador, Equipo
+from buffer_aleatorio import BufferAleatorio, buffer_para
+from modelo_partido import ajustar_niveles
+
+def simular_partido_con_jugadores(equipo1: str, equipo2: str, eventos: bool = True,
+                                  rng: rm.Random = None) -> Tuple[int, int, List[Dict]]:
+    """
+    Simula un partido entre dos equipos con estadísticas REALISTAS.
+    Con eventos=False no se construye la lista de eventos (se devuelve vacía)
+    pero se siguen actualizando goles, asistencias, tarjetas y minutos.
+    rng es el generador del partido (ver semillas.generador); por defecto el global.
+    Los sorteos salen de un BufferAleatorio sobre rng (dados del partido en bloque).
+    """
+    rng = buffer_para(rng)
+    team1 = base_datos.obtener_equipo(equipo1)
+    team2 = base_datos.obtener_equipo(equipo2)
+    
+    if not team1 or not team2:
+        return 0, 0, []
+    
+    nivel1 = team1.calcular_nivel_equipo()
+    nivel2 = team2.calcular_nivel_equipo()
+    
+    # Factor de ventaja por diferencia de nivel
+    nivel1_ajustado, nivel2_ajustado = ajustar_niveles(nivel1, nivel2)
+    
+    gol1, gol2 = 0, 0
+    lista_eventos = []
+    sumalevel = nivel1_ajustado + nivel2_ajustado
+    
+    # Actualizar partidos jugados y minutos
+    team1.registrar_partido()
+    team2.registrar_partido()
+    
+    # SIMULACIÓN CON ESTADÍSTICAS REALISTAS
+    oportunidades_equipo1 = 0
+    oportunidades_equipo2 = 0
+    
+    dados = rng.dados(90, 200)  # prob = randint(1, 200) de cada minuto, en bloque
+    for minuto, prob in enumerate(dados, 1):
+        
+        # OPORTUNIDADES DE GOL REALISTAS (2.5% por minuto = ~2.25 por partido)
+        if prob > 195:  # 2.5% de probabilidad
+            prob2 = rng.randint(0, int(sumalevel))
+            
+            equipo_atacante = team1 if prob2 <= nivel1_ajustado else team2
+            goleador, asistente = seleccionar_goleador_y_asistente(equipo_atacante, rng)
+            
+            if goleador:
+                # Registrar la oportunidad (para estadísticas)
+                if equipo_atacante == team1:
+                    oportunidades_equipo1 += 1
+                else:
+                    oportunidades_equipo2 += 1
+                
+                # PROBABILIDAD DE CONVERSIÓN REALISTA
+                # Mejores delanteros: 25-35% de efectividad
+                efectividad_base = 0.25
+                bonus_nivel = (goleador.nivel - 80) / 100  # +0.15 para jugadores de nivel 95
+                probabilidad_gol = min(0.40, max(0.15, efectividad_base + bonus_nivel))
+                
+                if rng.random() < probabilidad_gol:
+                    goleador.goles += 1
+                    if equipo_atacante == team1:
+                        gol1 += 1
+                    else:
+                        gol2 += 1
+                    
+                    if eventos:
+                        lista_eventos.append({
+                            'minuto': minuto,
+                            'tipo': 'gol',
+                            'equipo': equipo1 if equipo_atacante == team1 else equipo2,
+                            'goleador': goleador.nombre,
+                            'asistente': asistente.nombre if asistente else None
+                        })
+                    
+                    if asistente:
+                        asistente.asistencias += 1
+        
+        # Tarjetas (proporcionales)
+        if prob < 8:  # 4% para amarilla
+            equipo_tarjeta = team1 if rng.randint(0, int(sumalevel)) <= nivel1_ajustado else team2
+            tablas = equipo_tarjeta.tablas_muestreo()  # defensas y mediocampistas ya filtrados
+            jugador_tarjeta = tablas.jugadores[rng.choice(tablas.amonestables)]
+            jugador_tarjeta.tarjetas_amarillas += 1
+            if eventos:
+                lista_eventos.append({
+                    'minuto': minuto,
+                    'tipo': 'tarjeta_amarilla',
+                    'equipo': equipo1 if equipo_tarjeta == team1 else equipo2,
+                    'jugador': jugador_tarjeta.nombre
+                })
+        elif prob == 1:  # 0.5% para roja
+            equipo_tarjeta = team1 if rng.randint(0, int(sumalevel)) <= nivel1_ajustado else team2
+            jugador_tarjeta = rng.choice(equipo_tarjeta.jugadores)
+            jugador_tarjeta.tarjetas_rojas += 1
+            if eventos:
+                lista_eventos.append({
+                    'minuto': minuto,
+                    'tipo': 'tarjeta_roja',
+                    'equipo': equipo1 if equipo_tarjeta == team1 else equipo2,
+                    'jugador': jugador_tarjeta.nombre
+                })
+    
+    return gol1, gol2, lista_eventos
+
+def seleccionar_goleador_y_asistente(equipo: Equipo, rng: BufferAleatorio = None) -> Tuple[Jugador, Jugador]:
+    """
+    Selecciona quién marca el gol y quién da la asistencia - versión más realista.
+    Usa las tablas alias del equipo, equivalentes a la cascada por nivel y posición.
+    """
+    rng = buffer_para(rng)
+    tablas = equipo.tablas_muestreo()
+    if not tablas.jugadores:
+        return None, None
+    
+    # Goleador: los mejores jugadores y los delanteros tienen más probabilidad
+    indice_goleador = tablas.sortear_goleador(rng.random())
+    goleador = tablas.jugadores[indice_goleador]
+    
+    # Asistente (diferente al goleador, 30% de goles sin asistencia registrada)
+    indice_asistente = tablas.sortear_asistente(indice_goleador, rng.random())
+    asistente = tablas.jugadores[indice_asistente] if indice_asistente >= 0 else None
+    
+    return goleador, asistente
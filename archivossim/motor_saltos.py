@@ -0,0 +1,103 @@
+"""
+Motor de simulación por saltos de eventos.
+
+En lugar de tirar un dado por cada uno de los 90 minutos, sortea directamente
+los minutos en los que ocurre algo. Cada minuto del bucle de referencia es un
+ensayo independiente con probabilidad P_OPORTUNIDAD + P_AMARILLA de producir
+un evento, así que el hueco hasta el siguiente evento sigue una distribución
+geométrica. Una vez elegido el minuto, el tipo de evento (oportunidad o
+tarjeta) se sortea en proporción a sus probabilidades por minuto. El resultado
+tiene la misma distribución de goles, tarjetas y minutos que el bucle original
+con unas 20 llamadas al generador por partido en lugar de más de 100.
+
+Igual que en el bucle de referencia, no se generan tarjetas rojas: allí la
+rama prob == 1 nunca se alcanza porque ese valor ya cae en la de amarilla.
+"""
+import random as rm
+from math import log
+from typing import Dict, List, Tuple
+
+from base_datos import base_datos
+from modelo_partido import (MINUTOS_PARTIDO, P_OPORTUNIDAD, P_AMARILLA,
+                            ajustar_niveles, probabilidad_equipo1)
+
+P_EVENTO = P_OPORTUNIDAD + P_AMARILLA
+P_OPORTUNIDAD_DADO_EVENTO = P_OPORTUNIDAD / P_EVENTO
+_LOG_SIN_EVENTO = log(1.0 - P_EVENTO)
+
+def minutos_con_evento(rng: rm.Random = None) -> List[int]:
+    """Minutos (1-90) en los que el bucle de referencia produciría un evento"""
+    aleatorio = (rng or rm).random
+    minutos = []
+    # Fallos antes del primer éxito de una geométrica: floor(log(U) / log(1 - p))
+    minuto = int(log(1.0 - aleatorio()) / _LOG_SIN_EVENTO) + 1
+    while minuto <= MINUTOS_PARTIDO:
+        minutos.append(minuto)
+        minuto += int(log(1.0 - aleatorio()) / _LOG_SIN_EVENTO) + 1
+    return minutos
+
+def simular_partido_saltos(equipo1: str, equipo2: str, eventos: bool = True,
+                           rng: rm.Random = None) -> Tuple[int, int, List[Dict]]:
+    """
+    Simula un partido sorteando solo los minutos con eventos.
+    Mismo formato de salida y mismos parámetros que simular_partido_con_jugadores.
+    """
+    rng = rng or rm
+    team1 = base_datos.obtener_equipo(equipo1)
+    team2 = base_datos.obtener_equipo(equipo2)
+
+    if not team1 or not team2:
+        return 0, 0, []
+
+    tablas1 = team1.tablas_muestreo()
+    tablas2 = team2.tablas_muestreo()
+    nivel1_ajustado, nivel2_ajustado = ajustar_niveles(team1.calcular_nivel_equipo(), team2.calcular_nivel_equipo())
+    p_equipo1 = probabilidad_equipo1(nivel1_ajustado, nivel1_ajustado + nivel2_ajustado)
+
+    # Actualizar partidos jugados y minutos
+    team1.registrar_partido()
+    team2.registrar_partido()
+
+    aleatorio = rng.random
+    goles = [0, 0]
+    lista_eventos = []
+
+    for minuto in minutos_con_evento(rng):
+        es_oportunidad = aleatorio() < P_OPORTUNIDAD_DADO_EVENTO
+        lado = 0 if aleatorio() < p_equipo1 else 1
+        tablas = tablas2 if lado else tablas1
+
+        if es_oportunidad:
+            indice = tablas.sortear_goleador(aleatorio())
+            if aleatorio() >= tablas.conversion[indice]:
+                continue
+
+            goleador = tablas.jugadores[indice]
+            indice_asistente = tablas.sortear_asistente(indice, aleatorio())
+            asistente = tablas.jugadores[indice_asistente] if indice_asistente >= 0 else None
+
+            goleador.goles += 1
+            goles[lado] += 1
+            if asistente:
+                asistente.asistencias += 1
+
+            if eventos:
+                lista_eventos.append({
+                    'minuto': minuto,
+                    'tipo': 'gol',
+                    'equipo': equipo2 if lado else equipo1,
+                    'goleador': goleador.nombre,
+                    'asistente': asistente.nombre if asistente else None
+                })
+        elif tablas.amonestables:
+            jugador_tarjeta = tablas.jugadores[tablas.amonestables[int(aleatorio() * len(tablas.amonestables))]]
+            jugador_tarjeta.tarjetas_amarillas += 1
+            if eventos:
+                lista_eventos.append({
+                    'minuto': minuto,
+                    'tipo': 'tarjeta_amarilla',
+                    'equipo': equipo2 if lado else equipo1,
+                    'jugador': jugador_tarjeta.nombre
+                })
+
+    return goles[0], goles[1], lista_eventos
@@ -0,0 +1,271 @@
+"""
+Motor de simulación por tabla de marcadores.
+
+El marcador de un partido depende solo del perfil de cada equipo: su nivel
+(entero) y la efectividad media de su plantilla. Un paso de construcción
+calcula, para cada par de perfiles del mundo, la distribución acumulada exacta
+de (goles1, goles2) con pronostico_niveles y la guarda en un archivo binario
+compacto. En tiempo de ejecución el archivo se mapea en memoria, así que un
+partido solo-marcador cuesta un uniforme y una búsqueda binaria. Los goles se
+reparten después con las tablas de "goleador dado gol" de cada equipo y las
+tarjetas con su binomial exacta condicionada a los minutos sin gol.
+
+Si el archivo no existe (o es de otro formato) se construye y se guarda la
+primera vez que se usa el motor, unos segundos con el mundo completo. Los
+pares de perfiles que no están en la tabla (niveles cambiados después de
+construirla) se calculan al vuelo y se guardan en memoria.
+
+Construir (o reconstruir) la tabla:
+    python motor_tabla.py
+"""
+import mmap
+import os
+import random as rm
+import struct
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from math import log
+from typing import Dict, List, Optional, Tuple
+
+from base_datos import base_datos
+from modelo_partido import MINUTOS_PARTIDO, P_AMARILLA, ajustar_niveles, probabilidad_equipo1
+from pronostico import pronostico_niveles, probabilidades_gol_minuto
+
+RUTA_TABLA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tabla_marcadores.bin")
+MAX_GOLES_TABLA = 9
+
+# Cabecera: firma, versión, número de perfiles, goles máximos (múltiplo de 8 bytes)
+_FORMATO_CABECERA = "<4sIII"
+_FIRMA = b"MARC"
+_VERSION_FORMATO = 1
+_FORMATO_PERFIL = "<qd"  # nivel, efectividad media
+
+class TablaMarcadores:
+    """Distribuciones acumuladas de marcadores por par de perfiles (nivel, efectividad)"""
+
+    def __init__(self, perfiles: List[Tuple[int, float]], acumuladas, max_goles: int, mapa: mmap.mmap = None):
+        self.perfiles = perfiles
+        self.indices: Dict[Tuple[int, float], int] = {perfil: i for i, perfil in enumerate(perfiles)}
+        self.acumuladas = acumuladas  # array('d') o memoryview mapeada del archivo
+        self.max_goles = max_goles
+        self.celdas = (max_goles + 1) ** 2
+        self._mapa = mapa
+
+    def indice(self, nivel: int, conversion: float) -> int:
+        """Índice del perfil en la tabla, o -1 si no está"""
+        return self.indices.get((nivel, conversion), -1)
+
+    def sortear(self, indice1: int, indice2: int, u: float) -> Tuple[int, int]:
+        """Marcador (goles1, goles2) para el par de perfiles a partir de un uniforme"""
+        inicio = (indice1 * len(self.perfiles) + indice2) * self.celdas
+        celda = bisect_right(self.acumuladas, u, inicio, inicio + self.celdas - 1) - inicio
+        return divmod(celda, self.max_goles + 1)
+
+    def cerrar(self):
+        """Libera el mapeo del archivo"""
+        if self._mapa is not None:
+            self.acumuladas.release()
+            self._mapa.close()
+            self._mapa = None
+
+def acumulada_marcador(nivel1: int, conversion1: float, nivel2: int, conversion2: float,
+                       max_goles: int = MAX_GOLES_TABLA) -> List[float]:
+    """
+    Distribución acumulada de los (max_goles + 1)^2 marcadores en orden (goles1, goles2).
+    La masa de la cola (marcadores fuera de la tabla, < 1e-9) se suma a la última celda.
+    """
+    pronostico = pronostico_niveles(nivel1, nivel2, conversion1, conversion2, max_goles)
+    acumulada = []
+    total = 0.0
+    for fila in pronostico.marcador:
+        for p in fila:
+            total += p
+            acumulada.append(total)
+    acumulada[-1] = 1.0
+    return acumulada
+
+def perfiles_mundo() -> List[Tuple[int, float]]:
+    """Perfiles (nivel, efectividad media) distintos de todos los equipos de la base de datos"""
+    perfiles = {(equipo.calcular_nivel_equipo(), equipo.tablas_muestreo().conversion_media)
+                for equipo in base_datos.obtener_todos_los_equipos().values() if equipo.jugadores}
+    return sorted(perfiles)
+
+def construir_tabla_marcadores(ruta: str = RUTA_TABLA, max_goles: int = MAX_GOLES_TABLA) -> int:
+    """Calcula la tabla para todos los pares de perfiles del mundo y la guarda en ruta"""
+    perfiles = perfiles_mundo()
+    # Se escribe aparte y se reemplaza de una vez: otro proceso nunca mapea un archivo a medias
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    try:
+        with open(temporal, "wb") as f:
+            f.write(struct.pack(_FORMATO_CABECERA, _FIRMA, _VERSION_FORMATO, len(perfiles), max_goles))
+            for nivel, conversion in perfiles:
+                f.write(struct.pack(_FORMATO_PERFIL, nivel, conversion))
+            for nivel1, conversion1 in perfiles:
+                for nivel2, conversion2 in perfiles:
+                    array('d', acumulada_marcador(nivel1, conversion1, nivel2, conversion2, max_goles)).tofile(f)
+        os.replace(temporal, ruta)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    return len(perfiles)
+
+def cargar_tabla_marcadores(ruta: str = RUTA_TABLA) -> Optional[TablaMarcadores]:
+    """Mapea en memoria una tabla construida con construir_tabla_marcadores"""
+    if not os.path.exists(ruta):
+        return None
+
+    with open(ruta, "rb") as f:
+        mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    firma, version, num_perfiles, max_goles = struct.unpack_from(_FORMATO_CABECERA, mapa, 0)
+    if firma != _FIRMA or version != _VERSION_FORMATO:
+        mapa.close()
+        return None
+
+    desplazamiento = struct.calcsize(_FORMATO_CABECERA)
+    perfiles = []
+    for _ in range(num_perfiles):
+        perfiles.append(struct.unpack_from(_FORMATO_PERFIL, mapa, desplazamiento))
+        desplazamiento += struct.calcsize(_FORMATO_PERFIL)
+
+    acumuladas = memoryview(mapa)[desplazamiento:].cast('d')
+    return TablaMarcadores(perfiles, acumuladas, max_goles, mapa)
+
+_tabla_activa: Optional[TablaMarcadores] = None
+_tabla_cargada = False
+_acumuladas_calculadas: Dict[Tuple[int, float, int, float], List[float]] = {}
+
+def obtener_tabla_marcadores() -> Optional[TablaMarcadores]:
+    """
+    Tabla mapeada desde RUTA_TABLA (se carga una sola vez). Si falta se
+    construye antes; si no se puede escribir se avisa y devuelve None.
+    """
+    global _tabla_activa, _tabla_cargada
+    if not _tabla_cargada:
+        _tabla_cargada = True
+        _tabla_activa = cargar_tabla_marcadores()
+        if _tabla_activa is None:
+            print(f"  Construyendo la tabla de marcadores en {RUTA_TABLA} (solo la primera vez)...")
+            try:
+                construir_tabla_marcadores()
+            except OSError as error:
+                print(f"  ⚠️ No se pudo guardar la tabla de marcadores ({error}): "
+                      f"cada par se calcula al vuelo y el motor es más lento")
+            else:
+                _tabla_activa = cargar_tabla_marcadores()
+    return _tabla_activa
+
+def _sortear_marcador(nivel1: int, conversion1: float, nivel2: int, conversion2: float,
+                      rng: rm.Random) -> Tuple[int, int]:
+    """Un uniforme y una búsqueda binaria; un par que no está en la tabla se calcula y se guarda en memoria"""
+    tabla = obtener_tabla_marcadores()
+    if tabla is not None:
+        indice1 = tabla.indice(nivel1, conversion1)
+        indice2 = tabla.indice(nivel2, conversion2)
+        if indice1 >= 0 and indice2 >= 0:
+            return tabla.sortear(indice1, indice2, rng.random())
+
+    clave = (nivel1, conversion1, nivel2, conversion2)
+    acumulada = _acumuladas_calculadas.get(clave)
+    if acumulada is None:
+        acumulada = acumulada_marcador(nivel1, conversion1, nivel2, conversion2)
+        _acumuladas_calculadas[clave] = acumulada
+    celda = bisect_right(acumulada, rng.random(), 0, len(acumulada) - 1)
+    return divmod(celda, MAX_GOLES_TABLA + 1)
+
+@lru_cache(maxsize=None)
+def _parametros_tarjetas(nivel1: int, conversion1: float, nivel2: int, conversion2: float) -> Tuple[float, float]:
+    """Probabilidad de que la tarjeta sea del local y de amarilla en un minuto sin gol"""
+    a, b = probabilidades_gol_minuto(nivel1, nivel2, conversion1, conversion2)
+    nivel1_ajustado, nivel2_ajustado = ajustar_niveles(nivel1, nivel2)
+    p_equipo1 = probabilidad_equipo1(nivel1_ajustado, nivel1_ajustado + nivel2_ajustado)
+    return p_equipo1, P_AMARILLA / (1.0 - a - b)
+
+def _binomial(n: int, p: float, rng: rm.Random) -> int:
+    """Binomial(n, p) contando éxitos con saltos geométricos"""
+    log_fallo = log(1.0 - p)
+    exitos = 0
+    posicion = int(log(1.0 - rng.random()) / log_fallo) + 1
+    while posicion <= n:
+        exitos += 1
+        posicion += int(log(1.0 - rng.random()) / log_fallo) + 1
+    return exitos
+
+def simular_partido_tabla(equipo1: str, equipo2: str, eventos: bool = True,
+                          rng: rm.Random = None) -> Tuple[int, int, List[Dict]]:
+    """
+    Simula un partido sorteando el marcador de la tabla precalculada.
+    Mismo formato de salida y mismos parámetros que simular_partido_con_jugadores.
+    """
+    rng = rng or rm
+    team1 = base_datos.obtener_equipo(equipo1)
+    team2 = base_datos.obtener_equipo(equipo2)
+
+    if not team1 or not team2:
+        return 0, 0, []
+
+    tablas1 = team1.tablas_muestreo()
+    tablas2 = team2.tablas_muestreo()
+    perfil = (team1.calcular_nivel_equipo(), tablas1.conversion_media,
+              team2.calcular_nivel_equipo(), tablas2.conversion_media)
+    gol1, gol2 = _sortear_marcador(*perfil, rng)
+
+    # Actualizar partidos jugados y minutos
+    team1.registrar_partido()
+    team2.registrar_partido()
+
+    # Las tarjetas solo pueden caer en minutos sin gol
+    p_equipo1, p_amarilla = _parametros_tarjetas(*perfil)
+    num_tarjetas = _binomial(MINUTOS_PARTIDO - gol1 - gol2, p_amarilla, rng)
+
+    aleatorio = rng.random
+    lista_eventos = []
+    # Minutos distintos al azar: primero los goles del local, luego los del visitante y las tarjetas
+    minutos = rng.sample(range(1, MINUTOS_PARTIDO + 1), gol1 + gol2 + num_tarjetas) if eventos else None
+
+    for k in range(gol1 + gol2):
+        lado = 0 if k < gol1 else 1
+        tablas = tablas2 if lado else tablas1
+        indice = tablas.sortear_goleador_gol(aleatorio())
+        goleador = tablas.jugadores[indice]
+        indice_asistente = tablas.sortear_asistente(indice, aleatorio())
+        asistente = tablas.jugadores[indice_asistente] if indice_asistente >= 0 else None
+
+        goleador.goles += 1
+        if asistente:
+            asistente.asistencias += 1
+
+        if eventos:
+            lista_eventos.append({
+                'minuto': minutos[k],
+                'tipo': 'gol',
+                'equipo': equipo2 if lado else equipo1,
+                'goleador': goleador.nombre,
+                'asistente': asistente.nombre if asistente else None
+            })
+
+    for k in range(gol1 + gol2, gol1 + gol2 + num_tarjetas):
+        lado = 0 if aleatorio() < p_equipo1 else 1
+        tablas = tablas2 if lado else tablas1
+        if not tablas.amonestables:
+            continue
+        jugador_tarjeta = tablas.jugadores[tablas.amonestables[int(aleatorio() * len(tablas.amonestables))]]
+        jugador_tarjeta.tarjetas_amarillas += 1
+
+        if eventos:
+            lista_eventos.append({
+                'minuto': minutos[k],
+                'tipo': 'tarjeta_amarilla',
+                'equipo': equipo2 if lado else equipo1,
+                'jugador': jugador_tarjeta.nombre
+            })
+
+    if eventos:
+        lista_eventos.sort(key=lambda evento: evento['minuto'])
+    return gol1, gol2, lista_eventos
+
+if __name__ == "__main__":
+    print("Construyendo tabla de marcadores...")
+    num_perfiles = construir_tabla_marcadores()
+    print(f"✅ Tabla con {num_perfiles} perfiles ({num_perfiles ** 2} pares) guardada en: {RUTA_TABLA}")
@@ -0,0 +1,118 @@
+"""
+Registro de motores de simulación de partidos.
+
+Todos los motores comparten la misma interfaz:
+
+    simular_partido(equipo1, equipo2, eventos=True, rng=None) -> (goles1, goles2, eventos)
+
+y opcionalmente una versión por lotes para muchos fixtures a la vez. El motor
+se elige por nombre en cada llamada (liga, grupos, eliminatorias, final), así
+que se puede jugar la liga con un motor rápido y dejar el detallado para las
+copas, o comparar motores sobre los mismos fixtures y semillas.
+
+Comparar motores:
+    python motores.py
+"""
+import random as rm
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from base_datos import base_datos
+from motor_lotes import simular_jornada
+from motor_referencia import simular_partido_con_jugadores
+from motor_saltos import simular_partido_saltos
+from motor_tabla import simular_partido_tabla
+from semillas import derivar_semilla
+
+MOTOR_POR_DEFECTO = "referencia"
+
+@dataclass(frozen=True)
+class MotorPartido:
+    """Un motor de simulación registrado"""
+    nombre: str
+    descripcion: str
+    simular_partido: Callable[..., Tuple[int, int, List[Dict]]]
+    # (equipos, fixtures, eventos, generadores) -> un resultado por fixture
+    simular_lote: Optional[Callable[..., List[Tuple[int, int, List[Dict]]]]] = None
+
+    def simular_fixtures(self, equipos: List[str], fixtures: List[Tuple[int, int]], eventos: bool = False,
+                         generadores: List[rm.Random] = None) -> List[Tuple[int, int, List[Dict]]]:
+        """Simula los fixtures (pares de índices en equipos) con el lote si existe o partido a partido"""
+        if self.simular_lote is not None:
+            return self.simular_lote(equipos, fixtures, eventos=eventos, generadores=generadores)
+        if generadores is None:
+            generadores = [None] * len(fixtures)
+        return [self.simular_partido(equipos[i], equipos[j], eventos, rng)
+                for (i, j), rng in zip(fixtures, generadores)]
+
+_MOTORES: Dict[str, MotorPartido] = {}
+
+def registrar_motor(motor: MotorPartido):
+    """Agrega (o reemplaza) un motor en el registro"""
+    _MOTORES[motor.nombre] = motor
+
+def obtener_motor(nombre: str = MOTOR_POR_DEFECTO) -> MotorPartido:
+    """Motor registrado con ese nombre"""
+    motor = _MOTORES.get(nombre)
+    if motor is None:
+        raise ValueError(f"Motor desconocido: {nombre} (disponibles: {', '.join(motores_disponibles())})")
+    return motor
+
+def motores_disponibles() -> List[str]:
+    """Nombres de los motores registrados, en orden de registro"""
+    return list(_MOTORES)
+
+def _partido_lotes(equipo1: str, equipo2: str, eventos: bool = True,
+                   rng: rm.Random = None) -> Tuple[int, int, List[Dict]]:
+    """Un partido suelto con el motor por lotes"""
+    generadores = [rng] if rng is not None else None
+    return simular_jornada([equipo1, equipo2], [(0, 1)], eventos, generadores=generadores)[0]
+
+registrar_motor(MotorPartido("referencia", "Bucle minuto a minuto original",
+                             simular_partido_con_jugadores))
+registrar_motor(MotorPartido("lotes", "Jornadas completas de una vez (NumPy o módulo array)",
+                             _partido_lotes, simular_jornada))
+registrar_motor(MotorPartido("saltos", "Sortea solo los minutos con eventos",
+                             simular_partido_saltos))
+registrar_motor(MotorPartido("tabla", "Marcador de la tabla precalculada (python motor_tabla.py)",
+                             simular_partido_tabla))
+
+def comparar_motores(equipos: List[str], fixtures: List[Tuple[int, int]], nombres: List[str] = None,
+                     semilla: int = 0) -> List[Dict]:
+    """
+    Simula los mismos fixtures con cada motor y las mismas semillas por partido.
+    Devuelve tiempo por partido y promedios de goles y tarjetas de cada motor.
+    Modifica las estadísticas de temporada: se resetean antes de cada motor.
+    """
+    resultados = []
+    for nombre in nombres or motores_disponibles():
+        motor = obtener_motor(nombre)
+        base_datos.reset_estadisticas_temporada()
+        generadores = [rm.Random(derivar_semilla(semilla, "comparacion", k)) for k in range(len(fixtures))]
+
+        inicio = time.perf_counter()
+        marcadores = motor.simular_fixtures(equipos, fixtures, eventos=False, generadores=generadores)
+        segundos = time.perf_counter() - inicio
+
+        goles = sum(gol1 + gol2 for gol1, gol2, _ in marcadores)
+        tarjetas = sum(base_datos.estadisticas.tarjetas_amarillas)
+        resultados.append({
+            'motor': nombre,
+            'us_por_partido': segundos / len(fixtures) * 1e6,
+            'goles_por_partido': goles / len(fixtures),
+            'amarillas_por_partido': tarjetas / len(fixtures),
+            'victorias_local': sum(gol1 > gol2 for gol1, gol2, _ in marcadores) / len(fixtures),
+        })
+    base_datos.reset_estadisticas_temporada()
+    return resultados
+
+if __name__ == "__main__":
+    # Uno de cada diez cruces posibles entre todos los equipos del mundo
+    equipos = list(base_datos.obtener_ligas_compactas().codigos)
+    fixtures = [(i, j) for i in range(len(equipos)) for j in range(len(equipos)) if i != j][::10]
+    print(f"Comparando motores sobre {len(fixtures)} partidos...")
+    print(f"{'Motor':<12} {'µs/partido':>11} {'Goles':>7} {'Amarillas':>10} {'Local gana':>11}")
+    for fila in comparar_motores(equipos, fixtures):
+        print(f"{fila['motor']:<12} {fila['us_por_partido']:>11.1f} {fila['goles_por_partido']:>7.3f} "
+              f"{fila['amarillas_por_partido']:>10.3f} {fila['victorias_local']:>11.3f}")
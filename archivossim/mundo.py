@@ -0,0 +1,84 @@
+"""
+Datos del mundo: ligas, equipos y plantillas.
+
+Los equipos se leen de mundo.csv (una fila por jugador, en el orden en que se
+crean los equipos) y la primera lectura se compila a mundo.cache con marshal.
+Las ejecuciones siguientes cargan la caché con una sola lectura mientras el
+CSV no cambie (se comparan tamaño y fecha de modificación). Para editar el
+mundo basta con modificar el CSV.
+
+Medir el tiempo de carga:
+    python mundo.py
+"""
+import csv
+import marshal
+import os
+from typing import List, Tuple
+
+_DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+RUTA_MUNDO = os.path.join(_DIRECTORIO, "mundo.csv")
+RUTA_CACHE = os.path.join(_DIRECTORIO, "mundo.cache")
+COLUMNAS = ("codigo", "equipo", "liga", "jugador", "posicion", "nivel")
+_VERSION_CACHE = 1
+
+# (codigo, nombre completo, liga, plantilla [(nombre, posicion, nivel), ...])
+DefinicionEquipo = Tuple[str, str, str, List[Tuple[str, str, int]]]
+
+def leer_mundo_csv(ruta: str = RUTA_MUNDO) -> List[DefinicionEquipo]:
+    """Equipos del CSV en orden; filas consecutivas con el mismo código forman un equipo"""
+    equipos = []
+    with open(ruta, newline="", encoding="utf-8") as f:
+        for fila in csv.DictReader(f):
+            jugador = (fila["jugador"], fila["posicion"], int(fila["nivel"]))
+            if not equipos or equipos[-1][0] != fila["codigo"]:
+                equipos.append((fila["codigo"], fila["equipo"], fila["liga"], []))
+            equipos[-1][3].append(jugador)
+    return equipos
+
+def escribir_mundo_csv(equipos: List[DefinicionEquipo], ruta: str = RUTA_MUNDO):
+    """Guarda las definiciones de equipos en el formato de leer_mundo_csv"""
+    with open(ruta, "w", newline="", encoding="utf-8") as f:
+        escritor = csv.writer(f, lineterminator="\n")
+        escritor.writerow(COLUMNAS)
+        for codigo, nombre, liga, plantilla in equipos:
+            for jugador, posicion, nivel in plantilla:
+                escritor.writerow((codigo, nombre, liga, jugador, posicion, nivel))
+
+def _firma_archivo(ruta: str) -> Tuple[int, int]:
+    estado = os.stat(ruta)
+    return estado.st_size, estado.st_mtime_ns
+
+def cargar_mundo(ruta: str = RUTA_MUNDO, ruta_cache: str = RUTA_CACHE) -> List[DefinicionEquipo]:
+    """Definiciones de equipos desde la caché binaria, regenerándola si el CSV cambió"""
+    firma = _firma_archivo(ruta)
+    try:
+        with open(ruta_cache, "rb") as f:
+            version, firma_cache, equipos = marshal.loads(f.read())
+        if version == _VERSION_CACHE and tuple(firma_cache) == firma:
+            return equipos
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+
+    equipos = leer_mundo_csv(ruta)
+    try:
+        with open(ruta_cache, "wb") as f:
+            f.write(marshal.dumps((_VERSION_CACHE, firma, equipos)))
+    except OSError:
+        pass  # sin permiso de escritura: se relee el CSV la próxima vez
+    return equipos
+
+if __name__ == "__main__":
+    import time
+
+    inicio = time.perf_counter()
+    equipos = leer_mundo_csv()
+    tiempo_csv = time.perf_counter() - inicio
+
+    cargar_mundo()  # asegura la caché
+    inicio = time.perf_counter()
+    cargar_mundo()
+    tiempo_cache = time.perf_counter() - inicio
+
+    print(f"{len(equipos)} equipos, {sum(len(e[3]) for e in equipos)} jugadores")
+    print(f"Lectura del CSV:    {tiempo_csv * 1000:.1f} ms")
+    print(f"Lectura de caché:   {tiempo_cache * 1000:.1f} ms")
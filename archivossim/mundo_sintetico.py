@@ -0,0 +1,114 @@
+"""
+Mundos sintéticos para medir cómo escala el simulador.
+
+generar_mundo crea cualquier cantidad de ligas y equipos con plantillas de
+generar_plantilla_11_jugadores. Cada liga tiene una fuerza media y cada
+equipo se aparta de ella, con la misma media y dispersión de nivel que el
+mundo real (ver PERFIL_NIVELES). Todo sale de un generador derivado por
+hash de (semilla, liga), así que la liga k es la misma aunque cambie la
+cantidad total de ligas. El resultado tiene el formato de mundo.py y se pasa
+directo a BaseDatos(definiciones=...).
+
+Medir construcción y una jornada a 10 y 100 veces el tamaño actual:
+    python mundo_sintetico.py --escala 10
+    python mundo_sintetico.py --escala 100 --motor lotes
+"""
+import argparse
+import random as rm
+import time
+from typing import List
+
+from base_datos import (BaseDatos, PESO_POSICIONES, POSICIONES_PLANTILLA, establecer_base_datos,
+                        generar_plantilla_11_jugadores)
+from mundo import DefinicionEquipo, escribir_mundo_csv
+from semillas import derivar_semilla
+
+# Media y desvío del nivel de equipo en mundo.csv, repartidos entre liga y equipo
+PERFIL_NIVELES = {"media": 71.8, "desvio_liga": 3.0, "desvio_equipo": 4.5, "minimo": 55, "maximo": 88}
+LIGAS_MUNDO_REAL = 15
+EQUIPOS_POR_LIGA = 20
+
+# Nivel de equipo que produce nivel_base con la plantilla genérica (sin contar la variación ±5)
+_FACTOR_PLANTILLA = (sum(PESO_POSICIONES[pos] * mult for _, pos, mult in POSICIONES_PLANTILLA)
+                     / sum(PESO_POSICIONES[pos] for _, pos, _ in POSICIONES_PLANTILLA))
+
+def generar_liga(indice: int, equipos: int = EQUIPOS_POR_LIGA, semilla: int = 0) -> List[DefinicionEquipo]:
+    """Equipos de la liga sintética número indice (determinista por semilla e índice)"""
+    rng = rm.Random(derivar_semilla(semilla, "mundo sintético", indice))
+    nombre_liga = f"Liga Sintética {indice + 1}"
+    media_liga = rng.gauss(PERFIL_NIVELES["media"], PERFIL_NIVELES["desvio_liga"])
+
+    definiciones = []
+    for numero in range(equipos):
+        nivel_equipo = rng.gauss(media_liga, PERFIL_NIVELES["desvio_equipo"])
+        nivel_equipo = max(PERFIL_NIVELES["minimo"], min(PERFIL_NIVELES["maximo"], nivel_equipo))
+        plantilla = generar_plantilla_11_jugadores(round(nivel_equipo / _FACTOR_PLANTILLA), rng)
+        definiciones.append((f"sint_{indice + 1:04d}_{numero + 1:02d}",
+                             f"Sintético {indice + 1}-{numero + 1}", nombre_liga, plantilla))
+    return definiciones
+
+def generar_mundo(ligas: int, equipos_por_liga: int = EQUIPOS_POR_LIGA, semilla: int = 0) -> List[DefinicionEquipo]:
+    """Definiciones de ligas * equipos_por_liga equipos de 11 jugadores"""
+    return [equipo for indice in range(ligas) for equipo in generar_liga(indice, equipos_por_liga, semilla)]
+
+def generar_mundo_escalado(escala: float, semilla: int = 0) -> List[DefinicionEquipo]:
+    """Mundo con escala veces las ligas del mundo real (escala 10 ~ 3000 equipos, 100 ~ 30000)"""
+    return generar_mundo(max(1, round(LIGAS_MUNDO_REAL * escala)), EQUIPOS_POR_LIGA, semilla)
+
+def crear_base_sintetica(escala: float, semilla: int = 0, como_global: bool = False) -> BaseDatos:
+    """BaseDatos con un mundo escalado; con como_global la usan también los motores"""
+    base = BaseDatos(definiciones=generar_mundo_escalado(escala, semilla))
+    if como_global:
+        establecer_base_datos(base)
+    return base
+
+if __name__ == "__main__":
+    import resource
+
+    parser = argparse.ArgumentParser(description="Mundo sintético para pruebas de escala")
+    parser.add_argument("--escala", type=float, default=10, help="Veces el tamaño del mundo real (default: 10)")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla del mundo (default: 0)")
+    parser.add_argument("--motor", default="lotes", help="Motor para la jornada de prueba (default: lotes)")
+    parser.add_argument("--csv", help="Además guardar el mundo en este CSV (formato de mundo.csv)")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    definiciones = generar_mundo_escalado(args.escala, args.semilla)
+    tiempo_generar = time.perf_counter() - inicio
+    if args.csv:
+        escribir_mundo_csv(definiciones, args.csv)
+
+    inicio = time.perf_counter()
+    base = BaseDatos(definiciones=definiciones)
+    tiempo_base = time.perf_counter() - inicio
+    establecer_base_datos(base)
+
+    from motores import obtener_motor
+    from semillas import configurar_semilla, generador
+
+    # Una jornada por liga: el primero contra el último, el segundo contra el penúltimo...
+    configurar_semilla(args.semilla)
+    codigos, fixtures, generadores = [], [], []
+    for liga in base.obtener_ligas():
+        equipos = base.obtener_equipos_liga(liga)
+        desplazamiento = len(codigos)
+        codigos.extend(equipos)
+        for i in range(len(equipos) // 2):
+            fixtures.append((desplazamiento + i, desplazamiento + len(equipos) - 1 - i))
+            generadores.append(generador(liga, "prueba", equipos[i], equipos[-1 - i]))
+    inicio = time.perf_counter()
+    obtener_motor(args.motor).simular_fixtures(codigos, fixtures, generadores=generadores)
+    tiempo_jornada = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    base.reset_estadisticas_temporada()
+    tiempo_reset = time.perf_counter() - inicio
+
+    print(f"{len(base.obtener_ligas())} ligas, {len(base.equipos_por_id)} equipos, "
+          f"{len(base.jugadores_por_id)} jugadores")
+    print(f"Generar definiciones:  {tiempo_generar * 1000:9.1f} ms")
+    print(f"Construir BaseDatos:   {tiempo_base * 1000:9.1f} ms")
+    print(f"Jornada ({len(fixtures)} partidos, motor {args.motor}): {tiempo_jornada * 1000:9.1f} ms "
+          f"({tiempo_jornada / len(fixtures) * 1e6:.1f} µs por partido)")
+    print(f"Reset de temporada:    {tiempo_reset * 1000:9.3f} ms")
+    print(f"Memoria máxima:        {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:9.1f} MB")
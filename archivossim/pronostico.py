@@ -0,0 +1,173 @@
+"""
+Pronóstico analítico de partidos.
+
+El bucle minuto a minuto de simular_partido_con_jugadores es lo bastante simple
+como para calcular la distribución exacta del marcador: cada minuto produce como
+mucho un gol, del local con probabilidad P_OPORTUNIDAD * p1 * c1 y del visitante
+con P_OPORTUNIDAD * (1 - p1) * c2, donde p1 sale de los niveles ajustados y c1, c2
+son las efectividades medias de cada plantilla. El marcador sigue entonces una
+multinomial sobre los 90 minutos. Los resultados se memorizan por niveles y
+efectividades, de modo que los pronósticos de tablas y cuadros no necesitan
+simular partidos.
+
+pronosticar_tabla sortea cada partido de una liga desde su matriz exacta y
+arma la tabla final miles de veces sobre una misma TablaPosiciones, para dar
+la probabilidad de cada equipo de terminar en cada puesto.
+
+Pronóstico de la tabla final de una liga:
+    python pronostico.py "Liga Uruguaya" --simulaciones 2000
+"""
+import random as rm
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from math import comb
+from typing import Dict, Iterable, Sequence, Tuple
+
+from base_datos import base_datos
+from tabla_posiciones import TablaPosiciones
+from modelo_partido import MINUTOS_PARTIDO, P_OPORTUNIDAD, ajustar_niveles, probabilidad_equipo1
+
+MAX_GOLES_MATRIZ = 10
+TOLERANCIA_COLA = 1e-15
+
+@dataclass(frozen=True)
+class PronosticoPartido:
+    """Probabilidades de un partido: 1X2 exacto y matriz de marcadores truncada"""
+    local: float
+    empate: float
+    visitante: float
+    marcador: Tuple[Tuple[float, ...], ...]  # marcador[i][j] = P(local i - j visitante)
+
+    def probabilidad_marcador(self, goles1: int, goles2: int) -> float:
+        """Probabilidad de un marcador concreto (0 fuera de la matriz truncada)"""
+        if goles1 < len(self.marcador) and goles2 < len(self.marcador):
+            return self.marcador[goles1][goles2]
+        return 0.0
+
+def probabilidades_gol_minuto(nivel1: int, nivel2: int, conversion1: float, conversion2: float) -> Tuple[float, float]:
+    """Probabilidad por minuto de gol del local y del visitante"""
+    nivel1_ajustado, nivel2_ajustado = ajustar_niveles(nivel1, nivel2)
+    p_equipo1 = probabilidad_equipo1(nivel1_ajustado, nivel1_ajustado + nivel2_ajustado)
+    return P_OPORTUNIDAD * p_equipo1 * conversion1, P_OPORTUNIDAD * (1 - p_equipo1) * conversion2
+
+@lru_cache(maxsize=None)
+def pronostico_niveles(nivel1: int, nivel2: int, conversion1: float, conversion2: float,
+                       max_goles: int = MAX_GOLES_MATRIZ) -> PronosticoPartido:
+    """Pronóstico exacto para dos equipos dados sus niveles y efectividades medias"""
+    a, b = probabilidades_gol_minuto(nivel1, nivel2, conversion1, conversion2)
+    p_gol = a + b
+    q_local = a / p_gol if p_gol > 0 else 0.5
+
+    local = empate = visitante = 0.0
+    marcador = [[0.0] * (max_goles + 1) for _ in range(max_goles + 1)]
+
+    # Total de goles ~ Binomial(90, a + b); dado el total, el reparto es Binomial(total, q_local)
+    for total in range(MINUTOS_PARTIDO + 1):
+        p_total = comb(MINUTOS_PARTIDO, total) * p_gol ** total * (1 - p_gol) ** (MINUTOS_PARTIDO - total)
+        if p_total < TOLERANCIA_COLA and total > MINUTOS_PARTIDO * p_gol:
+            break
+        for goles1 in range(total + 1):
+            goles2 = total - goles1
+            p = p_total * comb(total, goles1) * q_local ** goles1 * (1 - q_local) ** goles2
+            if goles1 > goles2:
+                local += p
+            elif goles1 < goles2:
+                visitante += p
+            else:
+                empate += p
+            if goles1 <= max_goles and goles2 <= max_goles:
+                marcador[goles1][goles2] = p
+
+    return PronosticoPartido(local, empate, visitante, tuple(tuple(fila) for fila in marcador))
+
+def pronosticar_partido(equipo1: str, equipo2: str, max_goles: int = MAX_GOLES_MATRIZ) -> PronosticoPartido:
+    """Pronóstico exacto de equipo1 (local) contra equipo2 sin simular el partido"""
+    team1 = base_datos.obtener_equipo(equipo1)
+    team2 = base_datos.obtener_equipo(equipo2)
+
+    if not team1 or not team2:
+        return PronosticoPartido(0.0, 1.0, 0.0, ((1.0,),))
+
+    return pronostico_niveles(team1.calcular_nivel_equipo(), team2.calcular_nivel_equipo(),
+                              team1.tablas_muestreo().conversion_media,
+                              team2.tablas_muestreo().conversion_media, max_goles)
+
+@dataclass(frozen=True)
+class PronosticoTabla:
+    """Resultado de pronosticar_tabla"""
+    equipos: Tuple[str, ...]
+    posiciones: Tuple[Tuple[float, ...], ...]  # posiciones[i][p] = P(equipo i termina en el puesto p + 1)
+    puntos_esperados: Tuple[float, ...]
+
+    def probabilidad_campeon(self) -> Dict[str, float]:
+        return {codigo: filas[0] for codigo, filas in zip(self.equipos, self.posiciones)}
+
+    @classmethod
+    def desde_tablas(cls, equipos: Sequence[str], tablas: Iterable[TablaPosiciones]) -> "PronosticoTabla":
+        """Frecuencia de cada puesto y puntos medios sobre tablas finales sorteadas (puede ser la misma, rellenada)"""
+        n = len(equipos)
+        conteos = [[0] * n for _ in range(n)]
+        puntos = [0] * n
+        simulaciones = 0
+        for tabla in tablas:
+            for i, puesto in enumerate(tabla.posiciones()):
+                conteos[i][puesto - 1] += 1
+            puntos = list(map(int.__add__, puntos, tabla.puntos))
+            simulaciones += 1
+        simulaciones = max(simulaciones, 1)
+        return cls(tuple(equipos),
+                   tuple(tuple(c / simulaciones for c in fila) for fila in conteos),
+                   tuple(p / simulaciones for p in puntos))
+
+def pronosticar_tabla(equipos: Sequence[str], simulaciones: int = 1000, semilla: int = 0) -> PronosticoTabla:
+    """
+    Tabla final de una liga todos contra todos (ida y vuelta) por Monte Carlo:
+    cada marcador se sortea de la matriz exacta de pronosticar_partido
+    (renormalizada tras truncarla), sin simular minuto a minuto.
+    """
+    equipos = list(equipos)
+    n = len(equipos)
+    rng = rm.Random(semilla)
+    locales = [i for i in range(n) for j in range(n) if i != j]
+    visitantes = [j for i in range(n) for j in range(n) if i != j]
+
+    # Por partido, los sorteos de todas las simulaciones de una vez (índice plano de la matriz)
+    sorteos = []
+    for i, j in zip(locales, visitantes):
+        marcador = pronosticar_partido(equipos[i], equipos[j]).marcador
+        acumuladas = list(accumulate(p for fila in marcador for p in fila))
+        sorteos.append(rng.choices(range(len(acumuladas)), cum_weights=acumuladas, k=simulaciones))
+    ancho = len(marcador) if sorteos else 1
+
+    def tablas():
+        tabla = TablaPosiciones(equipos)
+        for k in range(simulaciones):
+            celdas = [sorteo[k] for sorteo in sorteos]
+            tabla.reiniciar()
+            tabla.sumar_partidos(locales, visitantes, [c // ancho for c in celdas], [c % ancho for c in celdas])
+            yield tabla
+
+    return PronosticoTabla.desde_tablas(equipos, tablas())
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Pronóstico de la tabla final de una liga")
+    parser.add_argument("liga", nargs="?", default="Liga Uruguaya")
+    parser.add_argument("--simulaciones", type=int, default=1000, help="Tablas sorteadas (default: 1000)")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    equipos = base_datos.obtener_equipos_liga(args.liga)
+    if not equipos:
+        raise SystemExit(f"Liga desconocida: {args.liga}")
+    inicio = time.perf_counter()
+    pronostico = pronosticar_tabla(equipos, args.simulaciones, args.semilla)
+    duracion = time.perf_counter() - inicio
+    print(f"{args.liga}: {args.simulaciones} tablas en {duracion:.2f} s\n")
+    print(f"{'Equipo':<12} {'Pts esp.':>8} {'Campeón':>8} {'Top 4':>7}")
+    for i in sorted(range(len(equipos)), key=lambda i: pronostico.puntos_esperados[i], reverse=True):
+        print(f"{equipos[i].upper():<12} {pronostico.puntos_esperados[i]:>8.1f} "
+              f"{pronostico.posiciones[i][0]:>8.1%} {sum(pronostico.posiciones[i][:4]):>7.1%}")
@@ -0,0 +1,161 @@
+"""
+Registro compacto de eventos de partido.
+
+En lugar de un diccionario por evento con el nombre del jugador repetido, los
+eventos se guardan en columnas paralelas del módulo array (partido, minuto,
+tipo, equipo, jugador, asistente) con equipos y jugadores internados como
+enteros. Cada evento ocupa unos 18 bytes. Iterar el registro devuelve vistas
+de solo lectura con las mismas claves que los diccionarios de
+simular_partido_con_jugadores, así que el código de reportes puede leerlas sin
+cambios.
+"""
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Sequence
+
+from base_datos import Jugador
+
+TIPOS_EVENTO = ("gol", "tarjeta_amarilla", "tarjeta_roja")
+TIPO_GOL, TIPO_AMARILLA, TIPO_ROJA = range(len(TIPOS_EVENTO))
+_CODIGO_TIPO = {nombre: codigo for codigo, nombre in enumerate(TIPOS_EVENTO)}
+
+_CLAVES_GOL = ("minuto", "tipo", "equipo", "goleador", "asistente")
+_CLAVES_TARJETA = ("minuto", "tipo", "equipo", "jugador")
+
+class VistaEvento(Mapping):
+    """Vista tipo diccionario de un evento del registro"""
+    __slots__ = ("_registro", "_indice")
+
+    def __init__(self, registro: "RegistroEventos", indice: int):
+        self._registro = registro
+        self._indice = indice
+
+    @property
+    def partido(self) -> int:
+        return self._registro.partido[self._indice]
+
+    def _claves(self):
+        return _CLAVES_GOL if self._registro.tipo[self._indice] == TIPO_GOL else _CLAVES_TARJETA
+
+    def __getitem__(self, clave: str):
+        registro, i = self._registro, self._indice
+        tipo = registro.tipo[i]
+        if clave == "minuto":
+            return registro.minuto[i]
+        if clave == "tipo":
+            return TIPOS_EVENTO[tipo]
+        if clave == "equipo":
+            return registro.equipos[registro.equipo[i]]
+        if tipo == TIPO_GOL:
+            if clave == "goleador":
+                return registro.jugadores[registro.jugador[i]].nombre
+            if clave == "asistente":
+                asistente = registro.asistente[i]
+                return registro.jugadores[asistente].nombre if asistente >= 0 else None
+        elif clave == "jugador":
+            return registro.jugadores[registro.jugador[i]].nombre
+        raise KeyError(clave)
+
+    def __iter__(self):
+        return iter(self._claves())
+
+    def __len__(self):
+        return len(self._claves())
+
+    def __repr__(self):
+        return repr(dict(self))
+
+class RegistroEventos:
+    """Eventos de muchos partidos en columnas tipadas con equipos y jugadores internados"""
+
+    def __init__(self):
+        self.partido = array('i')
+        self.minuto = array('B')
+        self.tipo = array('B')
+        self.equipo = array('i')
+        self.jugador = array('i')
+        self.asistente = array('i')   # -1 = sin asistencia / no aplica
+        self.num_partidos = 0
+
+        self.equipos: List[str] = []
+        self.jugadores: List[Jugador] = []
+        self._id_equipo: Dict[str, int] = {}
+        self._id_jugador: Dict[int, int] = {}   # id(jugador) -> índice
+
+    def id_equipo(self, codigo: str) -> int:
+        """Entero internado de un equipo"""
+        indice = self._id_equipo.get(codigo)
+        if indice is None:
+            indice = len(self.equipos)
+            self._id_equipo[codigo] = indice
+            self.equipos.append(codigo)
+        return indice
+
+    def id_jugador(self, jugador: Jugador) -> int:
+        """Entero internado de un jugador"""
+        indice = self._id_jugador.get(id(jugador))
+        if indice is None:
+            indice = len(self.jugadores)
+            self._id_jugador[id(jugador)] = indice
+            self.jugadores.append(jugador)
+        return indice
+
+    def reservar_partidos(self, cantidad: int) -> int:
+        """Reserva ids de partido consecutivos y devuelve el primero"""
+        inicio = self.num_partidos
+        self.num_partidos += cantidad
+        return inicio
+
+    def agregar(self, partido: int, minuto: int, tipo: str, equipo: str,
+                jugador: Jugador, asistente: Jugador = None):
+        """Agrega un evento suelto"""
+        self.partido.append(partido)
+        self.minuto.append(minuto)
+        self.tipo.append(_CODIGO_TIPO[tipo])
+        self.equipo.append(self.id_equipo(equipo))
+        self.jugador.append(self.id_jugador(jugador))
+        self.asistente.append(self.id_jugador(asistente) if asistente else -1)
+
+    def agregar_dict(self, partido: int, evento: Dict, plantilla: Sequence[Jugador]):
+        """Agrega un evento en el formato de diccionario buscando los jugadores por nombre en plantilla"""
+        por_nombre = {j.nombre: j for j in plantilla}
+        if evento['tipo'] == 'gol':
+            asistente = por_nombre.get(evento['asistente']) if evento['asistente'] else None
+            self.agregar(partido, evento['minuto'], 'gol', evento['equipo'],
+                         por_nombre[evento['goleador']], asistente)
+        else:
+            self.agregar(partido, evento['minuto'], evento['tipo'], evento['equipo'],
+                         por_nombre[evento['jugador']])
+
+    def extender(self, partidos: Sequence[int], minutos: Sequence[int], tipos: Sequence[int],
+                 equipos: Sequence[int], jugadores: Sequence[int], asistentes: Sequence[int]):
+        """Agrega columnas completas de eventos ya internados (códigos de tipo e ids enteros)"""
+        self.partido.extend(partidos)
+        self.minuto.extend(minutos)
+        self.tipo.extend(tipos)
+        self.equipo.extend(equipos)
+        self.jugador.extend(jugadores)
+        self.asistente.extend(asistentes)
+
+    def __len__(self) -> int:
+        return len(self.partido)
+
+    def __getitem__(self, indice: int) -> VistaEvento:
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError(indice)
+        return VistaEvento(self, indice)
+
+    def __iter__(self) -> Iterator[VistaEvento]:
+        for indice in range(len(self)):
+            yield VistaEvento(self, indice)
+
+    def eventos_partido(self, partido: int) -> List[VistaEvento]:
+        """Eventos de un partido en orden de registro"""
+        return [VistaEvento(self, i) for i, p in enumerate(self.partido) if p == partido]
+
+    def bytes_ocupados(self) -> int:
+        """Memoria usada por las columnas"""
+        return sum(len(columna) * columna.itemsize for columna in
+                   (self.partido, self.minuto, self.tipo, self.equipo, self.jugador, self.asistente))
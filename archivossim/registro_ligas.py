@@ -0,0 +1,121 @@
+"""
+Registro de ligas mantenido incrementalmente.
+
+Guarda los equipos de cada liga en orden (códigos e ids enteros) y se
+actualiza equipo por equipo cuando uno se agrega, cambia de liga (ascensos,
+descensos) o sale. Ofrece dos vistas cacheadas:
+
+  - como_diccionario(): la forma histórica {liga: {código: nivel}} de
+    BaseDatos.obtener_ligas, reconstruida solo si cambió la estructura o
+    algún nivel (Jugador.version_niveles o una transferencia).
+  - compacta(): arrays contiguos al estilo CSR (ids de equipo de todas las
+    ligas seguidos y el inicio de cada liga) con sus niveles, para los
+    motores que trabajan con índices.
+"""
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+@dataclass(frozen=True)
+class LigasCompactas:
+    """Todas las ligas en arrays: la liga k ocupa equipos[inicios[k]:inicios[k + 1]]"""
+    nombres: Tuple[str, ...]
+    inicios: array      # 'l', len(nombres) + 1
+    equipos: array      # 'l', ids de equipo (Equipo.id)
+    codigos: Tuple[str, ...]
+    niveles: array      # 'l', nivel de cada equipo en el mismo orden
+
+    def liga(self, k: int) -> slice:
+        return slice(self.inicios[k], self.inicios[k + 1])
+
+class RegistroLigas:
+    """Equipos por liga en orden, con vistas cacheadas"""
+
+    def __init__(self):
+        self._codigos: Dict[str, List[str]] = {}
+        self._ids: Dict[str, array] = {}
+        self._liga_de: Dict[str, str] = {}
+        self.version = 0  # cambia con cada alta, baja o movimiento
+        self._diccionario = None  # ((version, version de niveles), {liga: {código: nivel}})
+        self._compacta = None     # ((version, version de niveles), LigasCompactas)
+
+    def agregar_equipo(self, liga: str, codigo: str, id_equipo: int, posicion: int = None):
+        """Agrega el equipo al final de la liga (o en la posición dada)"""
+        if codigo in self._liga_de:
+            raise ValueError(f"El equipo {codigo} ya está en {self._liga_de[codigo]}")
+        codigos = self._codigos.setdefault(liga, [])
+        ids = self._ids.setdefault(liga, array('l'))
+        if posicion is None:
+            posicion = len(codigos)
+        codigos.insert(posicion, codigo)
+        ids.insert(posicion, id_equipo)
+        self._liga_de[codigo] = liga
+        self.version += 1
+
+    def quitar_equipo(self, codigo: str) -> Tuple[str, int]:
+        """Saca al equipo de su liga; devuelve (liga, id). Una liga vacía desaparece"""
+        liga = self._liga_de.pop(codigo)
+        posicion = self._codigos[liga].index(codigo)
+        del self._codigos[liga][posicion]
+        id_equipo = self._ids[liga].pop(posicion)
+        if not self._codigos[liga]:
+            del self._codigos[liga], self._ids[liga]
+        self.version += 1
+        return liga, id_equipo
+
+    def mover_equipo(self, codigo: str, liga_nueva: str, posicion: int = None):
+        """Cambia al equipo de liga (ascenso, descenso), al final de la nueva o en la posición dada"""
+        _, id_equipo = self.quitar_equipo(codigo)
+        self.agregar_equipo(liga_nueva, codigo, id_equipo, posicion)
+
+    def invalidar(self):
+        """Fuerza a reconstruir las vistas (por ejemplo tras cambiar una plantilla)"""
+        self.version += 1
+
+    def estado(self) -> Tuple[Tuple[str, Tuple[str, ...], array], ...]:
+        """(liga, códigos, ids) de cada liga en orden, para volver a él con restablecer"""
+        return tuple((liga, tuple(codigos), array('l', self._ids[liga])) for liga, codigos in self._codigos.items())
+
+    def restablecer(self, estado: Tuple[Tuple[str, Tuple[str, ...], array], ...]):
+        """Vuelve a un estado tomado con estado()"""
+        self._codigos = {liga: list(codigos) for liga, codigos, _ in estado}
+        self._ids = {liga: array('l', ids) for liga, _, ids in estado}
+        self._liga_de = {codigo: liga for liga, codigos, _ in estado for codigo in codigos}
+        self.version += 1
+
+    def ligas(self) -> List[str]:
+        return list(self._codigos)
+
+    def liga_de(self, codigo: str) -> str:
+        return self._liga_de.get(codigo)
+
+    def codigos(self, liga: str) -> List[str]:
+        """Códigos de la liga en orden (copia)"""
+        return list(self._codigos.get(liga, ()))
+
+    def indices(self, liga: str) -> array:
+        """Ids de equipo de la liga en orden (copia)"""
+        return array('l', self._ids.get(liga, ()))
+
+    def como_diccionario(self, nivel: Callable[[int], int], version_niveles: int) -> Dict[str, Dict[str, int]]:
+        """{liga: {código: nivel}} con nivel(id de equipo); se reconstruye solo si cambió algo"""
+        clave = (self.version, version_niveles)
+        if self._diccionario is None or self._diccionario[0] != clave:
+            self._diccionario = (clave, {
+                liga: {codigo: nivel(id_equipo) for codigo, id_equipo in zip(codigos, self._ids[liga])}
+                for liga, codigos in self._codigos.items()})
+        # Copia de dos niveles: quien la recibe puede modificarla sin tocar la caché
+        return {liga: dict(equipos) for liga, equipos in self._diccionario[1].items()}
+
+    def compacta(self, nivel: Callable[[int], int], version_niveles: int) -> LigasCompactas:
+        """Vista en arrays de todas las ligas; se reconstruye solo si cambió algo"""
+        clave = (self.version, version_niveles)
+        if self._compacta is None or self._compacta[0] != clave:
+            inicios, equipos, codigos = array('l', [0]), array('l'), []
+            for liga, ids in self._ids.items():
+                equipos.extend(ids)
+                codigos.extend(self._codigos[liga])
+                inicios.append(len(equipos))
+            self._compacta = (clave, LigasCompactas(tuple(self._codigos), inicios, equipos, tuple(codigos),
+                                                    array('l', map(nivel, equipos))))
+        return self._compacta[1]
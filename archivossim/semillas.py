@@ -0,0 +1,40 @@
+"""
+Semillas deterministas por partido.
+
+Con una semilla de temporada configurada, cada partido (o sorteo) obtiene su
+propio generador random.Random derivado por hash de (semilla de temporada,
+competición, ronda, local, visitante). Así el resultado de un partido no
+depende del orden en que se simulen los demás, y una temporada con --seed es
+idéntica bit a bit aunque las ligas se repartan entre procesos o se simulen en
+otro orden. Sin semilla configurada se usa el generador global del módulo
+random, como siempre.
+"""
+import hashlib
+import random as rm
+from typing import Optional
+
+_semilla_temporada: Optional[int] = None
+
+def configurar_semilla(semilla: Optional[int]):
+    """Fija la semilla de temporada (None vuelve al generador global)"""
+    global _semilla_temporada
+    _semilla_temporada = semilla
+
+def semilla_activa() -> Optional[int]:
+    """Semilla de temporada configurada, o None"""
+    return _semilla_temporada
+
+def derivar_semilla(semilla: int, *claves) -> int:
+    """Semilla de 128 bits derivada por hash de la semilla de temporada y las claves"""
+    texto = repr((semilla,) + tuple(str(clave) for clave in claves)).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(texto, digest_size=16).digest(), "little")
+
+def generador(*claves) -> rm.Random:
+    """
+    Generador independiente para las claves dadas, por ejemplo
+    generador("Premier League", "liga", "mc", "liv"). Sin semilla de temporada
+    devuelve el módulo random (mismo interfaz que random.Random).
+    """
+    if _semilla_temporada is None:
+        return rm
+    return rm.Random(derivar_semilla(_semilla_temporada, *claves))
@@ -1,218 +1,50 @@
-import random as rm
-from collections import defaultdict
+import argparse
 from datetime import datetime
 from typing import List, Tuple, Dict
-from base_datos import base_datos, Jugador, Equipo
+from base_datos import base_datos
+from calendario import generar_calendario
+# Reexportados por compatibilidad: el motor de referencia vivía en este módulo
+from motor_referencia import simular_partido_con_jugadores, seleccionar_goleador_y_asistente
+from motores import MOTOR_POR_DEFECTO, motores_disponibles, obtener_motor
+from semillas import configurar_semilla, generador
+from tabla_posiciones import TablaPosiciones
 
-def simular_partido_con_jugadores(equipo1: str, equipo2: str) -> Tuple[int, int, List[Dict]]:
+def simular_liga_con_jugadores(nombre_liga: str, equipos_dict: Dict[str, int],
+                               motor: str = MOTOR_POR_DEFECTO,
+                               partidos: List[Tuple[str, str, int, int]] = None) -> List[Tuple[str, Dict]]:
     """
-    Simula un partido entre dos equipos con estadísticas REALISTAS
+    Simula una liga completa registrando estadísticas de jugadores con el motor
+    indicado (ver motores.py); los motores con versión por lotes simulan todos
+    los partidos de una vez. El orden es el del calendario de calendario.py;
+    para seguir la liga jornada a jornada usar calendario.simular_jornadas.
+    Cada partido usa su propio generador (semillas.generador), así que con --seed
+    cada partido da el mismo resultado sin importar el orden en que se simulen.
+    Si se pasa la lista partidos, se le agrega (local, visitante, goles local,
+    goles visitante) por cada partido.
     """
-    team1 = base_datos.obtener_equipo(equipo1)
-    team2 = base_datos.obtener_equipo(equipo2)
-    
-    if not team1 or not team2:
-        return 0, 0, []
-    
-    nivel1 = team1.calcular_nivel_equipo()
-    nivel2 = team2.calcular_nivel_equipo()
-    
-    # Factor de ventaja por diferencia de nivel
-    diferencia_nivel = abs(nivel1 - nivel2)
-    factor_ventaja = 1 + (diferencia_nivel / 40)
-    
-    if nivel1 > nivel2:
-        nivel1_ajustado = nivel1 * factor_ventaja
-        nivel2_ajustado = nivel2 / factor_ventaja
-    else:
-        nivel1_ajustado = nivel1 / factor_ventaja
-        nivel2_ajustado = nivel2 * factor_ventaja
-    
-    gol1, gol2 = 0, 0
-    eventos = []
-    sumalevel = nivel1_ajustado + nivel2_ajustado
-    
-    # Actualizar partidos jugados y minutos
-    for jugador in team1.jugadores:
-        jugador.partidos_jugados += 1
-        jugador.minutos_jugados += 90
-        
-    for jugador in team2.jugadores:
-        jugador.partidos_jugados += 1
-        jugador.minutos_jugados += 90
-    
-    # SIMULACIÓN CON ESTADÍSTICAS REALISTAS
-    oportunidades_equipo1 = 0
-    oportunidades_equipo2 = 0
-    
-    for minuto in range(1, 91):
-        prob = rm.randint(1, 200)
-        
-        # OPORTUNIDADES DE GOL REALISTAS (2.5% por minuto = ~2.25 por partido)
-        if prob > 195:  # 2.5% de probabilidad
-            prob2 = rm.randint(0, int(sumalevel))
-            
-            equipo_atacante = team1 if prob2 <= nivel1_ajustado else team2
-            goleador, asistente = seleccionar_goleador_y_asistente(equipo_atacante)
-            
-            if goleador:
-                # Registrar la oportunidad (para estadísticas)
-                if equipo_atacante == team1:
-                    oportunidades_equipo1 += 1
-                else:
-                    oportunidades_equipo2 += 1
-                
-                # PROBABILIDAD DE CONVERSIÓN REALISTA
-                # Mejores delanteros: 25-35% de efectividad
-                efectividad_base = 0.25
-                bonus_nivel = (goleador.nivel - 80) / 100  # +0.15 para jugadores de nivel 95
-                probabilidad_gol = min(0.40, max(0.15, efectividad_base + bonus_nivel))
-                
-                if rm.random() < probabilidad_gol:
-                    goleador.goles += 1
-                    if equipo_atacante == team1:
-                        gol1 += 1
-                    else:
-                        gol2 += 1
-                    
-                    evento = {
-                        'minuto': minuto,
-                        'tipo': 'gol',
-                        'equipo': equipo1 if equipo_atacante == team1 else equipo2,
-                        'goleador': goleador.nombre,
-                        'asistente': asistente.nombre if asistente else None
-                    }
-                    eventos.append(evento)
-                    
-                    if asistente:
-                        asistente.asistencias += 1
-        
-        # Tarjetas (proporcionales)
-        if prob < 8:  # 4% para amarilla
-            equipo_tarjeta = team1 if rm.randint(0, int(sumalevel)) <= nivel1_ajustado else team2
-            jugador_tarjeta = rm.choice([j for j in equipo_tarjeta.jugadores if j.posicion in ["DEF", "MED"]])
-            jugador_tarjeta.tarjetas_amarillas += 1
-            eventos.append({
-                'minuto': minuto,
-                'tipo': 'tarjeta_amarilla',
-                'equipo': equipo1 if equipo_tarjeta == team1 else equipo2,
-                'jugador': jugador_tarjeta.nombre
-            })
-        elif prob == 1:  # 0.5% para roja
-            equipo_tarjeta = team1 if rm.randint(0, int(sumalevel)) <= nivel1_ajustado else team2
-            jugador_tarjeta = rm.choice(equipo_tarjeta.jugadores)
-            jugador_tarjeta.tarjetas_rojas += 1
-            eventos.append({
-                'minuto': minuto,
-                'tipo': 'tarjeta_roja',
-                'equipo': equipo1 if equipo_tarjeta == team1 else equipo2,
-                'jugador': jugador_tarjeta.nombre
-            })
-    
-    return gol1, gol2, eventos
-
-def seleccionar_goleador_y_asistente(equipo: Equipo) -> Tuple[Jugador, Jugador]:
-    """
-    Selecciona quién marca el gol y quién da la asistencia - versión más realista
-    """
-    # Probabilidades por posición y nivel
-    prob_gol = {
-        "DEL": 0.7,  # Delanteros más probables
-        "MED": 0.25, # Mediocampistas
-        "DEF": 0.04, # Defensores
-        "POR": 0.01  # Porteros (muy raro)
-    }
-    
-    prob_asist = {
-        "MED": 0.6,  # Mediocampistas más asistentes
-        "DEL": 0.3,  # Delanteros
-        "DEF": 0.08, # Defensores
-        "POR": 0.02  # Porteros
-    }
-    
-    # Ordenar jugadores por nivel (mejores jugadores más probables)
-    jugadores_ordenados = sorted(equipo.jugadores, key=lambda x: x.nivel, reverse=True)
-    
-    # Seleccionar goleador - los mejores jugadores tienen más probabilidad
-    goleador = None
-    for jugador in jugadores_ordenados:
-        prob_posicion = prob_gol.get(jugador.posicion, 0.1)
-        prob_nivel = jugador.nivel / 100.0
-        prob_final = prob_posicion * prob_nivel * 1.8  # Más realista
-        
-        if rm.random() < prob_final:
-            goleador = jugador
-            break
-    
-    if not goleador:  # Fallback: mejor jugador del equipo
-        goleador = jugadores_ordenados[0]
-    
-    # Seleccionar asistente (diferente al goleador)
-    asistente = None
-    jugadores_sin_goleador = [j for j in jugadores_ordenados if j != goleador]
-    
-    for jugador in jugadores_sin_goleador:
-        prob_posicion = prob_asist.get(jugador.posicion, 0.1)
-        prob_nivel = jugador.nivel / 100.0
-        prob_final = prob_posicion * prob_nivel * 1.5
-        
-        if rm.random() < prob_final:
-            asistente = jugador
-            break
-    
-    # 30% de posibilidad de que no haya asistencia registrada (más realista)
-    if rm.random() < 0.3:
-        asistente = None
-    
-    return goleador, asistente
-
-def simular_liga_con_jugadores(nombre_liga: str, equipos_dict: Dict[str, int]) -> List[Tuple[str, Dict]]:
-    """Simula una liga completa registrando estadísticas de jugadores"""
     equipos_lista = list(equipos_dict.keys())
-    tabla = defaultdict(lambda: {'puntos': 0, 'gf': 0, 'gc': 0, 'partidos': 0, 'gd': 0})
+    tabla = TablaPosiciones(equipos_lista)
     
     print(f"  Simulando partidos de {nombre_liga}...")
-    partidos_total = len(equipos_lista) * (len(equipos_lista) - 1)
-    partidos_simulados = 0
-    
-    # Todos contra todos (ida y vuelta)
-    for i in range(len(equipos_lista)):
-        for j in range(len(equipos_lista)):
-            if i != j:
-                equipo1 = equipos_lista[i]
-                equipo2 = equipos_lista[j]
-                
-                gol1, gol2, eventos = simular_partido_con_jugadores(equipo1, equipo2)
-                
-                # Actualizar tabla
-                tabla[equipo1]['gf'] += gol1
-                tabla[equipo1]['gc'] += gol2
-                tabla[equipo1]['partidos'] += 1
-                tabla[equipo2]['gf'] += gol2
-                tabla[equipo2]['gc'] += gol1
-                tabla[equipo2]['partidos'] += 1
-                
-                if gol1 > gol2:
-                    tabla[equipo1]['puntos'] += 3
-                elif gol1 < gol2:
-                    tabla[equipo2]['puntos'] += 3
-                else:
-                    tabla[equipo1]['puntos'] += 1
-                    tabla[equipo2]['puntos'] += 1
-                
-                partidos_simulados += 1
-                if partidos_simulados % 100 == 0:
-                    progreso = (partidos_simulados / partidos_total) * 100
-                    print(f"    Progreso: {progreso:.1f}% ({partidos_simulados}/{partidos_total})")
     
-    # Calcular diferencia de goles
-    for equipo in tabla:
-        tabla[equipo]['gd'] = tabla[equipo]['gf'] - tabla[equipo]['gc']
-    
-    # Ordenar tabla
-    tabla_ordenada = sorted(tabla.items(), 
-                           key=lambda x: (x[1]['puntos'], x[1]['gd'], x[1]['gf']), 
-                           reverse=True)
+    # Todos contra todos (ida y vuelta), jornada tras jornada
+    posicion = {codigo: i for i, codigo in enumerate(equipos_lista)}
+    cruces = [cruce for jornada in generar_calendario(equipos_lista) for cruce in jornada]
+    fixtures = [(posicion[local], posicion[visitante]) for local, visitante in cruces]
+    generadores = [generador(nombre_liga, "liga", local, visitante) for local, visitante in cruces]
+    resultados = obtener_motor(motor).simular_fixtures(equipos_lista, fixtures, eventos=False,
+                                                       generadores=generadores)
+    print(f"    {len(resultados)} partidos simulados")
+    
+    # Solo se necesita el marcador (los eventos no se materializan): la tabla se suma de una vez
+    goles_locales = [resultado[0] for resultado in resultados]
+    goles_visitantes = [resultado[1] for resultado in resultados]
+    tabla.sumar_partidos([i for i, _ in fixtures], [j for _, j in fixtures], goles_locales, goles_visitantes)
+    if partidos is not None:
+        partidos.extend(zip([local for local, _ in cruces], [visitante for _, visitante in cruces],
+                            goles_locales, goles_visitantes))
+    
+    tabla_ordenada = tabla.ordenada()
     
     # Registrar campeón de liga
     if tabla_ordenada:
@@ -221,12 +53,16 @@ def simular_liga_con_jugadores(nombre_liga: str, equipos_dict: Dict[str, int]) -
     
     return tabla_ordenada
 
-def simular_eliminatoria_con_jugadores(equipo1: str, equipo2: str) -> Tuple[str, str]:
+def simular_eliminatoria_con_jugadores(equipo1: str, equipo2: str, competicion: str = "",
+                                       motor: str = MOTOR_POR_DEFECTO) -> Tuple[str, str]:
     """Simula una eliminatoria a doble partido registrando estadísticas"""
+    simular_partido = obtener_motor(motor).simular_partido
     # Ida
-    gol1_ida, gol2_ida, eventos_ida = simular_partido_con_jugadores(equipo1, equipo2)
+    gol1_ida, gol2_ida, _ = simular_partido(
+        equipo1, equipo2, eventos=False, rng=generador(competicion, "ida", equipo1, equipo2))
     # Vuelta
-    gol2_vuelta, gol1_vuelta, eventos_vuelta = simular_partido_con_jugadores(equipo2, equipo1)
+    gol2_vuelta, gol1_vuelta, _ = simular_partido(
+        equipo2, equipo1, eventos=False, rng=generador(competicion, "vuelta", equipo2, equipo1))
     
     total1 = gol1_ida + gol1_vuelta
     total2 = gol2_ida + gol2_vuelta
@@ -247,16 +83,18 @@ def simular_eliminatoria_con_jugadores(equipo1: str, equipo2: str) -> Tuple[str,
             # Penales (basado en nivel)
             nivel1 = base_datos.obtener_nivel_equipo(equipo1)
             nivel2 = base_datos.obtener_nivel_equipo(equipo2)
-            prob_pen = rm.randint(0, nivel1 + nivel2)
+            prob_pen = generador(competicion, "penales", equipo1, equipo2).randint(0, nivel1 + nivel2)
             ganador = equipo1 if prob_pen <= nivel1 else equipo2
             return ganador, resultado + f" - {ganador.upper()} por penales"
 
-def simular_final_con_jugadores(equipo1: str, equipo2: str) -> Tuple[str, str]:
+def simular_final_con_jugadores(equipo1: str, equipo2: str, competicion: str = "",
+                                motor: str = MOTOR_POR_DEFECTO) -> Tuple[str, str]:
     """Simula una final registrando estadísticas"""
     nivel1 = base_datos.obtener_nivel_equipo(equipo1)
     nivel2 = base_datos.obtener_nivel_equipo(equipo2)
     
-    goles1, goles2, eventos = simular_partido_con_jugadores(equipo1, equipo2)
+    goles1, goles2, _ = obtener_motor(motor).simular_partido(
+        equipo1, equipo2, eventos=False, rng=generador(competicion, "final", equipo1, equipo2))
     resultado = f"{equipo1.upper()} {goles1}-{goles2} {equipo2.upper()}"
     
     if goles1 > goles2:
@@ -265,7 +103,7 @@ def simular_final_con_jugadores(equipo1: str, equipo2: str) -> Tuple[str, str]:
         return equipo2, resultado
     else:
         # Penales en final
-        prob_pen = rm.randint(0, nivel1 + nivel2)
+        prob_pen = generador(competicion, "final penales", equipo1, equipo2).randint(0, nivel1 + nivel2)
         ganador = equipo1 if prob_pen <= nivel1 else equipo2
         return ganador, resultado + f" - {ganador.upper()} por penales"
 
@@ -331,9 +169,11 @@ def obtener_clasificados_europeos(resultados_ligas: Dict) -> Tuple[List[str], Li
     
     return champions, europa, conference
 
-def simular_fase_grupos(equipos_grupo: List[str], archivo) -> List[str]:
+def simular_fase_grupos(equipos_grupo: List[str], archivo, competicion: str = "",
+                        motor: str = MOTOR_POR_DEFECTO) -> List[str]:
     """Simula una fase de grupos y retorna los 2 mejores equipos"""
-    tabla = defaultdict(lambda: {'puntos': 0, 'gf': 0, 'gc': 0, 'gd': 0})
+    tabla = TablaPosiciones(equipos_grupo)
+    simular_partido = obtener_motor(motor).simular_partido
     
     # Todos contra todos (ida y vuelta)
     for i in range(len(equipos_grupo)):
@@ -342,29 +182,11 @@ def simular_fase_grupos(equipos_grupo: List[str], archivo) -> List[str]:
                 equipo1 = equipos_grupo[i]
                 equipo2 = equipos_grupo[j]
                 
-                gol1, gol2, _ = simular_partido_con_jugadores(equipo1, equipo2)
-                
-                tabla[equipo1]['gf'] += gol1
-                tabla[equipo1]['gc'] += gol2
-                tabla[equipo2]['gf'] += gol2
-                tabla[equipo2]['gc'] += gol1
-                
-                if gol1 > gol2:
-                    tabla[equipo1]['puntos'] += 3
-                elif gol1 < gol2:
-                    tabla[equipo2]['puntos'] += 3
-                else:
-                    tabla[equipo1]['puntos'] += 1
-                    tabla[equipo2]['puntos'] += 1
-    
-    # Calcular diferencia de goles
-    for equipo in tabla:
-        tabla[equipo]['gd'] = tabla[equipo]['gf'] - tabla[equipo]['gc']
-    
-    # Ordenar tabla
-    tabla_ordenada = sorted(tabla.items(), 
-                           key=lambda x: (x[1]['puntos'], x[1]['gd'], x[1]['gf']), 
-                           reverse=True)
+                gol1, gol2, _ = simular_partido(
+                    equipo1, equipo2, eventos=False, rng=generador(competicion, "grupos", equipo1, equipo2))
+                tabla.sumar_partido(i, j, gol1, gol2)
+    
+    tabla_ordenada = tabla.ordenada()
     
     # Mostrar tabla del grupo
     archivo.write(f"{'Pos':<3} {'Equipo':<12} {'Pts':<4} {'GF':<4} {'GC':<4} {'GD':<4}\n")
@@ -374,7 +196,7 @@ def simular_fase_grupos(equipos_grupo: List[str], archivo) -> List[str]:
     # Retornar los 2 primeros
     return [tabla_ordenada[0][0], tabla_ordenada[1][0]]
 
-def simular_champions_league(equipos: List[str], archivo) -> str:
+def simular_champions_league(equipos: List[str], archivo, motor: str = MOTOR_POR_DEFECTO) -> str:
     """Simula la Champions League completa con exactamente 32 equipos"""
     archivo.write(f"\n{'='*80}\n")
     archivo.write("🏆 CHAMPIONS LEAGUE 2024/25 (32 equipos)\n")
@@ -382,7 +204,7 @@ def simular_champions_league(equipos: List[str], archivo) -> str:
     
     # Asegurar exactamente 32 equipos
     equipos_copia = equipos[:32].copy()
-    rm.shuffle(equipos_copia)
+    generador("champions", "sorteo").shuffle(equipos_copia)
     
     archivo.write(f"\n📊 EQUIPOS PARTICIPANTES (32):\n")
     archivo.write("-" * 40 + "\n")
@@ -398,7 +220,7 @@ def simular_champions_league(equipos: List[str], archivo) -> str:
     for grupo in range(8):
         archivo.write(f"\nGrupo {chr(65 + grupo)}:\n")
         equipos_grupo = equipos_copia[grupo*4:(grupo+1)*4]
-        clasificados_grupo = simular_fase_grupos(equipos_grupo, archivo)
+        clasificados_grupo = simular_fase_grupos(equipos_grupo, archivo, "champions", motor)
         octavos.extend(clasificados_grupo)
     
     # Continuar con octavos, cuartos, etc. (el resto del código igual)
@@ -412,7 +234,7 @@ def simular_champions_league(equipos: List[str], archivo) -> str:
     
     for i in range(0, 16, 2):
         equipo1, equipo2 = octavos[i], octavos[i+1]
-        ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2)
+        ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2, "champions", motor)
         cuartos.append(ganador)
         archivo.write(f"{resultado}\n")
         archivo.write(f"✅ Pasa: {ganador.upper()}\n\n")
@@ -424,7 +246,7 @@ def simular_champions_league(equipos: List[str], archivo) -> str:
     
     for i in range(0, 8, 2):
         equipo1, equipo2 = cuartos[i], cuartos[i+1]
-        ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2)
+        ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2, "champions", motor)
         semis.append(ganador)
         archivo.write(f"{resultado}\n")
         archivo.write(f"✅ Pasa: {ganador.upper()}\n\n")
@@ -436,7 +258,7 @@ def simular_champions_league(equipos: List[str], archivo) -> str:
     
     for i in range(0, 4, 2):
         equipo1, equipo2 = semis[i], semis[i+1]
-        ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2)
+        ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2, "champions", motor)
         finalistas.append(ganador)
         archivo.write(f"{resultado}\n")
         archivo.write(f"✅ FINALISTA: {ganador.upper()}\n\n")
@@ -444,14 +266,14 @@ def simular_champions_league(equipos: List[str], archivo) -> str:
     # Final
     archivo.write(f"👑 FINAL CHAMPIONS LEAGUE\n")
     archivo.write("=" * 40 + "\n")
-    campeon, resultado_final = simular_final_con_jugadores(finalistas[0], finalistas[1])
+    campeon, resultado_final = simular_final_con_jugadores(finalistas[0], finalistas[1], "champions", motor)
     archivo.write(f"{resultado_final}\n")
     archivo.write(f"🏆 CAMPEÓN CHAMPIONS LEAGUE: {campeon.upper()}\n")
     
     base_datos.registrar_campeon('champions', campeon)
     return campeon
 
-def simular_europa_league(equipos: List[str], archivo) -> str:
+def simular_europa_league(equipos: List[str], archivo, motor: str = MOTOR_POR_DEFECTO) -> str:
     """Simula la Europa League completa con exactamente 32 equipos"""
     archivo.write(f"\n{'='*80}\n")
     archivo.write("🏅 EUROPA LEAGUE 2024/25 (32 equipos)\n")
@@ -459,7 +281,7 @@ def simular_europa_league(equipos: List[str], archivo) -> str:
     
     # Asegurar exactamente 32 equipos
     equipos_copia = equipos[:32].copy()
-    rm.shuffle(equipos_copia)
+    generador("europa", "sorteo").shuffle(equipos_copia)
     
     archivo.write(f"\n📊 EQUIPOS PARTICIPANTES (32):\n")
     archivo.write("-" * 40 + "\n")
@@ -475,7 +297,7 @@ def simular_europa_league(equipos: List[str], archivo) -> str:
     for grupo in range(8):
         archivo.write(f"\nGrupo {chr(65 + grupo)}:\n")
         equipos_grupo = equipos_copia[grupo*4:(grupo+1)*4]
-        clasificados_grupo = simular_fase_grupos(equipos_grupo, archivo)
+        clasificados_grupo = simular_fase_grupos(equipos_grupo, archivo, "europa", motor)
         dieciseisavos.extend(clasificados_grupo)
     
     # CORRECCIÓN: dieciseisavos tiene 16 equipos (8 grupos × 2 clasificados)
@@ -488,7 +310,7 @@ def simular_europa_league(equipos: List[str], archivo) -> str:
     for i in range(0, num_equipos_dieciseisavos, 2):
         if i + 1 < num_equipos_dieciseisavos:  # Verificar que existe el siguiente equipo
             equipo1, equipo2 = dieciseisavos[i], dieciseisavos[i+1]
-            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2)
+            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2, "europa", motor)
             octavos.append(ganador)
             archivo.write(f"{resultado}\n")
             archivo.write(f"✅ Pasa: {ganador.upper()}\n\n")
@@ -507,7 +329,7 @@ def simular_europa_league(equipos: List[str], archivo) -> str:
     for i in range(0, num_octavos, 2):
         if i + 1 < num_octavos:
             equipo1, equipo2 = octavos[i], octavos[i+1]
-            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2)
+            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2, "europa", motor)
             cuartos.append(ganador)
             archivo.write(f"{resultado}\n")
             archivo.write(f"✅ Pasa: {ganador.upper()}\n\n")
@@ -525,7 +347,7 @@ def simular_europa_league(equipos: List[str], archivo) -> str:
     for i in range(0, num_cuartos, 2):
         if i + 1 < num_cuartos:
             equipo1, equipo2 = cuartos[i], cuartos[i+1]
-            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2)
+            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2, "europa", motor)
             semis.append(ganador)
             archivo.write(f"{resultado}\n")
             archivo.write(f"✅ Pasa: {ganador.upper()}\n\n")
@@ -542,7 +364,7 @@ def simular_europa_league(equipos: List[str], archivo) -> str:
     for i in range(0, num_semis, 2):
         if i + 1 < num_semis:
             equipo1, equipo2 = semis[i], semis[i+1]
-            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2)
+            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2, "europa", motor)
             finalistas.append(ganador)
             archivo.write(f"{resultado}\n")
             archivo.write(f"✅ FINALISTA: {ganador.upper()}\n\n")
@@ -554,7 +376,7 @@ def simular_europa_league(equipos: List[str], archivo) -> str:
     if len(finalistas) == 2:
         archivo.write(f"👑 FINAL EUROPA LEAGUE\n")
         archivo.write("=" * 40 + "\n")
-        campeon, resultado_final = simular_final_con_jugadores(finalistas[0], finalistas[1])
+        campeon, resultado_final = simular_final_con_jugadores(finalistas[0], finalistas[1], "europa", motor)
         archivo.write(f"{resultado_final}\n")
         archivo.write(f"🏅 CAMPEÓN EUROPA LEAGUE: {campeon.upper()}\n")
     elif len(finalistas) == 1:
@@ -570,7 +392,7 @@ def simular_europa_league(equipos: List[str], archivo) -> str:
     return campeon
 
 
-def simular_conference_league(equipos: List[str], archivo) -> str:
+def simular_conference_league(equipos: List[str], archivo, motor: str = MOTOR_POR_DEFECTO) -> str:
     """Simula la Conference League completa con exactamente 32 equipos"""
     archivo.write(f"\n{'='*80}\n")
     archivo.write("🎯 CONFERENCE LEAGUE 2024/25 (32 equipos)\n")
@@ -578,7 +400,7 @@ def simular_conference_league(equipos: List[str], archivo) -> str:
     
     # Asegurar exactamente 32 equipos
     equipos_copia = equipos[:32].copy()
-    rm.shuffle(equipos_copia)
+    generador("conference", "sorteo").shuffle(equipos_copia)
     
     archivo.write(f"\n📊 EQUIPOS PARTICIPANTES (32):\n")
     archivo.write("-" * 40 + "\n")
@@ -594,7 +416,7 @@ def simular_conference_league(equipos: List[str], archivo) -> str:
     for grupo in range(8):
         archivo.write(f"\nGrupo {chr(65 + grupo)}:\n")
         equipos_grupo = equipos_copia[grupo*4:(grupo+1)*4]
-        clasificados_grupo = simular_fase_grupos(equipos_grupo, archivo)
+        clasificados_grupo = simular_fase_grupos(equipos_grupo, archivo, "conference", motor)
         dieciseisavos.extend(clasificados_grupo)
     
     # Dieciseisavos de final (16 equipos - 8 grupos × 2 clasificados)
@@ -606,7 +428,7 @@ def simular_conference_league(equipos: List[str], archivo) -> str:
     for i in range(0, num_dieciseisavos, 2):
         if i + 1 < num_dieciseisavos:
             equipo1, equipo2 = dieciseisavos[i], dieciseisavos[i+1]
-            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2)
+            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2, "conference", motor)
             octavos.append(ganador)
             archivo.write(f"{resultado}\n")
             archivo.write(f"✅ Pasa: {ganador.upper()}\n\n")
@@ -623,7 +445,7 @@ def simular_conference_league(equipos: List[str], archivo) -> str:
     for i in range(0, num_octavos, 2):
         if i + 1 < num_octavos:
             equipo1, equipo2 = octavos[i], octavos[i+1]
-            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2)
+            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2, "conference", motor)
             cuartos.append(ganador)
             archivo.write(f"{resultado}\n")
             archivo.write(f"✅ Pasa: {ganador.upper()}\n\n")
@@ -640,7 +462,7 @@ def simular_conference_league(equipos: List[str], archivo) -> str:
     for i in range(0, num_cuartos, 2):
         if i + 1 < num_cuartos:
             equipo1, equipo2 = cuartos[i], cuartos[i+1]
-            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2)
+            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2, "conference", motor)
             semis.append(ganador)
             archivo.write(f"{resultado}\n")
             archivo.write(f"✅ Pasa: {ganador.upper()}\n\n")
@@ -657,7 +479,7 @@ def simular_conference_league(equipos: List[str], archivo) -> str:
     for i in range(0, num_semis, 2):
         if i + 1 < num_semis:
             equipo1, equipo2 = semis[i], semis[i+1]
-            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2)
+            ganador, resultado = simular_eliminatoria_con_jugadores(equipo1, equipo2, "conference", motor)
             finalistas.append(ganador)
             archivo.write(f"{resultado}\n")
             archivo.write(f"✅ FINALISTA: {ganador.upper()}\n\n")
@@ -669,7 +491,7 @@ def simular_conference_league(equipos: List[str], archivo) -> str:
     if len(finalistas) == 2:
         archivo.write(f"👑 FINAL CONFERENCE LEAGUE\n")
         archivo.write("=" * 40 + "\n")
-        campeon, resultado_final = simular_final_con_jugadores(finalistas[0], finalistas[1])
+        campeon, resultado_final = simular_final_con_jugadores(finalistas[0], finalistas[1], "conference", motor)
         archivo.write(f"{resultado_final}\n")
         archivo.write(f"🎯 CAMPEÓN CONFERENCE LEAGUE: {campeon.upper()}\n")
     elif len(finalistas) == 1:
@@ -776,9 +598,13 @@ def escribir_tabla_liga_mejorada(archivo, nombre_liga: str, tabla: List[Tuple]):
         archivo.write(f"🏅 Europa League: {tabla[1][0].upper()}, {tabla[2][0].upper()}\n")
         archivo.write(f"🎯 Conference League: {tabla[3][0].upper()}\n")
 
-def main():
+def main(motor: str = MOTOR_POR_DEFECTO, semilla: int = None, motor_copas: str = MOTOR_POR_DEFECTO,
+         ruta_db: str = None, procesos: int = 1):
     print("🏆 SIMULADOR COMPLETO CON JUGADORES Y COMPETICIONES EUROPEAS 🏆")
     print("=" * 70)
+    
+    # Con semilla, cada partido usa un generador derivado de ella y la temporada es reproducible
+    configurar_semilla(semilla)
     print("Inicializando base de datos de jugadores...")
     
     # Reset estadísticas para nueva temporada
@@ -802,10 +628,23 @@ def main():
         # Simular todas las ligas
         print("\n📊 Simulando ligas domésticas...")
         resultados_ligas = {}
+        partidos_por_liga = {}
+        
+        # En paralelo las ligas se simulan todas antes y acá solo se recorren en orden
+        en_paralelo = None
+        if procesos != 1:
+            from ligas_paralelas import simular_ligas
+            en_paralelo = simular_ligas(ligas, motor, procesos or None)
         
         for nombre_liga, equipos_dict in ligas.items():
             print(f"🏟️  {nombre_liga}...")
-            tabla = simular_liga_con_jugadores(nombre_liga, equipos_dict)
+            if en_paralelo is not None:
+                print(en_paralelo[nombre_liga].salida, end="")
+                partidos_por_liga[nombre_liga] = en_paralelo[nombre_liga].partidos
+                tabla = en_paralelo[nombre_liga].tabla
+            else:
+                partidos_por_liga[nombre_liga] = []
+                tabla = simular_liga_con_jugadores(nombre_liga, equipos_dict, motor, partidos_por_liga[nombre_liga])
             resultados_ligas[nombre_liga] = tabla
             escribir_tabla_liga_mejorada(archivo, nombre_liga, tabla)
         
@@ -817,13 +656,13 @@ def main():
         
         # Simular competiciones europeas
         print("\n🏆 Simulando Champions League...")
-        campeon_champions = simular_champions_league(champions, archivo)
+        campeon_champions = simular_champions_league(champions, archivo, motor_copas)
         
         print("🏅 Simulando Europa League...")
-        campeon_europa = simular_europa_league(europa, archivo)
+        campeon_europa = simular_europa_league(europa, archivo, motor_copas)
         
         print("🎯 Simulando Conference League...")
-        campeon_conference = simular_conference_league(conference, archivo)
+        campeon_conference = simular_conference_league(conference, archivo, motor_copas)
         
         # Escribir estadísticas individuales
         print("📊 Generando estadísticas individuales...")
@@ -873,6 +712,13 @@ def main():
     
     print(f"\n✅ Simulación completa guardada en: {nombre_archivo}")
     
+    if ruta_db:
+        from almacen_sqlite import AlmacenSQLite
+        with AlmacenSQLite(ruta_db) as almacen:
+            temporada = almacen.guardar_temporada(base_datos, partidos_por_liga, resultados_ligas, semilla,
+                                                  motor, f"temporada completa ({nombre_archivo})")
+        print(f"💾 Temporada {temporada} guardada en {ruta_db}")
+    
     # Mostrar estadísticas destacadas en consola
     print("\n📊 ESTADÍSTICAS DESTACADAS:")
     
@@ -897,4 +743,16 @@ def main():
     print(f"📁 Revisa el archivo '{nombre_archivo}' para ver todos los detalles.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Simulador de temporada europea con jugadores")
+    parser.add_argument("--motor", choices=motores_disponibles(), default=MOTOR_POR_DEFECTO,
+                        help="Motor de simulación para las ligas domésticas")
+    parser.add_argument("--motor-copas", choices=motores_disponibles(), default=MOTOR_POR_DEFECTO,
+                        help="Motor de simulación para las competiciones europeas")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Semilla de temporada para resultados reproducibles")
+    parser.add_argument("--db", default=None,
+                        help="Guardar también la temporada en esta base SQLite (ver almacen_sqlite.py)")
+    parser.add_argument("--procesos", type=int, default=1,
+                        help="Procesos para las ligas domésticas (0: todos los núcleos; ver ligas_paralelas.py)")
+    args = parser.parse_args()
+    main(args.motor, args.seed, args.motor_copas, args.db, args.procesos)
\ No newline at end of file
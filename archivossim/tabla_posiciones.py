@@ -0,0 +1,218 @@
+"""
+Tabla de posiciones en columnas tipadas.
+
+Puntos, partidos jugados, goles a favor y en contra son arrays('q') indexados
+por la posición del equipo en la lista con que se crea la tabla. Una jornada
+(o una liga entera) se suma de una vez con sumar_partidos, con NumPy si está
+instalado y el lote es grande. El orden (puntos, diferencia de gol, goles a
+favor, de mayor a menor) se resuelve como un lexsort: las tres claves se
+empaquetan en un solo entero por equipo y se ordena una vez por ese entero,
+sin lambdas ni tuplas. A igualdad total queda primero el que está antes en
+la lista de equipos, igual que con el sorted estable de antes.
+
+Con mapear(directorio) las columnas pasan a archivos mapeados en memoria,
+igual que las de TablaEstadisticas (ver columnas_mmap.py).
+
+Medir el costo de sumar y ordenar una liga de 20 equipos:
+    python tabla_posiciones.py
+"""
+from array import array
+from typing import Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+COLUMNAS_TABLA = ("puntos", "jugados", "gf", "gc")
+PUNTOS_VICTORIA = 3
+PUNTOS_EMPATE = 1
+_MINIMO_NUMPY = 256  # partidos por lote a partir de los cuales conviene NumPy
+# Cada clave empaquetada ocupa 24 bits: hasta 8 millones de goles o puntos por equipo
+_BITS_CLAVE = 24
+_DESPLAZAMIENTO_DG = 1 << (_BITS_CLAVE - 1)
+# (puntos local, puntos visitante) según el signo de la diferencia: empate, gana local, gana visitante
+_PUNTOS = ((PUNTOS_EMPATE, PUNTOS_EMPATE), (PUNTOS_VICTORIA, 0), (0, PUNTOS_VICTORIA))
+
+class TablaPosiciones:
+    """Puntos, partidos y goles de cada equipo en arrays, con orden por claves empaquetadas"""
+    __slots__ = ("equipos", "indice", "_mapeadas") + COLUMNAS_TABLA
+
+    def __init__(self, equipos: Sequence[str]):
+        self.equipos = list(equipos)
+        self.indice = {codigo: i for i, codigo in enumerate(self.equipos)}
+        self._mapeadas = None
+        ceros = bytes(8 * len(self.equipos))
+        for nombre in COLUMNAS_TABLA:
+            setattr(self, nombre, array('q', ceros))
+
+    def __len__(self) -> int:
+        return len(self.equipos)
+
+    def mapear(self, directorio: str):
+        """Pasa las columnas a archivos mapeados en directorio (ver columnas_mmap.py), como TablaEstadisticas"""
+        from columnas_mmap import mapear_tabla
+        if self._mapeadas is not None:
+            self.desmapear()
+        self._mapeadas = mapear_tabla(self, directorio, COLUMNAS_TABLA)
+        for nombre, columna in self._mapeadas.items():
+            setattr(self, nombre, columna.valores)
+
+    def desmapear(self):
+        """Vuelve a columnas en memoria (copiando los valores) y cierra los archivos"""
+        if self._mapeadas is None:
+            return
+        for nombre, columna in self._mapeadas.items():
+            setattr(self, nombre, array('q', columna.valores))
+            columna.cerrar()
+        self._mapeadas = None
+
+    def reiniciar(self):
+        """Todo a cero (en el lugar)"""
+        ceros = array('q', bytes(8 * len(self.equipos)))
+        for nombre in COLUMNAS_TABLA:
+            getattr(self, nombre)[:] = ceros
+
+    def copiar(self) -> "TablaPosiciones":
+        copia = TablaPosiciones(self.equipos)
+        for nombre in COLUMNAS_TABLA:
+            getattr(copia, nombre)[:] = getattr(self, nombre)
+        return copia
+
+    def sumar_partido(self, local: int, visitante: int, goles_local: int, goles_visitante: int):
+        """Suma un partido (índices de equipo en la tabla)"""
+        self.jugados[local] += 1
+        self.jugados[visitante] += 1
+        self.gf[local] += goles_local
+        self.gc[local] += goles_visitante
+        self.gf[visitante] += goles_visitante
+        self.gc[visitante] += goles_local
+        if goles_local > goles_visitante:
+            self.puntos[local] += PUNTOS_VICTORIA
+        elif goles_local < goles_visitante:
+            self.puntos[visitante] += PUNTOS_VICTORIA
+        else:
+            self.puntos[local] += PUNTOS_EMPATE
+            self.puntos[visitante] += PUNTOS_EMPATE
+
+    def sumar_partidos(self, locales: Sequence[int], visitantes: Sequence[int],
+                       goles_locales: Sequence[int], goles_visitantes: Sequence[int]):
+        """Suma un lote de partidos (por ejemplo una jornada) de una vez"""
+        if np is not None and len(locales) >= _MINIMO_NUMPY:
+            self._sumar_partidos_numpy(locales, visitantes, goles_locales, goles_visitantes)
+            return
+        # Se acumula en listas y se vuelca una vez: indexar una lista no convierte enteros
+        puntos, jugados, gf, gc = (getattr(self, nombre).tolist() for nombre in COLUMNAS_TABLA)
+        for local, visitante, goles_local, goles_visitante in zip(locales, visitantes, goles_locales,
+                                                                  goles_visitantes):
+            jugados[local] += 1
+            jugados[visitante] += 1
+            gf[local] += goles_local
+            gc[local] += goles_visitante
+            gf[visitante] += goles_visitante
+            gc[visitante] += goles_local
+            puntos_local, puntos_visitante = _PUNTOS[(goles_local > goles_visitante) - (goles_local < goles_visitante)]
+            puntos[local] += puntos_local
+            puntos[visitante] += puntos_visitante
+        for nombre, valores in zip(COLUMNAS_TABLA, (puntos, jugados, gf, gc)):
+            getattr(self, nombre)[:] = array('q', valores)
+
+    def _sumar_partidos_numpy(self, locales, visitantes, goles_locales, goles_visitantes):
+        """Misma suma con np.add.at sobre vistas sin copia de las columnas"""
+        locales = np.asarray(locales, dtype=np.int64)
+        visitantes = np.asarray(visitantes, dtype=np.int64)
+        goles_locales = np.asarray(goles_locales, dtype=np.int64)
+        goles_visitantes = np.asarray(goles_visitantes, dtype=np.int64)
+        puntos, jugados, gf, gc = (np.frombuffer(getattr(self, nombre), dtype=np.int64)
+                                   for nombre in COLUMNAS_TABLA)
+        np.add.at(jugados, locales, 1)
+        np.add.at(jugados, visitantes, 1)
+        np.add.at(gf, locales, goles_locales)
+        np.add.at(gc, locales, goles_visitantes)
+        np.add.at(gf, visitantes, goles_visitantes)
+        np.add.at(gc, visitantes, goles_locales)
+        diferencia = goles_locales - goles_visitantes
+        np.add.at(puntos, locales, np.where(diferencia > 0, PUNTOS_VICTORIA,
+                                            np.where(diferencia == 0, PUNTOS_EMPATE, 0)))
+        np.add.at(puntos, visitantes, np.where(diferencia < 0, PUNTOS_VICTORIA,
+                                               np.where(diferencia == 0, PUNTOS_EMPATE, 0)))
+
+    def sumar_resultados(self, resultados: Sequence[Tuple[str, str, int, int]]):
+        """Suma partidos dados como (local, visitante, goles local, goles visitante) por código"""
+        indice = self.indice
+        self.sumar_partidos([indice[r[0]] for r in resultados], [indice[r[1]] for r in resultados],
+                            [r[2] for r in resultados], [r[3] for r in resultados])
+
+    def claves(self) -> List[int]:
+        """Clave empaquetada de cada equipo: mayor clave = mejor (puntos, diferencia, goles a favor)"""
+        return [((puntos << _BITS_CLAVE) + gf - gc + _DESPLAZAMIENTO_DG << _BITS_CLAVE) + gf
+                for puntos, gf, gc in zip(self.puntos, self.gf, self.gc)]
+
+    def orden(self) -> List[int]:
+        """Índices de equipo del primero al último"""
+        claves = self.claves()
+        # sorted es estable también con reverse: a igualdad queda el de menor índice
+        return sorted(range(len(claves)), key=claves.__getitem__, reverse=True)
+
+    def posiciones(self) -> array:
+        """posiciones[i] = puesto (desde 1) del equipo i"""
+        puestos = array('l', [0]) * len(self.equipos)
+        for puesto, i in enumerate(self.orden(), 1):
+            puestos[i] = puesto
+        return puestos
+
+    def fila(self, i: int) -> Dict[str, int]:
+        """Fila del equipo i en el formato de siempre"""
+        gf, gc = self.gf[i], self.gc[i]
+        return {'puntos': self.puntos[i], 'gf': gf, 'gc': gc, 'partidos': self.jugados[i], 'gd': gf - gc}
+
+    def ordenada(self) -> List[Tuple[str, Dict]]:
+        """[(código, fila), ...] del primero al último, como simular_liga_con_jugadores"""
+        return [(self.equipos[i], self.fila(i)) for i in self.orden()]
+
+if __name__ == "__main__":
+    import random as rm
+    import timeit
+
+    from calendario import generar_calendario
+
+    equipos = [f"e{i}" for i in range(20)]
+    cruces = [cruce for jornada in generar_calendario(equipos) for cruce in jornada]
+    resultados = [(l, v, rm.randint(0, 3), rm.randint(0, 3)) for l, v in cruces]
+
+    def con_diccionarios():
+        tabla = {codigo: {'puntos': 0, 'gf': 0, 'gc': 0, 'partidos': 0, 'gd': 0} for codigo in equipos}
+        for local, visitante, gol1, gol2 in resultados:
+            tabla[local]['gf'] += gol1
+            tabla[local]['gc'] += gol2
+            tabla[local]['partidos'] += 1
+            tabla[visitante]['gf'] += gol2
+            tabla[visitante]['gc'] += gol1
+            tabla[visitante]['partidos'] += 1
+            if gol1 > gol2:
+                tabla[local]['puntos'] += 3
+            elif gol1 < gol2:
+                tabla[visitante]['puntos'] += 3
+            else:
+                tabla[local]['puntos'] += 1
+                tabla[visitante]['puntos'] += 1
+        for fila in tabla.values():
+            fila['gd'] = fila['gf'] - fila['gc']
+        return sorted(tabla.items(), key=lambda x: (x[1]['puntos'], x[1]['gd'], x[1]['gf']), reverse=True)
+
+    tabla = TablaPosiciones(equipos)
+    indices = ([tabla.indice[r[0]] for r in resultados], [tabla.indice[r[1]] for r in resultados],
+               [r[2] for r in resultados], [r[3] for r in resultados])
+
+    def con_tabla():
+        tabla.reiniciar()
+        tabla.sumar_partidos(*indices)
+        return tabla.orden()
+
+    assert [codigo for codigo, _ in con_diccionarios()] == [equipos[i] for i in con_tabla()]
+    numero = 2000
+    for nombre, funcion in (("Diccionarios + sorted", con_diccionarios), ("TablaPosiciones", con_tabla)):
+        t = timeit.timeit(funcion, number=numero) / numero * 1e6
+        print(f"{nombre:<22} {t:8.1f} µs por liga de 20 equipos (380 partidos + orden)")
+    t = timeit.timeit(tabla.orden, number=numero * 10) / (numero * 10) * 1e6
+    print(f"{'Solo orden':<22} {t:8.1f} µs")
@@ -0,0 +1,242 @@
+"""
+Resto de una temporada a partir de los resultados ya jugados.
+
+leer_resultados carga los partidos jugados de un CSV o un JSON (columnas o
+claves de CAMPOS_RESULTADO). TemporadaParcial arma con ellos, una sola vez,
+la tabla de partida, las estadísticas de partida de los jugadores de la liga
+(apariciones de toda la plantilla y, si vienen, goleadores, asistentes y
+tarjetas por nombre, o por "código:nombre" si los dos equipos tienen un
+jugador con ese nombre) y los partidos del calendario que faltan. simular()
+parte siempre de ese estado: vuelve a escribir las filas de los jugadores de
+la liga, copia la tabla de partida y simula solo lo pendiente en un lote del
+motor, sin volver a leer ni a construir nada. Es el bucle del pronóstico
+semanal:
+
+    parcial = TemporadaParcial.desde_archivo("Premier League", "jugados.csv")
+    pronostico = parcial.pronosticar(simulaciones=1000)
+
+Sin semilla propia cada partido usa semillas.generador(liga, "liga", local,
+visitante), igual que simular_liga_con_jugadores: con --seed, jugar la
+primera vuelta y simular el resto da la misma tabla que la liga entera.
+
+Pronosticar una liga a mitad de temporada (sin archivo, juega la primera
+vuelta y la guarda en jugados.csv para usarla de ejemplo):
+    python temporada_parcial.py "Liga Uruguaya" --simulaciones 500
+"""
+import csv
+import json
+import random as rm
+from array import array
+from dataclasses import astuple, dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from base_datos import Jugador, base_datos
+from calendario import generar_calendario
+from motores import MOTOR_POR_DEFECTO, obtener_motor
+from pronostico import PronosticoTabla
+from semillas import derivar_semilla, generador
+from tabla_posiciones import TablaPosiciones
+
+# Lista de nombres de cada partido -> columna que suma (uno por nombre: un gol, una tarjeta...)
+EVENTOS = {"goleadores": "goles", "asistentes": "asistencias",
+           "amarillas": "tarjetas_amarillas", "rojas": "tarjetas_rojas"}
+CAMPOS_RESULTADO = ("local", "visitante", "goles_local", "goles_visitante") + tuple(EVENTOS)
+SEPARADOR_NOMBRES = ";"  # en el CSV; en el JSON son listas
+SEPARADOR_EQUIPO = ":"   # "código:nombre" busca el nombre solo en ese equipo del partido
+
+@dataclass(frozen=True)
+class ResultadoJugado:
+    """Un partido ya jugado; las listas de nombres son opcionales"""
+    local: str
+    visitante: str
+    goles_local: int
+    goles_visitante: int
+    goleadores: Tuple[str, ...] = ()
+    asistentes: Tuple[str, ...] = ()
+    amarillas: Tuple[str, ...] = ()
+    rojas: Tuple[str, ...] = ()
+
+def _resultado_desde_campos(campos: Dict) -> ResultadoJugado:
+    nombres = {}
+    for campo in EVENTOS:
+        valor = campos.get(campo) or ()
+        if isinstance(valor, str):
+            valor = [nombre.strip() for nombre in valor.split(SEPARADOR_NOMBRES) if nombre.strip()]
+        nombres[campo] = tuple(valor)
+    return ResultadoJugado(campos["local"], campos["visitante"], int(campos["goles_local"]),
+                           int(campos["goles_visitante"]), **nombres)
+
+def leer_resultados(ruta: str) -> List[ResultadoJugado]:
+    """Partidos jugados de un .json (lista de objetos) o de un CSV con encabezado"""
+    with open(ruta, encoding="utf-8", newline="") as f:
+        filas = json.load(f) if ruta.lower().endswith(".json") else list(csv.DictReader(f))
+    return [_resultado_desde_campos(fila) for fila in filas]
+
+def escribir_resultados(resultados: Sequence[ResultadoJugado], ruta: str):
+    """Guarda los partidos en el formato de leer_resultados (JSON o CSV según la extensión)"""
+    filas = [dict(zip(CAMPOS_RESULTADO, astuple(resultado))) for resultado in resultados]
+    with open(ruta, "w", encoding="utf-8", newline="") as f:
+        if ruta.lower().endswith(".json"):
+            json.dump(filas, f, ensure_ascii=False, indent=1)
+            return
+        escritor = csv.DictWriter(f, CAMPOS_RESULTADO, lineterminator="\n")
+        escritor.writeheader()
+        for fila in filas:
+            escritor.writerow({campo: SEPARADOR_NOMBRES.join(valor) if campo in EVENTOS else valor
+                               for campo, valor in fila.items()})
+
+class TemporadaParcial:
+    """Estado de partida de una liga a mitad de temporada, para simular el resto muchas veces"""
+
+    def __init__(self, nombre_liga: str, jugados: Sequence[ResultadoJugado], equipos: Sequence[str] = None):
+        """
+        Arma la tabla y las estadísticas de partida (escribiendo lo jugado en
+        base_datos.estadisticas) y la lista de partidos pendientes. Lanza
+        ValueError si un partido no es de la liga, se repite o nombra a un
+        jugador que no está en ninguno de los dos equipos o que no se puede
+        distinguir (el nombre está en los dos: usar "código:nombre").
+        """
+        self.nombre_liga = nombre_liga
+        self.equipos = list(equipos) if equipos is not None else base_datos.obtener_equipos_liga(nombre_liga)
+        self.jugados = list(jugados)
+        self.tabla_inicial = TablaPosiciones(self.equipos)
+        indice = self.tabla_inicial.indice
+
+        # Pendiente es lo que el calendario de ida y vuelta tiene y no se jugó (en el orden del calendario)
+        sin_jugar = {cruce for jornada in generar_calendario(self.equipos) for cruce in jornada}
+        for resultado in self.jugados:
+            cruce = (resultado.local, resultado.visitante)
+            if cruce not in sin_jugar:
+                raise ValueError(f"{cruce[0]}-{cruce[1]} no es un partido de {nombre_liga} o está repetido")
+            sin_jugar.discard(cruce)
+        self.pendientes = [cruce for jornada in generar_calendario(self.equipos) for cruce in jornada
+                           if cruce in sin_jugar]
+        self.tabla_inicial.sumar_resultados([astuple(resultado)[:4] for resultado in self.jugados])
+
+        # Lo que simular() repite sin reconstruir
+        self._locales = [indice[local] for local, _ in self.pendientes]
+        self._visitantes = [indice[visitante] for _, visitante in self.pendientes]
+        self._fixtures = list(zip(self._locales, self._visitantes))
+        self._claves = [(nombre_liga, "liga", local, visitante) for local, visitante in self.pendientes]
+
+        estadisticas = base_datos.estadisticas
+        self.filas = array('l', [jugador.id for codigo in self.equipos
+                                 for jugador in base_datos.equipos[codigo].jugadores])
+        antes = estadisticas.valores_filas(self.filas)
+        try:
+            for resultado in self.jugados:
+                self._registrar_jugado(resultado)
+        except ValueError:
+            estadisticas.escribir_filas(self.filas, antes)
+            raise
+        self.estadisticas_jugadas = estadisticas.delta_desde(self.filas, antes)
+        self._iniciales = estadisticas.valores_filas(self.filas)
+
+    @classmethod
+    def desde_archivo(cls, nombre_liga: str, ruta: str, equipos: Sequence[str] = None) -> "TemporadaParcial":
+        return cls(nombre_liga, leer_resultados(ruta), equipos)
+
+    def _registrar_jugado(self, resultado: ResultadoJugado):
+        """Apariciones de las dos plantillas y un punto por cada nombre de las listas de eventos"""
+        local, visitante = base_datos.equipos[resultado.local], base_datos.equipos[resultado.visitante]
+        local.registrar_partido()
+        visitante.registrar_partido()
+        for campo, columna in EVENTOS.items():
+            nombres = getattr(resultado, campo)
+            filas = [self._buscar_jugador(nombre, resultado).id for nombre in nombres]
+            base_datos.estadisticas.sumar(columna, filas, [1] * len(filas))
+
+    @staticmethod
+    def _buscar_jugador(nombre: str, resultado: ResultadoJugado) -> Jugador:
+        """Jugador del partido con ese nombre (índice de base_datos); con "código:" solo en ese equipo"""
+        codigo, _, nombre = nombre.rpartition(SEPARADOR_EQUIPO)
+        equipos = (resultado.local, resultado.visitante)
+        if codigo:
+            if codigo not in equipos:
+                raise ValueError(f"{codigo} no juega {resultado.local}-{resultado.visitante}")
+            equipos = (codigo,)
+        encontrados = [jugador for equipo in equipos for jugador in base_datos.buscar_jugadores(nombre, equipo)]
+        if not encontrados:
+            raise ValueError(f"{nombre} no juega en {' ni en '.join(equipos)}")
+        if len(encontrados) > 1:
+            raise ValueError(f"Hay {len(encontrados)} jugadores llamados {nombre} en {'-'.join(equipos)}: "
+                             f"indicar el equipo como código{SEPARADOR_EQUIPO}nombre")
+        return encontrados[0]
+
+    def simular(self, motor: str = MOTOR_POR_DEFECTO, semilla: int = None) -> TablaPosiciones:
+        """
+        Simula los partidos pendientes desde el estado de partida y devuelve la
+        tabla final (nueva en cada llamada). Con semilla cada partido usa un
+        generador derivado de ella, una por corrida de Monte Carlo. Las filas
+        de los jugadores de la liga quedan con lo jugado más lo simulado hasta
+        la próxima llamada.
+        """
+        base_datos.estadisticas.escribir_filas(self.filas, self._iniciales)
+        tabla = self.tabla_inicial.copiar()
+        if semilla is None:
+            generadores = [generador(*clave) for clave in self._claves]
+        else:
+            generadores = [rm.Random(derivar_semilla(semilla, *clave)) for clave in self._claves]
+        resultados = obtener_motor(motor).simular_fixtures(self.equipos, self._fixtures, eventos=False,
+                                                           generadores=generadores)
+        tabla.sumar_partidos(self._locales, self._visitantes, [resultado[0] for resultado in resultados],
+                             [resultado[1] for resultado in resultados])
+        return tabla
+
+    def pronosticar(self, simulaciones: int = 1000, motor: str = MOTOR_POR_DEFECTO,
+                    semilla: int = 0) -> PronosticoTabla:
+        """Probabilidad de cada puesto final simulando el resto simulaciones veces"""
+        tablas = (self.simular(motor, derivar_semilla(semilla, "pronostico", k)) for k in range(simulaciones))
+        return PronosticoTabla.desde_tablas(self.equipos, tablas)
+
+if __name__ == "__main__":
+    import argparse
+    import contextlib
+    import io
+    import time
+
+    from semillas import configurar_semilla
+    from simuladorcompleto import simular_liga_con_jugadores
+
+    parser = argparse.ArgumentParser(description="Pronóstico del resto de una liga a mitad de temporada")
+    parser.add_argument("liga", nargs="?", default="Liga Uruguaya")
+    parser.add_argument("--jugados", default=None,
+                        help="CSV o JSON con los partidos jugados (default: jugar la primera vuelta)")
+    parser.add_argument("--simulaciones", type=int, default=500, help="Corridas del resto (default: 500)")
+    parser.add_argument("--motor", default="lotes", help="Motor (default: lotes)")
+    args = parser.parse_args()
+
+    equipos = base_datos.obtener_equipos_liga(args.liga)
+    if not equipos:
+        raise SystemExit(f"Liga desconocida: {args.liga}")
+    base_datos.reset_estadisticas_temporada()
+    inicial = base_datos.instantanea()
+    configurar_semilla(2025)
+    completa = None
+    if args.jugados is None:
+        # Primera vuelta con su semilla por partido, guardada como ejemplo de archivo
+        partidos = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            completa = simular_liga_con_jugadores(args.liga, dict.fromkeys(equipos, 0), args.motor, partidos)
+        base_datos.restaurar(inicial)
+        ida = {cruce for jornada in generar_calendario(equipos)[:len(equipos) - 1] for cruce in jornada}
+        args.jugados = "jugados.csv"
+        escribir_resultados([ResultadoJugado(*partido) for partido in partidos if partido[:2] in ida], args.jugados)
+
+    inicio = time.perf_counter()
+    parcial = TemporadaParcial.desde_archivo(args.liga, args.jugados, equipos)
+    print(f"{args.liga}: {len(parcial.jugados)} partidos jugados ({args.jugados}), {len(parcial.pendientes)} "
+          f"pendientes; estado armado en {(time.perf_counter() - inicio) * 1000:.1f} ms")
+    if completa is not None:
+        iguales = parcial.simular(args.motor).ordenada() == completa
+        print(f"Resto con la semilla de temporada = liga entera: {'sí' if iguales else 'NO'}")
+
+    inicio = time.perf_counter()
+    pronostico = parcial.pronosticar(args.simulaciones, args.motor)
+    duracion = time.perf_counter() - inicio
+    print(f"{args.simulaciones} corridas en {duracion:.2f} s ({duracion / args.simulaciones * 1000:.2f} ms cada una)\n")
+    print(f"{'Equipo':<12} {'Pts hoy':>7} {'Pts esp.':>8} {'Campeón':>8}")
+    for i in sorted(range(len(equipos)), key=lambda i: pronostico.puntos_esperados[i], reverse=True):
+        print(f"{equipos[i].upper():<12} {parcial.tabla_inicial.puntos[i]:>7} "
+              f"{pronostico.puntos_esperados[i]:>8.1f} {pronostico.posiciones[i][0]:>8.1%}")
+    base_datos.restaurar(inicial)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Los módulos del simulador se importan por nombre desde archivossim/, como al correr los scripts
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,52 @@
+import pytest
+
+from base_datos import BaseDatos
+
+@pytest.fixture
+def base():
+    """Mundo propio (no la base global) con goles distintos por jugador"""
+    base = BaseDatos()
+    for jugador in base.jugadores_por_id:
+        jugador.goles = jugador.id % 17
+    return base
+
+def _estado(base: BaseDatos):
+    """Goles por clave de jugador, plantillas por código y ligas, para comparar dos mundos"""
+    return ({clave: jugador.goles for clave, jugador in base.jugadores.items()},
+            {codigo: [jugador.nombre for jugador in equipo.jugadores] for codigo, equipo in base.equipos.items()},
+            {liga: base.obtener_equipos_liga(liga) for liga in base.registro_ligas.ligas()},
+            {**base.campeones, 'ligas': dict(base.campeones['ligas'])})
+
+def _transferir_y_mover(base: BaseDatos):
+    courtois = base.buscar_jugadores("Courtois", "rmd")[0]
+    base.transferir_jugador(courtois, "bar")
+    base.mover_equipo("sev", "Premier League")
+    base.registrar_campeon("La Liga", "bar")
+    courtois.goles += 5
+
+def test_restaurar_tras_transferencia(base):
+    inicial = base.instantanea()
+    antes = _estado(base)
+    _transferir_y_mover(base)
+    assert _estado(base) != antes
+    base.restaurar(inicial)
+    assert _estado(base) == antes
+    assert base.equipos["sev"].liga == "La Liga"
+    assert all(jugador.equipo == "rmd" for jugador in base.equipos["rmd"].jugadores)
+
+def test_bifurcar_tras_transferencia(base):
+    _transferir_y_mover(base)
+    copia = base.bifurcar()
+    assert _estado(copia) == _estado(base)
+    assert copia.buscar_jugadores("Courtois")[0].goles == base.buscar_jugadores("Courtois")[0].goles
+    assert [jugador.id for jugador in copia.equipos["bar"].jugadores] == \
+        [jugador.id for jugador in base.equipos["bar"].jugadores]
+
+def test_bifurcar_es_independiente(base):
+    copia = base.bifurcar()
+    antes = _estado(base)
+    _transferir_y_mover(copia)
+    copia.jugadores_por_id[0].nivel += 1
+    assert _estado(base) == antes
+    assert base.jugadores_por_id[0].nivel == copia.jugadores_por_id[0].nivel - 1
+    assert copia.jugadores_por_id[0].goles == base.jugadores_por_id[0].goles
@@ -0,0 +1,26 @@
+from collections import Counter
+
+import pytest
+
+from calendario import generar_calendario
+
+@pytest.mark.parametrize("n", range(2, 21))
+def test_calendario_todos_contra_todos(n):
+    equipos = [f"e{i}" for i in range(n)]
+    calendario = generar_calendario(equipos)
+    rondas = n - 1 if n % 2 == 0 else n
+    assert len(calendario) == 2 * rondas
+
+    for vuelta in (calendario[:rondas], calendario[rondas:]):
+        # Cada par se enfrenta exactamente una vez por vuelta
+        pares = Counter(frozenset(cruce) for jornada in vuelta for cruce in jornada)
+        assert len(pares) == n * (n - 1) // 2
+        assert set(pares.values()) == {1}
+    # Y la segunda vuelta invierte la localía de la primera
+    assert Counter(cruce for jornada in calendario for cruce in jornada) == \
+        Counter((a, b) for a in equipos for b in equipos if a != b)
+
+    for jornada in calendario:
+        jugando = [equipo for cruce in jornada for equipo in cruce]
+        assert len(jugando) == len(set(jugando))  # nadie juega dos veces en la jornada
+        assert len(jornada) == n // 2
@@ -0,0 +1,27 @@
+from columnas_mmap import HistorialEstadisticas, abrir_columnas
+from tabla_posiciones import COLUMNAS_TABLA, TablaPosiciones
+
+def test_columnas_de_equipos_mapeadas(tmp_path):
+    tabla = TablaPosiciones(["a", "b", "c"])
+    tabla.sumar_resultados([("a", "b", 2, 1)])
+    tabla.mapear(str(tmp_path / "vivas"))
+    tabla.sumar_resultados([("c", "a", 1, 1)])
+    assert tabla.puntos.tolist() == [4, 0, 1]
+
+    historial = HistorialEstadisticas(str(tmp_path), COLUMNAS_TABLA, "equipos")
+    historial.agregar_temporada(tabla)
+    tabla.reiniciar()
+    tabla.sumar_resultados([("b", "c", 3, 0)])
+    historial.agregar_temporada(tabla)
+    tabla.desmapear()
+
+    columnas = abrir_columnas(str(tmp_path / "vivas"), columnas=COLUMNAS_TABLA)
+    assert columnas["gf"].valores.tolist() == [0, 3, 0]
+    for columna in columnas.values():
+        columna.cerrar()
+    assert historial.temporadas() == 2
+    assert historial.totales("puntos").tolist() == [4, 3, 1]
+    with historial.abrir("jugados") as jugados:
+        serie = jugados.columna(2)
+        assert serie.tolist() == [1, 1]
+        serie.release()
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from calendario import generar_calendario
+from definiciones_matematicas import ASEGURADA, PERDIDA, SeguimientoDefiniciones
+
+EQUIPOS = ["a", "b", "c", "d", "e", "f"]
+
+def test_actualizar_invalido_no_toca_nada():
+    seguimiento = SeguimientoDefiniciones(EQUIPOS, {"título": 1})
+    calendario = generar_calendario(EQUIPOS)
+    primera = [(local, visitante, 1, 0) for local, visitante in calendario[0]]
+    restantes = list(seguimiento.restantes)
+    with pytest.raises(ValueError):
+        seguimiento.actualizar(1, primera + primera[:1])  # el mismo partido dos veces
+    assert seguimiento.restantes == restantes
+    assert seguimiento.tabla.puntos.tolist() == [0] * len(EQUIPOS)
+
+    seguimiento.actualizar(1, primera)
+    segunda = [(local, visitante, 0, 0) for local, visitante in calendario[1]]
+    restantes = list(seguimiento.restantes)
+    puntos = seguimiento.tabla.puntos.tolist()
+    with pytest.raises(ValueError):
+        seguimiento.actualizar(2, segunda + primera[1:2])  # ya jugado en la jornada 1
+    assert seguimiento.restantes == restantes
+    assert seguimiento.tabla.puntos.tolist() == puntos
+    seguimiento.actualizar(2, segunda)
+    assert seguimiento.restantes == [len(EQUIPOS) * 2 - 4] * len(EQUIPOS)
+
+def _posibles_puntos(puntos, pendientes):
+    """Puntos finales de cada equipo en todas las combinaciones de resultados de los partidos pendientes"""
+    finales = [list(puntos)]
+    for i, j in pendientes:
+        siguientes = []
+        for p in finales:
+            for suma_i, suma_j in ((3, 0), (1, 1), (0, 3)):
+                q = list(p)
+                q[i] += suma_i
+                q[j] += suma_j
+                siguientes.append(q)
+        finales = siguientes
+    return finales
+
+@pytest.mark.parametrize("semilla", range(6))
+def test_definiciones_contra_fuerza_bruta(semilla):
+    rng = random.Random(semilla)
+    equipos = EQUIPOS[:5]
+    zonas = {"título": 1, "copas": 2, "permanencia": 3}
+    calendario = generar_calendario(equipos)
+    indice = {codigo: i for i, codigo in enumerate(equipos)}
+    seguimiento = SeguimientoDefiniciones(equipos, zonas)
+    pendientes = [(indice[local], indice[visitante]) for jornada in calendario for local, visitante in jornada]
+    for numero, jornada in enumerate(calendario, 1):
+        # Resultados desparejos para que se definan cosas antes del final
+        partidos = [(local, visitante, rng.choice((0, 0, 1, 3)), rng.choice((0, 1))) for local, visitante in jornada]
+        seguimiento.actualizar(numero, partidos)
+        pendientes = pendientes[len(jornada):]
+        if len(pendientes) > 8:
+            continue
+        finales = _posibles_puntos(seguimiento.tabla.puntos.tolist(), pendientes)
+        for zona, k in zonas.items():
+            for i, equipo in enumerate(equipos):
+                estado = seguimiento.estado(equipo, zona)
+                # Asegurada: aun perdiendo los desempates, menos de k equipos llegan a sus puntos
+                siempre_adentro = all(sum(p[j] >= p[i] for j in range(len(p)) if j != i) < k for p in finales)
+                # Perdida: aun ganando los desempates, al menos k equipos lo superan
+                siempre_afuera = all(sum(p[j] > p[i] for j in range(len(p))) >= k for p in finales)
+                if estado == ASEGURADA:
+                    assert siempre_adentro, (numero, zona, equipo)
+                elif estado == PERDIDA:
+                    assert siempre_afuera, (numero, zona, equipo)
+                if not pendientes:
+                    assert estado == (ASEGURADA if siempre_adentro else PERDIDA if siempre_afuera else None)
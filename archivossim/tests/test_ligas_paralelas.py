@@ -0,0 +1,27 @@
+import pytest
+
+from base_datos import base_datos
+from estadisticas import COLUMNAS
+from ligas_paralelas import puede_paralelizar, simular_ligas
+from semillas import configurar_semilla
+
+@pytest.mark.skipif(not puede_paralelizar(), reason="sin fork las ligas se simulan en serie")
+@pytest.mark.parametrize("motor", ["referencia", "lotes"])
+def test_paralelo_igual_a_serie(motor):
+    ligas = {liga: equipos for liga, equipos in base_datos.obtener_ligas().items()
+             if liga in ("Liga Uruguaya", "Premier League", "Eredivisie")}
+    inicial = base_datos.instantanea()
+    configurar_semilla(42)
+    try:
+        corridas = []
+        for procesos in (1, 3):
+            base_datos.restaurar(inicial)
+            resultados = simular_ligas(ligas, motor, procesos)
+            corridas.append(({liga: (r.tabla, r.partidos) for liga, r in resultados.items()},
+                             {nombre: base_datos.estadisticas.columna(nombre).tolist() for nombre in COLUMNAS},
+                             dict(base_datos.campeones['ligas'])))
+    finally:
+        configurar_semilla(None)
+        base_datos.restaurar(inicial)
+    assert corridas[0] == corridas[1]
+    assert list(corridas[0][2]) == list(ligas)
@@ -0,0 +1,49 @@
+import random as rm
+from collections import Counter
+
+import pytest
+
+from base_datos import base_datos
+from motores import obtener_motor
+from semillas import derivar_semilla
+
+EQUIPOS = base_datos.obtener_equipos_liga("Premier League")
+# Todos los cruces de la liga, ocho veces: unos 3000 partidos (error estándar del promedio de goles ~0.015)
+FIXTURES = [(i, j) for i in range(len(EQUIPOS)) for j in range(len(EQUIPOS)) if i != j] * 8
+
+@pytest.fixture(scope="module")
+def distribuciones():
+    """Por motor: frecuencia de 0, 1, 2 y 3+ goles en el partido, goles por partido y victorias del local"""
+    inicial = base_datos.instantanea()
+    resultado = {}
+    for nombre in ("referencia", "lotes", "saltos", "tabla"):
+        base_datos.restaurar(inicial)
+        generadores = [rm.Random(derivar_semilla(7, "test", k)) for k in range(len(FIXTURES))]
+        marcadores = obtener_motor(nombre).simular_fixtures(EQUIPOS, FIXTURES, generadores=generadores)
+        totales = Counter(min(gol1 + gol2, 3) for gol1, gol2, _ in marcadores)
+        resultado[nombre] = ([totales[goles] / len(FIXTURES) for goles in range(4)],
+                             sum(gol1 + gol2 for gol1, gol2, _ in marcadores) / len(FIXTURES),
+                             sum(gol1 > gol2 for gol1, gol2, _ in marcadores) / len(FIXTURES))
+    base_datos.restaurar(inicial)
+    return resultado
+
+@pytest.mark.parametrize("nombre", ["lotes", "saltos", "tabla"])
+def test_motor_coincide_con_referencia(distribuciones, nombre):
+    frecuencias, goles, locales = distribuciones[nombre]
+    frecuencias_ref, goles_ref, locales_ref = distribuciones["referencia"]
+    assert goles == pytest.approx(goles_ref, abs=0.06)
+    assert locales == pytest.approx(locales_ref, abs=0.03)
+    for frecuencia, frecuencia_ref in zip(frecuencias, frecuencias_ref):
+        assert frecuencia == pytest.approx(frecuencia_ref, abs=0.03)
+
+@pytest.mark.parametrize("nombre", ["referencia", "lotes", "saltos", "tabla"])
+def test_motor_determinista_con_semilla(nombre):
+    inicial = base_datos.instantanea()
+    corridas = []
+    for _ in range(2):
+        base_datos.restaurar(inicial)
+        generadores = [rm.Random(derivar_semilla(3, "test", k)) for k in range(len(FIXTURES[:200]))]
+        corridas.append([resultado[:2] for resultado in
+                         obtener_motor(nombre).simular_fixtures(EQUIPOS, FIXTURES[:200], generadores=generadores)])
+    base_datos.restaurar(inicial)
+    assert corridas[0] == corridas[1]
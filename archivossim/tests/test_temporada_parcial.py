@@ -0,0 +1,26 @@
+import pytest
+
+from base_datos import base_datos
+from temporada_parcial import ResultadoJugado, TemporadaParcial
+
+@pytest.fixture
+def mundo():
+    inicial = base_datos.instantanea()
+    yield base_datos
+    base_datos.restaurar(inicial)
+
+def test_nombre_repetido_en_los_dos_equipos(mundo):
+    # Arsenal y West Ham tienen cada uno un Rice
+    rice_ars, = mundo.buscar_jugadores("Rice", "ars")
+    rice_wes, = mundo.buscar_jugadores("Rice", "wes")
+    with pytest.raises(ValueError):
+        TemporadaParcial("Premier League", [ResultadoJugado("ars", "wes", 0, 1, goleadores=("Rice",))])
+    assert rice_ars.goles == rice_wes.goles == 0
+
+    TemporadaParcial("Premier League", [ResultadoJugado("ars", "wes", 0, 1, goleadores=("wes:Rice",))])
+    assert (rice_ars.goles, rice_wes.goles) == (0, 1)
+
+def test_jugador_de_otro_equipo(mundo):
+    for nombre in ("Courtois", "mu:Rice", "ars:Nadie"):
+        with pytest.raises(ValueError):
+            TemporadaParcial("Premier League", [ResultadoJugado("ars", "wes", 1, 0, goleadores=(nombre,))])